@@ -248,6 +248,14 @@ def dofunction(link, linelink, shortname, name, astfcn):
         with open(toctree[-1], "w") as outfile:
             outfile.write(out)
 
+# public names that are defined in private modules
+exported = {
+    ("awkward._cpu_kernels", "set_num_threads"): "ak",
+    ("awkward._cpu_kernels", "get_num_threads"): "ak",
+    ("awkward._lazyexpr", "lazy_expr"): "ak",
+    ("awkward._typedbuilder", "TypedArrayBuilder"): "ak",
+}
+
 done_extra = False
 for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
                        key=lambda x: x.replace("/__init__.py",    "!")
@@ -350,9 +358,11 @@ for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
         else:
             lineline = ""
         if isinstance(toplevel, ast.ClassDef):
-            doclass(link, linelink, shortname, toplevel.name, toplevel)
+            name = exported.get((modulename, toplevel.name), shortname)
+            doclass(link, linelink, name, toplevel.name, toplevel)
         if isinstance(toplevel, ast.FunctionDef):
-            dofunction(link, linelink, shortname, toplevel.name, toplevel)
+            name = exported.get((modulename, toplevel.name), shortname)
+            dofunction(link, linelink, name, toplevel.name, toplevel)
 
 outfile = io.StringIO()
 outfile.write(".. toctree::\n    :hidden:\n\n")
@@ -203,6 +203,26 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const = 0;
+
+    /// @brief Apply the reducer algorithm to contiguous segments of an
+    /// array, skipping the construction of a `parents` index.
+    ///
+    /// @param dtype The type of the values in `data`.
+    /// @param data The array to reduce.
+    /// @param offsets A monotonically increasing integer array of
+    /// `outlength + 1` positions in `data`; group `i` is the range
+    /// `offsets[i]` to `offsets[i + 1]`.
+    /// @param outlength The length of the output array (equal to the number
+    /// of groups).
+    ///
+    /// Returns `nullptr` if this reducer has no segmented implementation
+    /// for `dtype`, in which case the caller must fall back to the
+    /// `parents`-based methods.
+    virtual const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const;
   };
 
   /// @class ReducerCount
@@ -294,6 +314,12 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const override;
+
+    const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const override;
   };
 
   /// @class ReducerCountNonzero
@@ -477,6 +503,12 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const override;
+
+    const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const override;
   };
 
   /// @class ReducerProd
@@ -569,6 +601,12 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const override;
+
+    const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const override;
   };
 
   /// @class ReducerAny
@@ -850,6 +888,12 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const override;
+
+    const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const override;
   private:
     double initial_f64_;
     uint64_t initial_u64_;
@@ -952,6 +996,12 @@ namespace awkward {
       apply_complex128(const std::complex<double>* data,
                        const Index64& parents,
                        int64_t outlength) const override;
+
+    const std::shared_ptr<void>
+      apply_offsets(util::dtype dtype,
+                    const void* data,
+                    const Index64& offsets,
+                    int64_t outlength) const override;
   private:
     double initial_f64_;
     uint64_t initial_u64_;
@@ -465,6 +465,20 @@ namespace awkward {
                   bool mask,
                   bool keepdims) const override;
 
+    /// @brief Reduces the contiguous segments `offsets[i]` to
+    /// `offsets[i + 1]` of this array directly, without a `parents` index.
+    ///
+    /// This is the innermost step of a
+    /// {@link Content#reduce_next Content::reduce_next} on a list of
+    /// numbers. It returns `nullptr` if the array is not one-dimensional and
+    /// contiguous or if the `reducer` has no segmented implementation for
+    /// this dtype, so that the caller can fall back to `reduce_next`.
+    const ContentPtr
+      reduce_segments(const Reducer& reducer,
+                      const Index64& offsets,
+                      bool mask,
+                      bool keepdims) const;
+
     const ContentPtr
       sort_next(int64_t negaxis,
                 const Index64& starts,
@@ -6,6 +6,7 @@
 #include <string>
 #include <memory>
 #include <vector>
+#include <functional>
 
 #include "awkward/common.h"
 #include "awkward/Slice.h"
@@ -155,9 +156,25 @@ namespace awkward {
     /// @brief Ensures that the array is generated and returns it.
     ///
     /// This method *does not* return `nullptr`.
+    ///
+    /// If another thread is already generating the array for the same
+    /// #cache and #cache_key, this thread waits for that generation
+    /// (through the function passed to #set_wait_function) and returns
+    /// its result, rather than calling the #generator a second time.
     const ContentPtr
       array() const;
 
+    /// @brief Sets the function that #array uses to wait for another
+    /// thread's generation of the same array.
+    ///
+    /// The function is called with the blocking wait as its argument and
+    /// must call it. The default calls it directly; the Python bindings
+    /// replace it with one that releases the GIL while waiting, so that
+    /// the generating thread can run a Python generator.
+    static void
+      set_wait_function(
+        const std::function<void(const std::function<void()>&)>& wait);
+
     /// @brief The key this VirtualArray will use when filling a #cache.
     const std::string
       cache_key() const;
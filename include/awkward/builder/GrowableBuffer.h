@@ -8,30 +8,39 @@
 #include "awkward/Index.h"
 
 #include <memory>
+#include <vector>
 
 namespace awkward {
   /// @class GrowableBuffer
   ///
-  /// @brief Contiguous, one-dimensional array that can grow indefinitely
-  /// by calling #append.
+  /// @brief One-dimensional array that can grow indefinitely by calling
+  /// #append and is contiguous whenever its #ptr is requested.
   ///
   /// Configured by ArrayBuilderOptions, the buffer starts by reserving
   /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial} slots.
   /// When the number of slots used reaches the number reserved, a new
-  /// buffer is allocated that is
+  /// panel is allocated that brings the total reservation to
   /// {@link ArrayBuilderOptions#resize ArrayBuilderOptions::resize} times
-  /// larger. Thus, a logarithmic number of reallocations are needed as
-  /// data grow.
+  /// the previous reservation. Thus, a logarithmic number of panels are
+  /// needed as data grow, and appending never copies the existing data.
+  ///
+  /// The panels are only concatenated into one contiguous buffer when #ptr
+  /// is requested (or the buffer is explicitly resized), usually by
+  /// {@link ArrayBuilder#snapshot ArrayBuilder::snapshot}. The concatenated
+  /// buffer keeps the whole reservation, but each panel is released as soon
+  /// as it has been copied, and memory in the unused part of the reservation
+  /// is not touched, so building an array needs little more memory than the
+  /// array itself.
   ///
   /// When {@link ArrayBuilder#snapshot ArrayBuilder::snapshot} is called,
-  /// these buffers are shared with the new Content array. The GrowableBuffer
-  /// can still grow because the Content array only sees the part of its
-  /// reservation that existed at the time of the snapshot (new elements are
-  /// beyond its {@link Content#length Content::length}).
+  /// the contiguous buffer is shared with the new Content array. The
+  /// GrowableBuffer can still grow because the Content array only sees the
+  /// part of its reservation that existed at the time of the snapshot (new
+  /// elements are beyond its {@link Content#length Content::length}).
   ///
-  /// If a GrowableBuffer resizes itself by allocating a new array, it
-  /// decreases the reference counter for the shared buffer, but the Content
-  /// still owns it, and thus becomes the sole owner.
+  /// If a GrowableBuffer later concatenates new panels into a new
+  /// buffer, it decreases the reference counter for the shared buffer, but
+  /// the Content still owns it, and thus becomes the sole owner.
   ///
   /// The only disadvantage to this scheme is that the Content might forever
   /// have a reservation that is larger than it needs and it is unable to
@@ -101,6 +110,9 @@ namespace awkward {
     GrowableBuffer(const ArrayBuilderOptions& options);
 
     /// @brief Reference-counted pointer to the array buffer.
+    ///
+    /// If the data are in more than one panel, they are first concatenated
+    /// into one contiguous buffer of size #reserved.
     const std::shared_ptr<T>
       ptr() const;
 
@@ -113,7 +125,8 @@ namespace awkward {
 
     /// @brief Changes the #length in-place and possibly reallocate.
     ///
-    /// If the `newlength` is larger than #reserved, #ptr is reallocated.
+    /// If the `newlength` is larger than #reserved, #ptr is reallocated;
+    /// either way, the buffer becomes contiguous.
     void
       set_length(int64_t newlength);
 
@@ -129,7 +142,8 @@ namespace awkward {
     /// The parameter only guarantees that at least `minreserved` is reserved;
     /// if an amount less than #reserved is requested, nothing changes.
     ///
-    /// If #reserved actually changes, #ptr is reallocated.
+    /// If #reserved actually changes, #ptr is reallocated and the buffer
+    /// becomes contiguous.
     void
       set_reserved(int64_t minreserved);
 
@@ -147,7 +161,8 @@ namespace awkward {
     /// reallocation.
     ///
     /// This increases the #length by 1; if the new #length is larger than
-    /// #reserved, a new #ptr will be allocated.
+    /// #reserved, a new panel will be allocated (the existing data are not
+    /// copied).
     void
       append(T datum);
 
@@ -157,9 +172,28 @@ namespace awkward {
       getitem_at_nowrap(int64_t at) const;
 
   private:
+    // @brief Allocates one contiguous buffer of `newreserved` elements and
+    // moves the first panel and any additional panels into it.
+    void
+      concatenate(int64_t newreserved) const;
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
-    std::shared_ptr<T> ptr_;
+    // @brief See #ptr; this is the first panel, and it is the only panel
+    // when the buffer is contiguous.
+    mutable std::shared_ptr<T> ptr_;
+    // @brief Number of elements allocated in #ptr_.
+    mutable int64_t ptr_reserved_;
+    // @brief Additional panels, which are all full except the last.
+    mutable std::vector<std::shared_ptr<T>> panels_;
+    // @brief Number of elements allocated in each of the #panels_.
+    mutable std::vector<int64_t> panels_reserved_;
+    // @brief The panel that #append writes into (#ptr_ or the last of the
+    // #panels_).
+    mutable T* tail_;
+    // @brief Number of elements used in the #tail_ panel.
+    mutable int64_t tail_length_;
+    // @brief Number of elements allocated in the #tail_ panel.
+    mutable int64_t tail_reserved_;
     // @brief See #length.
     int64_t length_;
     // @brief See #reserved.
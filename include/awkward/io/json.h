@@ -5,7 +5,9 @@
 
 #include <complex>
 #include <cstdio>
+#include <map>
 #include <string>
+#include <tuple>
 
 #include "awkward/common.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -13,6 +15,16 @@
 namespace awkward {
   class Content;
   using ContentPtr    = std::shared_ptr<Content>;
+  class Form;
+  using FormPtr       = std::shared_ptr<Form>;
+
+  /// @brief Output of #FromJsonStringSchema and #FromJsonFileSchema: the
+  /// number of items, whether the JSON was a single top-level value that is
+  /// not an array (so the only item should be returned, rather than an array
+  /// of length 1), and the named buffers (as one-dimensional NumpyArrays).
+  using JsonSchemaOutput = std::tuple<int64_t,
+                                      bool,
+                                      std::map<std::string, ContentPtr>>;
 
   /// @class ToJson
   ///
@@ -366,6 +378,58 @@ namespace awkward {
                  const char* infinity_string = nullptr,
                  const char* minus_infinity_string = nullptr);
 
+  /// @brief Convert a JSON-encoded string into buffers for a known Form,
+  /// without discovering types with an ArrayBuilder.
+  ///
+  /// @param source Null-terminated string containing any valid JSON data.
+  /// @param form Form of each item; it may only contain
+  /// NumpyForm (booleans and numbers without inner shape),
+  /// ListOffsetForm with `i64` offsets, RegularForm, RecordForm with field
+  /// names, IndexedOptionForm with an `i64` index, and EmptyForm nodes,
+  /// each with a unique `form_key`.
+  /// @param options Configuration options for the GrowableBuffers.
+  /// @param nan_string user-defined string for a not-a-number (NaN) value
+  /// representation in JSON format
+  /// @param infinity_string user-defined string for a positive infinity
+  /// representation in JSON format
+  /// @param minus_infinity_string user-defined string for a negative
+  /// infinity representation in JSON format
+  ///
+  /// The JSON may be a single array of items or a sequence of items (such as
+  /// JSON Lines). Values that do not conform to the `form` raise an error
+  /// rather than generalizing the type. The buffers are named
+  /// `"{form_key}-{attribute}"`, with the attributes that `ak.from_buffers`
+  /// expects (`"data"`, `"offsets"`, `"index"`).
+  LIBAWKWARD_EXPORT_SYMBOL const JsonSchemaOutput
+    FromJsonStringSchema(const char* source,
+                         const FormPtr& form,
+                         const ArrayBuilderOptions& options,
+                         const char* nan_string = nullptr,
+                         const char* infinity_string = nullptr,
+                         const char* minus_infinity_string = nullptr);
+
+  /// @brief Convert a JSON-encoded file into buffers for a known Form,
+  /// without discovering types with an ArrayBuilder.
+  ///
+  /// @param source C file handle to a file containing any valid JSON data.
+  /// @param form Form of each item (see #FromJsonStringSchema).
+  /// @param options Configuration options for the GrowableBuffers.
+  /// @param buffersize Number of bytes for an intermediate buffer.
+  /// @param nan_string user-defined string for a not-a-number (NaN) value
+  /// representation in JSON format
+  /// @param infinity_string user-defined string for a positive infinity
+  /// representation in JSON format
+  /// @param minus_infinity_string user-defined string for a negative
+  /// infinity representation in JSON format
+  LIBAWKWARD_EXPORT_SYMBOL const JsonSchemaOutput
+    FromJsonFileSchema(FILE* source,
+                       const FormPtr& form,
+                       const ArrayBuilderOptions& options,
+                       int64_t buffersize,
+                       const char* nan_string = nullptr,
+                       const char* infinity_string = nullptr,
+                       const char* minus_infinity_string = nullptr);
+
 }
 
 #endif // AWKWARD_IO_JSON_H_
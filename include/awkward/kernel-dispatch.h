@@ -49,6 +49,8 @@ namespace awkward {
     /// @brief Internal utility function to return an opaque ptr if an handle is
     /// acquired for the specified ptr_lib. If not, then it raises an appropriate
     /// exception
+    ///
+    /// The handle is cached after the first successful call for each ptr_lib.
     void* acquire_handle(kernel::lib ptr_lib);
 
     /// @brief Internal utility function to return an opaque ptr if an symbol is
@@ -100,10 +102,11 @@ namespace awkward {
         /// @brief Called by `std::shared_ptr` when its reference count reaches
         /// zero.
         void operator()(T const *ptr) {
-          auto handle = acquire_handle(lib::cuda);
           typedef decltype(awkward_free) functor_type;
-          auto* awkward_free_fcn = reinterpret_cast<functor_type*>(
-                                     acquire_symbol(handle, "awkward_free"));
+          // resolved once; if it throws, the next call tries again
+          static functor_type* awkward_free_fcn =
+            reinterpret_cast<functor_type*>(
+              acquire_symbol(acquire_handle(lib::cuda), "awkward_free"));
           (*awkward_free_fcn)(reinterpret_cast<void const*>(ptr));
         }
     };
@@ -1495,6 +1498,46 @@ namespace awkward {
       int64_t outlength,
       OUT identity);
 
+    template <typename OUT, typename IN>
+    ERROR reduce_sum_offsets_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
+    template <typename OUT, typename IN>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
+    template <typename OUT, typename IN>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength,
+      OUT identity);
+
+    template <typename OUT, typename IN>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength,
+      OUT identity);
+
+    ERROR reduce_count_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t* toptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
     template <typename OUT, typename IN>
     ERROR reduce_argmin_64(
       kernel::lib ptr_lib,
@@ -1593,6 +1636,12 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength);
 
+    ERROR ListOffsetArray_reduce_mask_ByteMaskedArray_64(
+      kernel::lib ptr_lib,
+      int8_t* toptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
     template <typename T>
     ERROR IndexedArray_reduce_next_64(
       kernel::lib ptr_lib,
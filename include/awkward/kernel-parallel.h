@@ -0,0 +1,40 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#ifndef AWKWARD_KERNEL_PARALLEL_H_
+#define AWKWARD_KERNEL_PARALLEL_H_
+
+#include <functional>
+
+#include "common.h"
+
+extern "C" {
+  /// @brief Sets the number of threads that CPU kernels may use to
+  /// process independent sublists; `1` (the default) keeps every kernel
+  /// on the calling thread.
+  ///
+  /// The initial value is taken from the `AWKWARD_NUM_THREADS` environment
+  /// variable, if set. Non-positive values select the number of hardware
+  /// threads.
+  EXPORT_SYMBOL void
+    awkward_set_num_threads(int64_t num_threads);
+
+  /// @brief Number of threads that CPU kernels may use.
+  EXPORT_SYMBOL int64_t
+    awkward_get_num_threads();
+}
+
+/// @brief Calls `body(start, stop)` on ranges of sublists that together
+/// cover `0` to `length`, possibly concurrently.
+///
+/// The ranges are balanced by the number of items in each, taken from the
+/// monotonically increasing `offsets` (of length `length + 1`). If only one
+/// thread is configured or there are too few items to be worth distributing,
+/// `body(0, length)` is called on the calling thread. The `body` must only
+/// write to the outputs of the sublists it is given.
+void
+  awkward_parallel_sublists(
+    const int64_t* offsets,
+    int64_t length,
+    const std::function<void(int64_t, int64_t)>& body);
+
+#endif // AWKWARD_KERNEL_PARALLEL_H_
@@ -0,0 +1,98 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#ifndef AWKWARD_KERNEL_SORT_H_
+#define AWKWARD_KERNEL_SORT_H_
+
+#include <cstring>
+#include <limits>
+#include <type_traits>
+
+#include "common.h"
+
+/// @brief Maps each value to an unsigned integer with the same ordering,
+/// or (#encode_descending) with the reverse ordering.
+template <typename T>
+struct radix_key {
+  typedef typename std::make_unsigned<T>::type type;
+  static const type flip = std::is_signed<T>::value
+                               ? (type)((type)1 << (8*sizeof(T) - 1))
+                               : (type)0;
+  static type encode(T x) { return (type)x ^ flip; }
+  static type encode_descending(T x) { return (type)~encode(x); }
+};
+
+/// @brief Maps each floating point value to an unsigned integer with the
+/// ordering of NumPy's sort: `-inf < ... < -0.0 == 0.0 < ... < inf < nan`,
+/// in which all NaNs (whatever their sign) are equal. NaNs are also last in
+/// descending order.
+template <typename T, typename U>
+struct radix_key_float {
+  typedef U type;
+  static const U sign = (U)1 << (8*sizeof(U) - 1);
+  static U encode(T x) {
+    if (x != x) {
+      x = std::numeric_limits<T>::quiet_NaN();
+    }
+    else if (x == 0) {
+      x = 0;
+    }
+    U bits;
+    std::memcpy(&bits, &x, sizeof(U));
+    return (bits & sign) ? ~bits : (bits | sign);
+  }
+  static U encode_descending(T x) {
+    return (x != x) ? ~(U)0 : ~encode(x);
+  }
+};
+
+template <>
+struct radix_key<float>: radix_key_float<float, uint32_t> { };
+
+template <>
+struct radix_key<double>: radix_key_float<double, uint64_t> { };
+
+/// @brief Strict ordering for sorting: `<`, except that floating point
+/// values are ordered by their radix_key, so that NaN and signed zero land
+/// in the same place whichever algorithm sorts them.
+template <typename T>
+struct sort_less {
+  bool operator()(T a, T b) const { return a < b; }
+};
+
+/// @brief Reverse of sort_less, except that NaNs are still last.
+template <typename T>
+struct sort_greater {
+  bool operator()(T a, T b) const { return b < a; }
+};
+
+template <>
+struct sort_less<float> {
+  bool operator()(float a, float b) const {
+    return radix_key<float>::encode(a) < radix_key<float>::encode(b);
+  }
+};
+
+template <>
+struct sort_greater<float> {
+  bool operator()(float a, float b) const {
+    return radix_key<float>::encode_descending(a) <
+           radix_key<float>::encode_descending(b);
+  }
+};
+
+template <>
+struct sort_less<double> {
+  bool operator()(double a, double b) const {
+    return radix_key<double>::encode(a) < radix_key<double>::encode(b);
+  }
+};
+
+template <>
+struct sort_greater<double> {
+  bool operator()(double a, double b) const {
+    return radix_key<double>::encode_descending(a) <
+           radix_key<double>::encode_descending(b);
+  }
+};
+
+#endif // AWKWARD_KERNEL_SORT_H_
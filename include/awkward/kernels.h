@@ -1544,6 +1544,12 @@ extern "C" {
     int64_t lenparents,
     int64_t outlength);
 
+  EXPORT_SYMBOL ERROR
+  awkward_ListOffsetArray_reduce_mask_ByteMaskedArray_64(
+    int8_t* toptr,
+    const int64_t* offsets,
+    int64_t outlength);
+
   EXPORT_SYMBOL ERROR
   awkward_ListOffsetArray_reduce_nonlocal_findgaps_64(
     int64_t* gaps,
@@ -3971,6 +3977,12 @@ extern "C" {
     int64_t lenparents,
     int64_t outlength);
 
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_count_offsets_64(
+    int64_t* toptr,
+    const int64_t* offsets,
+    int64_t outlength);
+
   EXPORT_SYMBOL ERROR
   awkward_reduce_countnonzero_bool_64(
     int64_t* toptr,
@@ -4145,6 +4157,77 @@ extern "C" {
     int64_t outlength,
     double identity);
 
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_int8_int8_64(
+    int8_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int8_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_int16_int16_64(
+    int16_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int16_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_int32_int32_64(
+    int32_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int32_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_int64_int64_64(
+    int64_t* toptr,
+    const int64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int64_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_uint8_uint8_64(
+    uint8_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint8_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_uint16_uint16_64(
+    uint16_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint16_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_uint32_uint32_64(
+    uint32_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint32_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_uint64_uint64_64(
+    uint64_t* toptr,
+    const uint64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint64_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_float32_float32_64(
+    float* toptr,
+    const float* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    float identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_max_offsets_float64_float64_64(
+    double* toptr,
+    const double* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    double identity);
+
   EXPORT_SYMBOL ERROR
   awkward_reduce_max_complex64_complex64_64(
     float* toptr,
@@ -4243,6 +4326,77 @@ extern "C" {
     int64_t outlength,
     double identity);
 
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_int8_int8_64(
+    int8_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int8_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_int16_int16_64(
+    int16_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int16_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_int32_int32_64(
+    int32_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int32_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_int64_int64_64(
+    int64_t* toptr,
+    const int64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    int64_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_uint8_uint8_64(
+    uint8_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint8_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_uint16_uint16_64(
+    uint16_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint16_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_uint32_uint32_64(
+    uint32_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint32_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_uint64_uint64_64(
+    uint64_t* toptr,
+    const uint64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    uint64_t identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_float32_float32_64(
+    float* toptr,
+    const float* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    float identity);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_min_offsets_float64_float64_64(
+    double* toptr,
+    const double* fromptr,
+    const int64_t* offsets,
+    int64_t outlength,
+    double identity);
+
   EXPORT_SYMBOL ERROR
   awkward_reduce_min_complex64_complex64_64(
     float* toptr,
@@ -4373,6 +4527,103 @@ extern "C" {
     int64_t lenparents,
     int64_t outlength);
 
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int32_int8_64(
+    int32_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int32_int16_64(
+    int32_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int32_int32_64(
+    int32_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int64_int8_64(
+    int64_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int64_int16_64(
+    int64_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int64_int32_64(
+    int64_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_int64_int64_64(
+    int64_t* toptr,
+    const int64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint32_uint8_64(
+    uint32_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint32_uint16_64(
+    uint32_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint32_uint32_64(
+    uint32_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint64_uint8_64(
+    uint64_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint64_uint16_64(
+    uint64_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint64_uint32_64(
+    uint64_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_uint64_uint64_64(
+    uint64_t* toptr,
+    const uint64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_float32_float32_64(
+    float* toptr,
+    const float* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_prod_offsets_float64_float64_64(
+    double* toptr,
+    const double* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+
   EXPORT_SYMBOL ERROR
   awkward_reduce_prod_complex64_complex64_64(
     float* toptr,
@@ -4610,6 +4861,103 @@ extern "C" {
     int64_t lenparents,
     int64_t outlength);
 
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int32_int8_64(
+    int32_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int32_int16_64(
+    int32_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int32_int32_64(
+    int32_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int64_int8_64(
+    int64_t* toptr,
+    const int8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int64_int16_64(
+    int64_t* toptr,
+    const int16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int64_int32_64(
+    int64_t* toptr,
+    const int32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_int64_int64_64(
+    int64_t* toptr,
+    const int64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint32_uint8_64(
+    uint32_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint32_uint16_64(
+    uint32_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint32_uint32_64(
+    uint32_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint64_uint8_64(
+    uint64_t* toptr,
+    const uint8_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint64_uint16_64(
+    uint64_t* toptr,
+    const uint16_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint64_uint32_64(
+    uint64_t* toptr,
+    const uint32_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_uint64_uint64_64(
+    uint64_t* toptr,
+    const uint64_t* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_float32_float32_64(
+    float* toptr,
+    const float* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+  EXPORT_SYMBOL ERROR
+  awkward_reduce_sum_offsets_float64_float64_64(
+    double* toptr,
+    const double* fromptr,
+    const int64_t* offsets,
+    int64_t outlength);
+
   EXPORT_SYMBOL ERROR
   awkward_reduce_sum_complex64_complex64_64(
     float* toptr,
@@ -15,5 +15,11 @@ namespace ak = awkward;
 py::enum_<ak::kernel::lib>
   make_lib_enum(const py::handle& m, const std::string& name);
 
+void
+  make_set_num_threads(py::module& m, const std::string& name);
+
+void
+  make_get_num_threads(py::module& m, const std::string& name);
+
 
 #endif //AWKWARD_KERNEL_UTILS_H
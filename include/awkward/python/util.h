@@ -34,8 +34,12 @@ public:
   }
   /// @brief Called by `std::shared_ptr` when its reference count reaches
   /// zero.
+  ///
+  /// The GIL is (re)acquired because the last C++ reference may be dropped
+  /// in a thread that has released it.
   void operator()(T const *p) {
     // std::cout << "pyobject DECREF of " << pyobj_ << std::endl;
+    pybind11::gil_scoped_acquire acquire;
     Py_DECREF(pyobj_);
   }
 private:
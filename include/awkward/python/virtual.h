@@ -21,6 +21,8 @@ public:
                    const py::tuple& args,
                    const py::dict& kwargs);
 
+  ~PyArrayGenerator();
+
   const py::object
     callable() const;
 
@@ -82,6 +84,8 @@ class PyArrayCache: public ak::ArrayCache {
 public:
   PyArrayCache(const py::object& mutablemapping);
 
+  ~PyArrayCache();
+
   const py::object
     mutablemapping() const;
 
@@ -106,4 +110,20 @@ private:
 py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>>
 make_PyArrayCache(const py::handle& m, const std::string& name);
 
+////////// LRUArrayCache
+
+py::class_<ak::LRUArrayCache, std::shared_ptr<ak::LRUArrayCache>>
+make_LRUArrayCache(const py::handle& m, const std::string& name);
+
+/// @brief Converts a C++ ArrayCache (PyArrayCache or LRUArrayCache) into its
+/// Python object.
+py::object
+box_cache(const ak::ArrayCachePtr& cache);
+
+/// @brief Converts a Python ArrayCache, LRUArrayCache, or None into a C++
+/// ArrayCache (or `nullptr`), raising a `std::invalid_argument` that mentions
+/// `where` if it is none of these.
+ak::ArrayCachePtr
+unbox_cache(const py::object& cache, const std::string& where);
+
 #endif // AWKWARDPY_VIRTUAL_H_
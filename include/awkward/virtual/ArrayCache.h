@@ -3,6 +3,14 @@
 #ifndef AWKWARD_ARRAYCACHE_H_
 #define AWKWARD_ARRAYCACHE_H_
 
+#include <atomic>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <tuple>
+#include <unordered_map>
+#include <vector>
+
 #include "awkward/Content.h"
 
 namespace awkward {
@@ -49,6 +57,147 @@ namespace awkward {
   // large), define it in this file and implement it in
   // src/libawkward/virtual/ArrayCache.cpp.
 
+  /// @class LRUArrayCache
+  ///
+  /// @brief Pure C++ cache with a budget in bytes that evicts the least
+  /// recently used arrays when the budget is exceeded.
+  ///
+  /// The size of each array is measured by
+  /// {@link Content#nbytes Content::nbytes} when it is set. Arrays that
+  /// are larger than the whole budget are not cached at all.
+  ///
+  /// All methods are thread-safe and none of them call Python, so one
+  /// LRUArrayCache can be shared by many arrays that are materialized in
+  /// parallel threads. The arrays are divided among #num_shards
+  /// independently locked shards by a hash of their keys, so that threads
+  /// using different keys rarely wait for each other. The budget applies
+  /// to all shards together: the least recently used array among all of
+  /// them is evicted first. The cache also counts hits, misses, and
+  /// evictions.
+  class LIBAWKWARD_EXPORT_SYMBOL LRUArrayCache: public ArrayCache {
+  public:
+    /// @brief Creates an empty LRUArrayCache.
+    ///
+    /// @param maxbytes The budget: the maximum total #nbytes of the
+    /// cached arrays.
+    /// @param num_shards The number of independently locked parts that
+    /// the arrays are divided among (at least `1`).
+    LRUArrayCache(int64_t maxbytes, int64_t num_shards);
+
+    /// @brief The budget: the maximum total #nbytes of the cached arrays.
+    int64_t
+      maxbytes() const;
+
+    /// @brief The number of independently locked parts that the arrays
+    /// are divided among.
+    int64_t
+      num_shards() const;
+
+    /// @brief The total {@link Content#nbytes Content::nbytes} of the
+    /// arrays that are currently cached.
+    int64_t
+      nbytes() const;
+
+    /// @brief The number of arrays that are currently cached.
+    int64_t
+      length() const;
+
+    /// @brief The number of #get calls that found an array.
+    int64_t
+      hits() const;
+
+    /// @brief The number of #get calls that did not find an array.
+    int64_t
+      misses() const;
+
+    /// @brief The number of arrays that were removed to stay within the
+    /// budget (not including arrays that were too large to be cached).
+    int64_t
+      evictions() const;
+
+    /// @brief The keys of the cached arrays, from the most recently used
+    /// to the least recently used.
+    const std::vector<std::string>
+      keys() const;
+
+    /// @brief Returns true if `key` is in the cache, without marking it
+    /// as used or counting a hit or a miss.
+    bool
+      contains(const std::string& key) const;
+
+    /// @brief Gets an array and marks it as the most recently used, or
+    /// returns `nullptr` if it is not in the cache.
+    ContentPtr
+      get(const std::string& key) const override;
+
+    /// @brief Writes or overwrites an array at `key` as the most recently
+    /// used, evicting the least recently used arrays if necessary.
+    void
+      set(const std::string& key, const ContentPtr& value) override;
+
+    /// @brief Removes the array at `key`, if it is in the cache, and returns
+    /// true if it was.
+    bool
+      del(const std::string& key);
+
+    /// @brief Removes all arrays and resets the counters.
+    void
+      clear();
+
+    /// @brief Always false.
+    bool
+      is_broken() const override;
+
+    const std::string
+      tostring_part(const std::string& indent,
+                    const std::string& pre,
+                    const std::string& post) const override;
+
+  private:
+    // @brief A cached array: its key, the array, its size, and the #tick_
+    // at which it was last used.
+    using Entry = std::tuple<std::string, ContentPtr, int64_t, int64_t>;
+
+    // @brief An independently locked part of the cache.
+    struct Shard {
+      // @brief Guards #entries and #lookup.
+      std::mutex mutex;
+      // @brief The arrays in this shard, from the most recently used to
+      // the least recently used.
+      std::list<Entry> entries;
+      // @brief Position of each key in #entries.
+      std::unordered_map<std::string, std::list<Entry>::iterator> lookup;
+    };
+
+    // @brief The shard that `key` belongs in.
+    Shard&
+      shard(const std::string& key) const;
+
+    // @brief Removes the least recently used array among all shards,
+    // except `keep`, appending it to `evicted`; returns false if there is
+    // nothing else to remove.
+    bool
+      evict_one(const std::string& keep, std::vector<ContentPtr>& evicted);
+
+    // @brief See #maxbytes.
+    const int64_t maxbytes_;
+    // @brief The shards; their number is #num_shards.
+    mutable std::vector<std::unique_ptr<Shard>> shards_;
+    // @brief Increases every time an array is used, to order arrays in
+    // different shards.
+    mutable std::atomic<int64_t> tick_;
+    // @brief See #nbytes.
+    std::atomic<int64_t> nbytes_;
+    // @brief See #length.
+    std::atomic<int64_t> length_;
+    // @brief See #hits.
+    mutable std::atomic<int64_t> hits_;
+    // @brief See #misses.
+    mutable std::atomic<int64_t> misses_;
+    // @brief See #evictions.
+    std::atomic<int64_t> evictions_;
+  };
+
 }
 
 #endif // AWKWARD_ARRAYCACHE_H_
@@ -41,6 +41,9 @@ behavior = {}
 from awkward.highlevel import Array
 from awkward.highlevel import Record
 from awkward.highlevel import ArrayBuilder
+from awkward._typedbuilder import TypedArrayBuilder
+from awkward._lazyexpr import lazy_expr
+from awkward._access import track_access
 
 # behaviors
 from awkward.behaviors.mixins import *
@@ -53,6 +56,10 @@ from awkward.operations.describe import *
 from awkward.operations.structure import *
 from awkward.operations.reducers import *
 
+# kernel settings
+from awkward._cpu_kernels import set_num_threads
+from awkward._cpu_kernels import get_num_threads
+
 # version
 __version__ = awkward._ext.__version__
 
@@ -0,0 +1,331 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+_index_dtype = {
+    "i8": np.int8,
+    "u8": np.uint8,
+    "i32": np.int32,
+    "u32": np.uint32,
+    "i64": np.int64,
+}
+
+_index_class = {
+    "i8": "Index8",
+    "u8": "IndexU8",
+    "i32": "Index32",
+    "u32": "IndexU32",
+    "i64": "Index64",
+}
+
+_layout_suffix = {"i32": "32", "u32": "U32", "i64": "64"}
+
+
+class AccessReport(object):
+    """
+    Record of the virtual arrays generated through an array returned by
+    #ak.track_access.
+
+    Each virtual array is identified by its `path`, the tuple of record fields
+    from the top of the array down to it, and by the `form_key` of its
+    generator's Form (if it has one). Both are listed once each, in the order
+    in which they were first generated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths = []
+        self._form_keys = []
+
+    def _generated(self, path, form_key):
+        with self._lock:
+            if path not in self._paths:
+                self._paths.append(path)
+            if form_key is not None and form_key not in self._form_keys:
+                self._form_keys.append(form_key)
+
+    @property
+    def paths(self):
+        """
+        Record field paths (tuples of str) of the generated virtual arrays.
+        """
+        with self._lock:
+            return list(self._paths)
+
+    @property
+    def form_keys(self):
+        """
+        The `form_key` of each generated virtual array's Form, for those that
+        have one; for #ak.from_buffers, these name the buffers that were read.
+        """
+        with self._lock:
+            return list(self._form_keys)
+
+    @property
+    def columns(self):
+        """
+        Top-level record fields in which any virtual array was generated,
+        suitable for the `columns` argument of #ak.from_parquet.
+        """
+        out = []
+        for path in self.paths:
+            if len(path) != 0 and path[0] not in out:
+                out.append(path[0])
+        return out
+
+    def __repr__(self):
+        return "<AccessReport columns={0} form_keys={1}>".format(
+            self.columns, self.form_keys
+        )
+
+
+def _placeholder(form, length, path, report, cache):
+    # an array of the given Form and length whose values are all zero (or the
+    # first valid item), for generating a virtual array without its generator
+    parameters = form.parameters
+
+    if isinstance(form, ak.forms.NumpyForm):
+        data = numpy.zeros((length,) + tuple(form.inner_shape), form.to_numpy())
+        return ak.layout.NumpyArray(data, parameters=parameters)
+
+    elif isinstance(form, ak.forms.EmptyForm):
+        return ak.layout.EmptyArray(parameters=parameters)
+
+    elif isinstance(form, ak.forms.RegularForm):
+        content = _placeholder(form.content, length * form.size, path, report, cache)
+        return ak.layout.RegularArray(content, form.size, length, parameters=parameters)
+
+    elif isinstance(form, ak.forms.ListOffsetForm):
+        offsets = _index(form.offsets, length + 1)
+        content = _placeholder(form.content, 0, path, report, cache)
+        cls = getattr(ak.layout, "ListOffsetArray" + _layout_suffix[form.offsets])
+        return cls(offsets, content, parameters=parameters)
+
+    elif isinstance(form, ak.forms.ListForm):
+        starts = _index(form.starts, length)
+        stops = _index(form.stops, length)
+        content = _placeholder(form.content, 0, path, report, cache)
+        cls = getattr(ak.layout, "ListArray" + _layout_suffix[form.starts])
+        return cls(starts, stops, content, parameters=parameters)
+
+    elif isinstance(form, (ak.forms.IndexedForm, ak.forms.IndexedOptionForm)):
+        index = _index(form.index, length)
+        content = _placeholder(
+            form.content, 1 if length != 0 else 0, path, report, cache
+        )
+        if isinstance(form, ak.forms.IndexedForm):
+            name = "IndexedArray"
+        else:
+            name = "IndexedOptionArray"
+        cls = getattr(ak.layout, name + _layout_suffix[form.index])
+        return cls(index, content, parameters=parameters)
+
+    elif isinstance(form, ak.forms.ByteMaskedForm):
+        mask = ak.layout.Index8(numpy.full(length, form.valid_when, np.int8))
+        content = _placeholder(form.content, length, path, report, cache)
+        return ak.layout.ByteMaskedArray(
+            mask, content, form.valid_when, parameters=parameters
+        )
+
+    elif isinstance(form, ak.forms.BitMaskedForm):
+        mask = ak.layout.IndexU8(
+            numpy.full((length + 7) // 8, 255 if form.valid_when else 0, np.uint8)
+        )
+        content = _placeholder(form.content, length, path, report, cache)
+        return ak.layout.BitMaskedArray(
+            mask,
+            content,
+            form.valid_when,
+            length,
+            form.lsb_order,
+            parameters=parameters,
+        )
+
+    elif isinstance(form, ak.forms.UnmaskedForm):
+        content = _placeholder(form.content, length, path, report, cache)
+        return ak.layout.UnmaskedArray(content, parameters=parameters)
+
+    elif isinstance(form, ak.forms.RecordForm):
+        contents = []
+        for i in range(form.numfields):
+            key = form.key(i)
+            contents.append(
+                _placeholder(form.content(i), length, path + (key,), report, cache)
+            )
+        keys = None if form.istuple else form.keys()
+        return ak.layout.RecordArray(contents, keys, length, parameters=parameters)
+
+    elif isinstance(form, ak.forms.UnionForm):
+        tags = _index(form.tags, length)
+        index = _index(form.index, length)
+        contents = [
+            _placeholder(x, 1 if i == 0 and length != 0 else 0, path, report, cache)
+            for i, x in enumerate(form.contents)
+        ]
+        cls = getattr(ak.layout, "UnionArray8_" + _layout_suffix[form.index])
+        return cls(tags, index, contents, parameters=parameters)
+
+    elif isinstance(form, ak.forms.VirtualForm):
+        if form.form is None:
+            raise ValueError(
+                "a dry run needs the Form of every virtual array, but the one "
+                "at {0} has none".format(repr(path))
+                + ak._util.exception_suffix(__file__)
+            )
+        return _tracked_virtual(
+            None, form.form, length, path, report, True, cache, None, parameters
+        )
+
+    else:
+        raise AssertionError(
+            "unexpected form node type: {0}".format(type(form))
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+def _index(form_index, length):
+    cls = getattr(ak.layout, _index_class[form_index])
+    return cls(numpy.zeros(length, _index_dtype[form_index]))
+
+
+class _TrackedGenerate(object):
+    # the callable of a tracked VirtualArray's generator
+    def __init__(self, generator, form, length, path, report, dry_run, cache):
+        self.generator = generator
+        self.form = form
+        self.length = length
+        self.path = path
+        self.report = report
+        self.dry_run = dry_run
+        self.cache = cache
+
+    def __call__(self):
+        self.report._generated(
+            self.path, None if self.form is None else self.form.form_key
+        )
+        if self.dry_run:
+            if self.form is None or self.length is None:
+                raise ValueError(
+                    "a dry run needs the Form and length of every virtual array, "
+                    "but the one at {0} has no {1}".format(
+                        repr(self.path), "Form" if self.form is None else "length"
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            out = _placeholder(
+                self.form, self.length, self.path, self.report, self.cache
+            )
+        else:
+            out = ak.operations.convert.to_layout(
+                self.generator(), allow_record=False, allow_other=False
+            )
+            out = _track(out, self.path, self.report, False, self.cache)
+        return out
+
+
+def _tracked_virtual(
+    generator, form, length, path, report, dry_run, cache, cache_key, parameters
+):
+    tracked = ak.layout.ArrayGenerator(
+        _TrackedGenerate(generator, form, length, path, report, dry_run, cache),
+        form=form,
+        length=length,
+    )
+    return ak.layout.VirtualArray(
+        tracked, cache, cache_key=cache_key, parameters=parameters
+    )
+
+
+def _track(layout, path, report, dry_run, cache):
+    def getfunction(layout, path):
+        if isinstance(layout, ak.layout.VirtualArray):
+            generator = layout.generator
+            form = generator.form
+            if form is not None:
+                # an owned copy of the generator's Form
+                form = ak.forms.Form.fromjson(form.tojson(False, True))
+            return lambda: _tracked_virtual(
+                generator,
+                form,
+                generator.length,
+                path,
+                report,
+                dry_run,
+                cache,
+                layout.cache_key,
+                layout.parameters,
+            )
+
+        elif isinstance(layout, ak.layout.RecordArray):
+            return lambda: ak.layout.RecordArray(
+                [
+                    _track(layout.field(i), path + (key,), report, dry_run, cache)
+                    for i, key in enumerate(layout.keys())
+                ],
+                None if layout.istuple else layout.keys(),
+                len(layout),
+                layout.identities,
+                layout.parameters,
+            )
+
+        else:
+            return path
+
+    return ak._util.recursively_apply(
+        layout, getfunction, pass_depth=False, pass_user=True, user=path
+    )
+
+
+def track_access(array, dry_run=False, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array that may contain virtual arrays, such as the output of
+            #ak.from_parquet or #ak.from_buffers with `lazy=True`.
+        dry_run (bool): If True, virtual arrays are never generated: they
+            are replaced by arrays of the right Form and length whose values
+            are all zero (or valid, for option types), so that no data is read.
+            Every virtual array must have a known Form and length.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns a copy of `array` whose virtual arrays record their generation
+    and an `AccessReport` that collects the record: the record field paths
+    of the virtual arrays that were generated (`paths`), their Form's
+    `form_key` (`form_keys`), and the top-level fields that they belong to
+    (`columns`).
+
+    This finds out which columns an analysis needs, so that the real run
+    can read only those:
+
+        >>> lazy = ak.from_parquet("events.parquet", lazy=True)
+        >>> tracked, report = ak.track_access(lazy, dry_run=True)
+        >>> analysis(tracked)
+        >>> array = ak.from_parquet("events.parquet", columns=report.columns)
+
+    A dry run computes with placeholder values, so its results are
+    meaningless and code whose path depends on data values may touch
+    different columns than a real run. Each virtual array is generated
+    at most once per tracked copy, including its nested virtual arrays.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    report = AccessReport()
+    cache = ak.layout.LRUArrayCache(np.iinfo(np.int64).max, num_shards=1)
+    out = _track(layout, (), report, dry_run, cache)
+    if highlevel:
+        return (
+            ak._util.wrap(out, ak._util.behaviorof(array, behavior=behavior)),
+            report,
+        )
+    else:
+        return out, report
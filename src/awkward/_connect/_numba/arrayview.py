@@ -24,6 +24,33 @@ def code_to_function(code, function_name, externals=None, debug=False):
     return namespace[function_name]
 
 
+########## views of arrays
+
+
+def typeof_view(view):
+    """
+    Returns `numba.typeof(view)` for an ArrayView, RecordView, or
+    PartitionedView, remembering it on the view so that an array passed to
+    many calls of a JIT-compiled function is only typed once.
+
+    The type's name includes the repr of the view's behavior, which is only
+    computed when it is typed: that is when the behavior is replaced or gains
+    or loses keys, not when a value of the same dict is replaced.
+    """
+    if isinstance(view, RecordView):
+        behavior = view.arrayview.behavior
+    else:
+        behavior = view.behavior
+    behaviorkey = (
+        id(behavior),
+        ak._util.keys_fingerprint({} if behavior is None else behavior),
+    )
+    cached = getattr(view, "_numbatype", None)
+    if cached is None or cached[0] != behaviorkey:
+        cached = view._numbatype = (behaviorkey, numba.typeof(view))
+    return cached[1]
+
+
 ########## Lookup
 
 
@@ -36,9 +36,45 @@ def implements(numpy_function):
     return decorator
 
 
+def is_fully_regular(layout):
+    if (
+        isinstance(layout, ak.layout.RegularArray)
+        and layout.parameter("__record__") is None
+        and layout.parameter("__array__") is None
+    ):
+        if isinstance(layout.content, ak.layout.NumpyArray):
+            return True
+        elif isinstance(layout.content, ak.layout.RegularArray):
+            return is_fully_regular(layout.content)
+        else:
+            return False
+    else:
+        return False
+
+
+def deregulate(layout):
+    if not is_fully_regular(layout):
+        return layout
+    else:
+        shape = [len(layout)]
+        node = layout
+        while isinstance(node, ak.layout.RegularArray):
+            shape.append(node.size)
+            node = node.content
+        nparray = ak.nplike.of(node).asarray(node)
+        nparray = nparray.reshape(tuple(shape) + nparray.shape[1:])
+        return ak.layout.NumpyArray(
+            nparray,
+            node.identities,
+            node.parameters,
+        )
+
+
 def array_ufunc(ufunc, method, inputs, kwargs):
     if method != "__call__" or len(inputs) == 0 or "out" in kwargs:
         return NotImplemented
+    if any(isinstance(x, ak._lazyexpr.LazyExpression) for x in inputs):
+        return NotImplemented
 
     behavior = ak._util.behaviorof(*inputs)
     inputs = [
@@ -85,38 +121,6 @@ def array_ufunc(ufunc, method, inputs, kwargs):
             )
             return lambda: out
 
-    def is_fully_regular(layout):
-        if (
-            isinstance(layout, ak.layout.RegularArray)
-            and layout.parameter("__record__") is None
-            and layout.parameter("__array__") is None
-        ):
-            if isinstance(layout.content, ak.layout.NumpyArray):
-                return True
-            elif isinstance(layout.content, ak.layout.RegularArray):
-                return is_fully_regular(layout.content)
-            else:
-                return False
-        else:
-            return False
-
-    def deregulate(layout):
-        if not is_fully_regular(layout):
-            return layout
-        else:
-            shape = [len(layout)]
-            node = layout
-            while isinstance(node, ak.layout.RegularArray):
-                shape.append(node.size)
-                node = node.content
-            nparray = ak.nplike.of(node).asarray(node)
-            nparray = nparray.reshape(tuple(shape) + nparray.shape[1:])
-            return ak.layout.NumpyArray(
-                nparray,
-                node.identities,
-                node.parameters,
-            )
-
     def getfunction(inputs):
         signature = [ufunc]
         for x in inputs:
@@ -158,7 +162,7 @@ def array_ufunc(ufunc, method, inputs, kwargs):
 
         for x in inputs:
             if isinstance(x, ak.layout.Content):
-                chained_behavior = ak._util.Behavior(ak.behavior, behavior)
+                chained_behavior = ak._util.chained_behavior(behavior)
                 apply_ufunc = chained_behavior[numpy.ufunc, x.parameter("__array__")]
                 if apply_ufunc is not None:
                     out = adjust_apply_ufunc(apply_ufunc, ufunc, method, inputs, kwargs)
@@ -6,6 +6,8 @@ import ctypes
 import platform
 import pkg_resources
 
+import awkward._ext
+
 if platform.system() == "Windows":
     name = "awkward-cpu-kernels.dll"
 elif platform.system() == "Darwin":
@@ -15,3 +17,31 @@ else:
 libpath = pkg_resources.resource_filename("awkward", name)
 
 lib = ctypes.cdll.LoadLibrary(libpath)
+
+
+def set_num_threads(num_threads):
+    """
+    Args:
+        num_threads (int): Maximum number of threads for CPU kernels to use;
+            `1` keeps all work on the calling thread, and zero or a negative
+            number selects the number of hardware threads.
+
+    Lets kernels that loop over independent lists, such as the ones behind
+    #ak.sort, #ak.argsort, and #ak.combinations, split the lists into ranges
+    with about the same number of items and process them in a pool of threads.
+    Arrays with only a few items are always processed on the calling thread.
+
+    The default is `1`, unless the `AWKWARD_NUM_THREADS` environment variable
+    is set when Awkward Array is imported.
+
+    See also #ak.get_num_threads.
+    """
+    awkward._ext.set_num_threads(num_threads)
+
+
+def get_num_threads():
+    """
+    Returns the maximum number of threads for CPU kernels to use, as set by
+    #ak.set_num_threads or the `AWKWARD_NUM_THREADS` environment variable.
+    """
+    return awkward._ext.get_num_threads()
@@ -0,0 +1,369 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import numbers
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+numexpr_operators = {
+    "add": "({0} + {1})",
+    "subtract": "({0} - {1})",
+    "multiply": "({0} * {1})",
+    "true_divide": "({0} / {1})",
+    "power": "({0} ** {1})",
+    "negative": "(-{0})",
+    "less": "({0} < {1})",
+    "less_equal": "({0} <= {1})",
+    "greater": "({0} > {1})",
+    "greater_equal": "({0} >= {1})",
+    "equal": "({0} == {1})",
+    "not_equal": "({0} != {1})",
+    "absolute": "abs({0})",
+    "arctan2": "arctan2({0}, {1})",
+}
+
+for name in (
+    "sqrt",
+    "exp",
+    "expm1",
+    "log",
+    "log10",
+    "log1p",
+    "sin",
+    "cos",
+    "tan",
+    "arcsin",
+    "arccos",
+    "arctan",
+    "sinh",
+    "cosh",
+    "tanh",
+    "arcsinh",
+    "arccosh",
+    "arctanh",
+):
+    numexpr_operators[name] = name + "({0})"
+
+
+class NotFusable(Exception):
+    pass
+
+
+class LazyExpression(ak._connect._numpy.NDArrayOperatorsMixin):
+    """
+    A NumPy ufunc expression of arrays that has not been computed yet; see
+    #ak.lazy_expr.
+
+    Ufuncs and operators applied to a LazyExpression return a new
+    LazyExpression. Calling #evaluate broadcasts the arrays once and computes
+    the whole expression on their flattened contents.
+    """
+
+    def __init__(self, ufunc, args):
+        self._ufunc = ufunc
+        self._args = tuple(args)
+
+    def __repr__(self):
+        return "<LazyExpression {0}>".format(self._str({}))
+
+    def _str(self, names):
+        if self._ufunc is None:
+            arg = self._args[0]
+            if isinstance(arg, (numbers.Number, np.generic)):
+                return repr(arg)
+            if id(arg) not in names:
+                names[id(arg)] = "x{0}".format(len(names))
+            return names[id(arg)]
+        else:
+            return "{0}({1})".format(
+                self._ufunc.__name__,
+                ", ".join(
+                    x._str(names)
+                    if isinstance(x, LazyExpression)
+                    else LazyExpression(None, (x,))._str(names)
+                    for x in self._args
+                ),
+            )
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if (
+            method != "__call__"
+            or len(kwargs) != 0
+            or ufunc.nout != 1
+            or ufunc.signature is not None
+        ):
+            inputs = [
+                x.evaluate() if isinstance(x, LazyExpression) else x for x in inputs
+            ]
+            return getattr(ufunc, method)(*inputs, **kwargs)
+        return LazyExpression(ufunc, inputs)
+
+    def _compile(self):
+        # leaves: the distinct arrays and constants, by identity
+        # steps: (slot, ufunc, argument slots) for each distinct ufunc call,
+        #     in an order in which arguments precede the calls that use them
+        slots = {}
+        leaves = []
+        steps = []
+
+        def visit(expression):
+            if not isinstance(expression, LazyExpression):
+                expression = LazyExpression(None, (expression,))
+            if expression._ufunc is None:
+                key = id(expression._args[0])
+            else:
+                key = id(expression)
+            if key not in slots:
+                if expression._ufunc is None:
+                    slots[key] = len(slots)
+                    leaves.append((slots[key], expression._args[0]))
+                else:
+                    args = [visit(x) for x in expression._args]
+                    slots[key] = len(slots)
+                    steps.append((slots[key], expression._ufunc, args))
+            return slots[key]
+
+        visit(self)
+        return len(slots), leaves, steps
+
+    def evaluate(self, highlevel=True):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+
+        Computes the expression.
+
+        If no array has an `"__array__"` or `"__record__"` parameter and no
+        behavior overloads the ufuncs in the expression, the arrays are
+        broadcast together once and the whole expression is evaluated on
+        their flattened contents. If all of these are float64 and the
+        [numexpr](https://github.com/pydata/numexpr) package is installed,
+        it evaluates the expression in a single pass; otherwise, each ufunc
+        is applied with NumPy, writing into temporary arrays that are no
+        longer needed.
+
+        Otherwise, the ufuncs are applied one at a time, as though the
+        expression had not been deferred.
+        """
+        numslots, leaves, steps = self._compile()
+        arrays = [x for slot, x in leaves]
+        behavior = ak._util.behaviorof(*arrays)
+        inputs = [
+            ak.operations.convert.to_layout(x, allow_record=True, allow_other=True)
+            for x in arrays
+        ]
+
+        chained = ak._util.chained_behavior(behavior)
+        if (
+            len(steps) == 0
+            or not any(
+                isinstance(x, (ak.layout.Content, ak.partition.PartitionedArray))
+                for x in inputs
+            )
+            or any(
+                chained.has_overloads(ufunc, ufunc.nin + 1)
+                for slot, ufunc, args in steps
+            )
+        ):
+            return self._eager(numslots, leaves, steps, highlevel)
+
+        def getfunction(inputs):
+            for x in inputs:
+                if isinstance(x, ak.layout.Content) and (
+                    x.parameter("__array__") is not None
+                    or x.parameter("__record__") is not None
+                ):
+                    raise NotFusable()
+            inputs = [ak._connect._numpy.deregulate(x) for x in inputs]
+            if all(
+                isinstance(x, ak.layout.NumpyArray)
+                or not isinstance(x, (ak.layout.Content, ak.partition.PartitionedArray))
+                for x in inputs
+            ):
+                nplike = ak.nplike.of(*inputs)
+                values = [None] * numslots
+                for (slot, leaf), x in zip(leaves, inputs):
+                    if isinstance(x, ak.layout.NumpyArray):
+                        values[slot] = nplike.asarray(x)
+                    else:
+                        values[slot] = x
+                result = fused(nplike, values, steps)
+                return lambda: (
+                    ak.operations.convert.from_numpy(result, highlevel=False),
+                )
+            else:
+                return None
+
+        try:
+            out = ak._util.broadcast_and_apply(
+                inputs, getfunction, behavior, allow_records=False, pass_depth=False
+            )
+        except NotFusable:
+            return self._eager(numslots, leaves, steps, highlevel)
+        assert isinstance(out, tuple) and len(out) == 1
+        if highlevel:
+            return ak._util.wrap(out[0], behavior)
+        else:
+            return out[0]
+
+    def _eager(self, numslots, leaves, steps, highlevel):
+        values = [None] * numslots
+        for slot, x in leaves:
+            values[slot] = x
+        for slot, ufunc, args in steps:
+            values[slot] = ufunc(*[values[i] for i in args])
+        if len(steps) == 0:
+            out = values[0]
+        else:
+            out = values[steps[-1][0]]
+        behavior = ak._util.behaviorof(*[x for slot, x in leaves])
+        out = ak.operations.convert.to_layout(out, allow_record=True, allow_other=True)
+        if highlevel:
+            return ak._util.wrap(out, behavior)
+        else:
+            return out
+
+
+def fused(nplike, values, steps):
+    result = fused_numexpr(nplike, values, steps)
+    if result is None:
+        result = fused_numpy(nplike, values, steps)
+    return result
+
+
+def fused_numexpr(nplike, values, steps):
+    if not isinstance(nplike, ak.nplike.Numpy):
+        return None
+    if any(ufunc.__name__ not in numexpr_operators for slot, ufunc, args in steps):
+        return None
+    try:
+        import numexpr
+    except ImportError:
+        return None
+
+    sources = {}
+    local_dict = {}
+    for slot, x in enumerate(values):
+        if isinstance(x, np.ndarray) and x.dtype == np.float64:
+            sources[slot] = "x{0}".format(slot)
+            local_dict[sources[slot]] = x
+        elif isinstance(x, float):
+            # bound, not inlined: numexpr has no names for inf and nan
+            sources[slot] = "x{0}".format(slot)
+            local_dict[sources[slot]] = x
+        elif isinstance(x, int) and not isinstance(x, bool):
+            sources[slot] = repr(x)
+        elif x is not None:
+            return None
+    for slot, ufunc, args in steps:
+        sources[slot] = numexpr_operators[ufunc.__name__].format(
+            *[sources[i] for i in args]
+        )
+
+    return numexpr.evaluate(
+        sources[steps[-1][0]], local_dict=local_dict, global_dict={}
+    )
+
+
+def is_square(ufunc, args):
+    return (
+        ufunc is numpy.power
+        and isinstance(args[1], (int, np.integer))
+        and not isinstance(args[1], (bool, np.bool_))
+        and args[1] == 2
+        and getattr(args[0], "ndim", 0) != 0
+        and args[0].dtype.kind in "iuf"
+    )
+
+
+def fused_numpy(nplike, values, steps):
+    values = list(values)
+    uses = [0] * len(values)
+    for slot, ufunc, args in steps:
+        for i in args:
+            uses[i] += 1
+
+    temporary = set()
+    for slot, ufunc, args in steps:
+        argvalues = [values[i] for i in args]
+        if is_square(ufunc, argvalues):
+            # as ndarray.__pow__ does; np.power itself does not
+            ufunc = numpy.square
+            argvalues = argvalues[:1]
+        shapes = set(x.shape for x in argvalues if getattr(x, "ndim", 0) != 0)
+
+        out = None
+        if len(shapes) == 1:
+            (shape,) = shapes
+            for i in args:
+                if (
+                    i in temporary
+                    and uses[i] == args.count(i)
+                    and getattr(values[i], "ndim", 0) != 0
+                    and values[i].shape == shape
+                ):
+                    out = values[i]
+                    break
+        if out is not None:
+            # the dtype the ufunc would return, from its arguments' dtypes
+            dtype = ufunc(
+                *[x[:0] if getattr(x, "ndim", 0) != 0 else x for x in argvalues]
+            ).dtype
+            if dtype != out.dtype:
+                out = None
+
+        if out is None:
+            values[slot] = ufunc(*argvalues)
+        else:
+            values[slot] = ufunc(*argvalues, out=out)
+        temporary.add(slot)
+
+        for i in args:
+            uses[i] -= 1
+            if uses[i] == 0:
+                values[i] = None
+
+    return values[steps[-1][0]]
+
+
+def lazy_expr(*arrays):
+    """
+    Args:
+        arrays: Arrays to defer computations on: Awkward Arrays or anything
+            that can be broadcast with them, such as NumPy arrays and numbers.
+
+    Returns a #ak._lazyexpr.LazyExpression for each of the `arrays` (or a
+    single one if only one array is given), on which NumPy ufuncs and
+    operators are recorded instead of computed until
+    #ak._lazyexpr.LazyExpression.evaluate is called.
+
+    Every ufunc applied to an #ak.Array broadcasts the structures of its
+    arguments and allocates an array for its result. An expression like
+
+        >>> pt = np.sqrt(px ** 2 + py ** 2)
+
+    does this four times. Deferring it,
+
+        >>> px, py = ak.lazy_expr(px, py)
+        >>> pt = np.sqrt(px ** 2 + py ** 2).evaluate()
+
+    broadcasts `px` and `py` once and computes the expression on their
+    flattened contents, in a single pass if
+    [numexpr](https://github.com/pydata/numexpr) is installed and the
+    numbers are float64. The result is the same as without `ak.lazy_expr`.
+
+    Only ufuncs that return one value are deferred; others, such as
+    `np.matmul`, and ufuncs with keyword arguments compute the expression
+    first. Arrays with custom behaviors are computed one ufunc at a time.
+    """
+    out = tuple(LazyExpression(None, (x,)) for x in arrays)
+    if len(out) == 1:
+        return out[0]
+    else:
+        return out
@@ -0,0 +1,446 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+import keyword
+import re
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# Each node of a TypedArrayBuilder's Form becomes a class generated from the
+# source code below; if Numba is installed, the classes are jitclasses, so a
+# JIT-compiled function that appends to them writes directly into their
+# buffers. Every node has a `length` and a `_grow` method that enlarges its
+# buffer by the `resize` factor when it is full.
+
+numpy_node = """
+class NumpyNode(object):
+    def __init__(self, data, resize):
+        self.data = data
+        self.length = 0
+        self.resize = resize
+
+    def _grow(self):
+        size = max(int(len(self.data) * self.resize), len(self.data) + 1)
+        data = numpy.empty(size, numpy.{dtype})
+        data[: self.length] = self.data[: self.length]
+        self.data = data
+
+    def append(self, x):
+        if self.length == len(self.data):
+            self._grow()
+        self.data[self.length] = x
+        self.length += 1
+{aliases}"""
+
+numpy_node_alias = """
+    def {name}(self, x):
+        self.append(x)
+"""
+
+list_node = """
+class ListNode(object):
+    def __init__(self, offsets, content, resize):
+        self.offsets = offsets
+        self.offsets[0] = 0
+        self.length = 0
+        self.content = content
+        self.resize = resize
+
+    def _grow(self):
+        size = max(int(len(self.offsets) * self.resize), len(self.offsets) + 1)
+        offsets = numpy.empty(size, numpy.int64)
+        offsets[: self.length + 1] = self.offsets[: self.length + 1]
+        self.offsets = offsets
+
+    def begin_list(self):
+        pass
+
+    def end_list(self):
+        if self.length + 1 == len(self.offsets):
+            self._grow()
+        self.offsets[self.length + 1] = self.content.length
+        self.length += 1
+"""
+
+option_node = """
+class OptionNode(object):
+    def __init__(self, index, content, resize):
+        self.index = index
+        self.length = 0
+        self.content = content
+        self.resize = resize
+
+    def _grow(self):
+        size = max(int(len(self.index) * self.resize), len(self.index) + 1)
+        index = numpy.empty(size, numpy.int64)
+        index[: self.length] = self.index[: self.length]
+        self.index = index
+
+    def null(self):
+        if self.length == len(self.index):
+            self._grow()
+        self.index[self.length] = -1
+        self.length += 1
+
+    def valid(self):
+        if self.length == len(self.index):
+            self._grow()
+        self.index[self.length] = self.content.length
+        self.length += 1
+"""
+
+record_node = """
+class RecordNode(object):
+    def __init__(self, {fields}):
+{assignments}
+        self.length = 0
+
+    def begin_record(self):
+        pass
+
+    def end_record(self):
+        self.length += 1
+"""
+
+record_methods = ("length", "begin_record", "end_record")
+
+numpy_aliases = {
+    "b": ("boolean",),
+    "i": ("integer",),
+    "u": ("integer",),
+    "f": ("integer", "real"),
+    "c": ("integer", "real", "complex"),
+}
+
+
+def attribute_names(form):
+    if isinstance(form["contents"], dict):
+        names = list(form["contents"])
+        for name in names:
+            if (
+                re.match(r"^[A-Za-z][A-Za-z0-9_]*$", name) is None
+                or keyword.iskeyword(name)
+                or name in record_methods
+            ):
+                raise ValueError(
+                    "TypedArrayBuilder record fields must be Python identifiers "
+                    "that do not start with an underscore and are not {0}, not "
+                    "{1}".format(", ".join(record_methods), repr(name))
+                    + ak._util.exception_suffix(__file__)
+                )
+        return names
+    else:
+        return ["slot{0}".format(i) for i in range(len(form["contents"]))]
+
+
+def generate(form, numba):
+    """
+    Assigns a `form_key` to each node of the (JSON) `form` and returns the
+    class of its builder and a function that makes one from an initial
+    buffer size and a resize factor.
+    """
+    number = [0]
+
+    def make_class(source, name, spec):
+        namespace = {"numpy": numpy}
+        exec(source, namespace)
+        cls = namespace[name]
+        if numba is not None:
+            cls = numba.experimental.jitclass(spec)(cls)
+        return cls
+
+    def recurse(form):
+        form["form_key"] = "node{0}".format(number[0])
+        number[0] += 1
+        cls = form["class"]
+
+        if cls == "NumpyArray":
+            if len(form["inner_shape"]) != 0:
+                raise TypeError(
+                    "TypedArrayBuilder cannot build multidimensional NumpyArrays"
+                    + ak._util.exception_suffix(__file__)
+                )
+            dtype = numpy.dtype(form["primitive"])
+            aliases = numpy_aliases.get(dtype.kind)
+            if aliases is None:
+                raise TypeError(
+                    "TypedArrayBuilder cannot build arrays of {0}".format(
+                        form["primitive"]
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            source = numpy_node.format(
+                dtype="bool_" if dtype.kind == "b" else dtype.name,
+                aliases="".join(numpy_node_alias.format(name=x) for x in aliases),
+            )
+            spec = None
+            if numba is not None:
+                spec = [
+                    ("data", numba.from_dtype(dtype)[:]),
+                    ("length", numba.int64),
+                    ("resize", numba.float64),
+                ]
+            node = make_class(source, "NumpyNode", spec)
+            return node, lambda initial, resize: node(
+                numpy.empty(initial, dtype), resize
+            )
+
+        elif cls.startswith("ListArray") or cls.startswith("ListOffsetArray"):
+            form["class"] = "ListOffsetArray64"
+            form["offsets"] = "i64"
+            form.pop("starts", None)
+            form.pop("stops", None)
+            content, make_content = recurse(form["content"])
+            spec = None
+            if numba is not None:
+                spec = [
+                    ("offsets", numba.int64[:]),
+                    ("length", numba.int64),
+                    ("content", content.class_type.instance_type),
+                    ("resize", numba.float64),
+                ]
+            node = make_class(list_node, "ListNode", spec)
+            return node, lambda initial, resize: node(
+                numpy.empty(initial + 1, np.int64),
+                make_content(initial, resize),
+                resize,
+            )
+
+        elif cls.startswith("IndexedOptionArray"):
+            form["class"] = "IndexedOptionArray64"
+            form["index"] = "i64"
+            content, make_content = recurse(form["content"])
+            spec = None
+            if numba is not None:
+                spec = [
+                    ("index", numba.int64[:]),
+                    ("length", numba.int64),
+                    ("content", content.class_type.instance_type),
+                    ("resize", numba.float64),
+                ]
+            node = make_class(option_node, "OptionNode", spec)
+            return node, lambda initial, resize: node(
+                numpy.empty(initial, np.int64), make_content(initial, resize), resize
+            )
+
+        elif cls == "RecordArray":
+            names = attribute_names(form)
+            if isinstance(form["contents"], dict):
+                contents = [recurse(form["contents"][x]) for x in names]
+            else:
+                contents = [recurse(x) for x in form["contents"]]
+            source = record_node.format(
+                fields=", ".join(names),
+                assignments="\n".join(
+                    "        self.{0} = {0}".format(x) for x in names
+                ),
+            )
+            spec = None
+            if numba is not None:
+                spec = [("length", numba.int64)] + [
+                    (name, content.class_type.instance_type)
+                    for name, (content, make_content) in zip(names, contents)
+                ]
+            node = make_class(source, "RecordNode", spec)
+            return node, lambda initial, resize: node(
+                *[make_content(initial, resize) for content, make_content in contents]
+            )
+
+        else:
+            raise TypeError(
+                "TypedArrayBuilder cannot build {0}".format(cls)
+                + ak._util.exception_suffix(__file__)
+            )
+
+    return recurse(form)
+
+
+def import_numba():
+    try:
+        import numba
+        import numba.experimental
+    except ImportError:
+        return None
+    else:
+        ak._connect._numba.register_and_check()
+        return numba
+
+
+def buffers(form, node, container):
+    key = form["form_key"]
+    cls = form["class"]
+    if cls == "NumpyArray":
+        container[key + "-data"] = node.data[: node.length]
+    elif cls == "ListOffsetArray64":
+        container[key + "-offsets"] = node.offsets[: node.length + 1]
+        buffers(form["content"], node.content, container)
+    elif cls == "IndexedOptionArray64":
+        container[key + "-index"] = node.index[: node.length]
+        buffers(form["content"], node.content, container)
+    elif cls == "RecordArray":
+        if isinstance(form["contents"], dict):
+            for name, content in form["contents"].items():
+                buffers(content, getattr(node, name), container)
+        else:
+            for i, content in enumerate(form["contents"]):
+                buffers(content, getattr(node, "slot{0}".format(i)), container)
+
+
+class TypedArrayBuilder(object):
+    """
+    Args:
+        form (#ak.forms.Form or str/dict equivalent): The Form of the arrays
+            to build.
+        behavior (None or dict): Custom #ak.behavior for arrays built by
+            this TypedArrayBuilder.
+        initial (int): Initial number of items in each buffer.
+        resize (float): Resize multiplier for buffers; should be strictly
+            greater than 1.
+
+    Builds arrays of a fixed type, given as a Form, with a tree of nodes that
+    each fill one buffer. Unlike #ak.ArrayBuilder, which discovers the type
+    of its data as it goes, every append goes directly to the buffer of the
+    node it is called on, so in a Numba-compiled function, appending a number
+    is an array assignment (and an occasional resize).
+
+    The nodes mirror the Form:
+
+       * NumpyArray: `append(x)`, as well as `boolean(x)`, `integer(x)`,
+         and `real(x)`, as appropriate for its dtype.
+       * ListOffsetArray (or ListArray): `begin_list()`, `end_list()`, and
+         its `content` node.
+       * IndexedOptionArray: `null()` for a missing value, or `valid()`
+         before filling its `content` node with a value.
+       * RecordArray: `begin_record()`, `end_record()`, and a node for each
+         field, as an attribute of the same name (or `slot0`, `slot1`, etc.
+         for tuples).
+
+    For example,
+
+        >>> builder = ak.TypedArrayBuilder('''{
+        ...     "class": "ListOffsetArray64",
+        ...     "offsets": "i64",
+        ...     "content": {
+        ...         "class": "RecordArray",
+        ...         "contents": {"x": "float64", "y": "int64"}
+        ...     }
+        ... }''')
+        >>> particles = builder.root.content
+        >>> for event in [[(1.1, 1), (2.2, 2)], [], [(3.3, 3)]]:
+        ...     builder.root.begin_list()
+        ...     for x, y in event:
+        ...         particles.begin_record()
+        ...         particles.x.real(x)
+        ...         particles.y.integer(y)
+        ...         particles.end_record()
+        ...     builder.root.end_list()
+        ...
+        >>> builder.snapshot()
+        <Array [[{x: 1.1, y: 1}, ... [{x: 3.3, y: 3}]] type='3 * var * {"x": float64...'>
+
+    Every node's `length` is the number of items it has been given, and the
+    #snapshot is as long as the #root node. Lists and options take the
+    lengths of their contents when `end_list` and `valid` are called.
+
+    If Numba is installed, the nodes are
+    [jitclasses](https://numba.pydata.org/numba-doc/latest/user/jitclass.html),
+    so the #root can be passed to a Numba-compiled function:
+
+        >>> @nb.njit
+        ... def fill(root, events):
+        ...     for event in events:
+        ...         root.begin_list()
+        ...         for particle in event:
+        ...             root.content.begin_record()
+        ...             root.content.x.real(particle.x)
+        ...             root.content.y.integer(particle.y)
+        ...             root.content.end_record()
+        ...         root.end_list()
+        ...
+        >>> fill(builder.root, events)
+
+    (Pass the #root, not the TypedArrayBuilder itself.) Otherwise, they are
+    ordinary Python classes.
+
+    The arrays are made by #ak.from_buffers, so they have the Form of this
+    TypedArrayBuilder, except that all list offsets and option indexes are
+    64-bit, and ListArrays become ListOffsetArrays.
+    """
+
+    _generated = {}
+
+    def __init__(self, form, behavior=None, initial=1024, resize=1.5):
+        if isinstance(form, ak.forms.Form):
+            form = form.tojson(False, True)
+        elif isinstance(form, dict):
+            form = json.dumps(form)
+        form = ak.forms.Form.fromjson(form).tojson(False, True)
+        if initial < 1:
+            raise ValueError(
+                "initial must be at least 1" + ak._util.exception_suffix(__file__)
+            )
+        if not resize > 1:
+            raise ValueError(
+                "resize must be greater than 1" + ak._util.exception_suffix(__file__)
+            )
+
+        numba = import_numba()
+        key = (form, numba is not None)
+        if key not in self._generated:
+            keyed = json.loads(form)
+            node, make = generate(keyed, numba)
+            self._generated[key] = (keyed, make)
+        self._form, make = self._generated[key]
+        self._root = make(initial, float(resize))
+        self._behavior = behavior
+
+    @property
+    def form(self):
+        """
+        The Form of the arrays this TypedArrayBuilder makes, with a
+        `form_key` for each node.
+        """
+        return ak.forms.Form.fromjson(json.dumps(self._form))
+
+    @property
+    def root(self):
+        """
+        The node for the outermost level of the Form; see #ak.TypedArrayBuilder.
+        """
+        return self._root
+
+    def __len__(self):
+        return self._root.length
+
+    def __repr__(self):
+        return "<TypedArrayBuilder of length {0} type={1}>".format(
+            len(self), repr(str(self.form.type(ak._util.typestrs(self._behavior))))
+        )
+
+    def snapshot(self, highlevel=True):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+
+        Converts the currently accumulated data into an #ak.Array.
+
+        The buffers are shared, not copied, and continuing to fill this
+        TypedArrayBuilder does not change the arrays it has returned.
+        """
+        container = {}
+        buffers(self._form, self._root, container)
+        return ak.operations.convert.from_buffers(
+            self.form,
+            len(self),
+            container,
+            key_format="{form_key}-{attribute}",
+            highlevel=highlevel,
+            behavior=self._behavior,
+        )
@@ -5,6 +5,7 @@ from __future__ import absolute_import
 import re
 import sys
 import os
+import threading
 import warnings
 
 try:
@@ -111,6 +112,7 @@ class Behavior(Mapping):
             self.overrides = {}
         else:
             self.overrides = overrides
+        self._overload_keys = None
 
     def __getitem__(self, where):
         try:
@@ -135,10 +137,95 @@ class Behavior(Mapping):
     def __len__(self):
         return len(set(self.defaults) | set(self.overrides))
 
+    def _overload_index(self):
+        if self._overload_keys is None:
+            index = {}
+            for i, key in enumerate(self):
+                if isinstance(key, tuple) and len(key) != 0:
+                    exact, inexact = index.setdefault((key[0], len(key)), ({}, []))
+                    if any(isinstance(k, type) for k in key[1:]):
+                        inexact.append((i, key))
+                    elif key[1:] not in exact:
+                        exact[key[1:]] = (i, key)
+            self._overload_keys = index
+        return self._overload_keys
+
+    def has_overloads(self, name, length):
+        """
+        Returns True if any key has length `length` and starts with `name`.
+        """
+        return (name, length) in self._overload_index()
+
+    def overload_keys(self, signature):
+        """
+        Returns the keys that might be overloads for `signature` (a tuple of
+        a ufunc and the types of its arguments), in the order of #items.
+
+        Keys with the same length and first item as `signature` are indexed
+        the first time this is called: those of only names and dtypes are
+        found by a dict lookup; those with classes, which also match
+        subclasses, are returned if they precede it.
+        """
+        found = self._overload_index().get((signature[0], len(signature)))
+        if found is None:
+            return []
+        exact, inexact = found
+        i, key = exact.get(tuple(signature[1:]), (None, None))
+        out = [k for j, k in inexact if i is None or j < i]
+        if key is not None:
+            out.append(key)
+        return out
+
+
+_chained_behaviors = {}
+
+
+def keys_fingerprint(mapping):
+    """
+    Returns the number of keys in `mapping` and, for a dict in Python 3.8 or
+    later, the last key inserted (which changes when a key is swapped for
+    another), as a check for added or removed keys that takes constant time.
+    """
+    if len(mapping) == 0 or not isinstance(mapping, dict):
+        return (len(mapping), None)
+    try:
+        return (len(mapping), next(reversed(mapping)))
+    except TypeError:
+        return (len(mapping), None)
+
+
+def chained_behavior(behavior):
+    """
+    Returns the #Behavior of `ak.behavior` overridden by `behavior`.
+
+    The #Behavior (and the index it builds for #overload) is reused by later
+    calls as long as neither dict has gained or lost keys, which is checked
+    by their number and most recently inserted key; values are always looked
+    up in the dicts themselves, so replacing a value takes effect immediately.
+    """
+    defaults = ak.behavior
+    cachekey = (id(defaults), id(behavior))
+    fingerprint = (
+        keys_fingerprint(defaults),
+        keys_fingerprint({} if behavior is None else behavior),
+    )
+    cached = _chained_behaviors.get(cachekey)
+    if cached is not None:
+        out, oldfingerprint = cached
+        if out.defaults is defaults and fingerprint == oldfingerprint:
+            return out
+
+    out = Behavior(defaults, behavior)
+    if len(_chained_behaviors) >= 64:
+        _chained_behaviors.clear()
+    # the entry holds references to both dicts, so their ids are not reused
+    _chained_behaviors[cachekey] = (out, fingerprint)
+    return out
+
 
 def arrayclass(layout, behavior):
     layout = ak.partition.first(layout)
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     arr = layout.parameter("__array__")
     if isinstance(arr, str) or (py27 and isinstance(arr, unicode)):
         cls = behavior[arr]
@@ -159,26 +246,19 @@ def arrayclass(layout, behavior):
 
 def custom_broadcast(layout, behavior):
     layout = ak.partition.first(layout)
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     custom = layout.parameter("__array__")
     if not (isinstance(custom, str) or (py27 and isinstance(custom, unicode))):
         custom = layout.parameter("__record__")
     if not (isinstance(custom, str) or (py27 and isinstance(custom, unicode))):
         custom = layout.purelist_parameter("__record__")
     if isinstance(custom, str) or (py27 and isinstance(custom, unicode)):
-        for key, fcn in behavior.items():
-            if (
-                isinstance(key, tuple)
-                and len(key) == 2
-                and key[0] == "__broadcast__"
-                and key[1] == custom
-            ):
-                return fcn
+        return behavior["__broadcast__", custom]
     return None
 
 
 def numba_array_typer(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     arr = layouttype.parameters.get("__array__")
     if isinstance(arr, str) or (py27 and isinstance(arr, unicode)):
         typer = behavior["__numba_typer__", arr]
@@ -198,7 +278,7 @@ def numba_array_typer(layouttype, behavior):
 
 
 def numba_array_lower(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     arr = layouttype.parameters.get("__array__")
     if isinstance(arr, str) or (py27 and isinstance(arr, unicode)):
         lower = behavior["__numba_lower__", arr]
@@ -219,7 +299,7 @@ def numba_array_lower(layouttype, behavior):
 
 def recordclass(layout, behavior):
     layout = ak.partition.first(layout)
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     rec = layout.parameter("__record__")
     if isinstance(rec, str) or (py27 and isinstance(rec, unicode)):
         cls = behavior[rec]
@@ -229,7 +309,7 @@ def recordclass(layout, behavior):
 
 
 def typestrs(behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     out = {}
     for key, typestr in behavior.items():
         if (
@@ -244,7 +324,7 @@ def typestrs(behavior):
 
 
 def numba_record_typer(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     rec = layouttype.parameters.get("__record__")
     if isinstance(rec, str) or (py27 and isinstance(rec, unicode)):
         typer = behavior["__numba_typer__", rec]
@@ -254,7 +334,7 @@ def numba_record_typer(layouttype, behavior):
 
 
 def numba_record_lower(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     rec = layouttype.parameters.get("__record__")
     if isinstance(rec, str) or (py27 and isinstance(rec, unicode)):
         lower = behavior["__numba_lower__", rec]
@@ -265,25 +345,18 @@ def numba_record_lower(layouttype, behavior):
 
 def overload(behavior, signature):
     if not any(s is None for s in signature):
-        behavior = Behavior(ak.behavior, behavior)
-        for key, custom in behavior.items():
-            if (
-                isinstance(key, tuple)
-                and len(key) == len(signature)
-                and key[0] == signature[0]
-                and all(
-                    k == s
-                    or (
-                        isinstance(k, type) and isinstance(s, type) and issubclass(s, k)
-                    )
-                    for k, s in zip(key[1:], signature[1:])
-                )
+        behavior = chained_behavior(behavior)
+        for key in behavior.overload_keys(signature):
+            if all(
+                k == s
+                or (isinstance(k, type) and isinstance(s, type) and issubclass(s, k))
+                for k, s in zip(key[1:], signature[1:])
             ):
-                return custom
+                return behavior[key]
 
 
 def numba_attrs(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     rec = layouttype.parameters.get("__record__")
     if isinstance(rec, str) or (py27 and isinstance(rec, unicode)):
         for key, typer in behavior.items():
@@ -298,7 +371,7 @@ def numba_attrs(layouttype, behavior):
 
 
 def numba_methods(layouttype, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     rec = layouttype.parameters.get("__record__")
     if isinstance(rec, str) or (py27 and isinstance(rec, unicode)):
         for key, typer in behavior.items():
@@ -314,7 +387,7 @@ def numba_methods(layouttype, behavior):
 
 
 def numba_unaryops(unaryop, left, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     done = False
 
     if isinstance(left, ak._connect._numba.layout.ContentType):
@@ -336,7 +409,7 @@ def numba_unaryops(unaryop, left, behavior):
 
 
 def numba_binops(binop, left, right, behavior):
-    behavior = Behavior(ak.behavior, behavior)
+    behavior = chained_behavior(behavior)
     done = False
 
     if isinstance(left, ak._connect._numba.layout.ContentType):
@@ -1359,6 +1432,16 @@ def recursive_walk(layout, apply, args=(), depth=1, materialize=False):
         )
 
 
+def cache_mapping(cache):
+    # the MutableMapping that holds a cache's arrays: an ArrayCache only has a
+    # weak reference to its MutableMapping, which must be kept alive; an
+    # LRUArrayCache owns its arrays and is accessed by key itself
+    if isinstance(cache, ak.layout.LRUArrayCache):
+        return cache
+    else:
+        return cache.mutablemapping
+
+
 def find_caches(layout):
     # Both of the implementations below find referentially unique mutablemappings,
     # but the PartitionedArray case is optimized for many unique values (with a set)
@@ -1368,14 +1451,14 @@ def find_caches(layout):
         mutablemappings = []
         for partition in layout.partitions:
             for cache in partition.caches:
-                x = cache.mutablemapping
+                x = cache_mapping(cache)
                 if id(x) not in seen:
                     seen.add(id(x))
                     mutablemappings.append(x)
     else:
         mutablemappings = []
         for cache in layout.caches:
-            x = cache.mutablemapping
+            x = cache_mapping(cache)
             for y in mutablemappings:
                 if x is y:
                     break
@@ -1607,6 +1690,93 @@ def minimally_touching_string(limit_length, layout, behavior):
             )
 
 
+_lru_cache_pattern = re.compile(r"^lru:\s*([0-9]*\.?[0-9]+)\s*([kKMGT]i?B|B)?\s*$")
+_bytes_pattern = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([kKMGT]i?B|B)\s*$")
+_byte_units = {
+    None: 1,
+    "B": 1,
+    "kB": 1000,
+    "KB": 1000,
+    "MB": 1000 ** 2,
+    "GB": 1000 ** 3,
+    "TB": 1000 ** 4,
+    "KiB": 1024,
+    "MiB": 1024 ** 2,
+    "GiB": 1024 ** 3,
+    "TiB": 1024 ** 4,
+}
+
+
+def bytes_from_string(string, name):
+    """
+    Returns the number of bytes in a string like `"64MB"`: a number with a
+    unit (`B`, `kB`, `MB`, `GB`, `TB` or `KiB`, `MiB`, `GiB`, `TiB`). The
+    `name` of the argument is used in the error message.
+    """
+    m = _bytes_pattern.match(string)
+    if m is None or m.group(2) not in _byte_units:
+        raise ValueError(
+            "{0} must be a number of bytes like '64MB', not {1}".format(
+                name, repr(string)
+            )
+            + exception_suffix(__file__)
+        )
+    return int(float(m.group(1)) * _byte_units[m.group(2)])
+
+
+def is_lru_cache_string(cache):
+    return (
+        isinstance(cache, str) or (py27 and isinstance(cache, unicode))
+    ) and cache.startswith("lru:")
+
+
+def lru_cache_from_string(cache):
+    """
+    Creates an #ak.layout.LRUArrayCache from a string like `"lru:4GB"`, which
+    is the budget in bytes with an optional unit (`B`, `kB`, `MB`, `GB`, `TB`
+    or `KiB`, `MiB`, `GiB`, `TiB`).
+    """
+    m = _lru_cache_pattern.match(cache)
+    if m is None or m.group(2) not in _byte_units:
+        raise ValueError(
+            "LRU cache must be specified like 'lru:4GB', not {0}".format(repr(cache))
+            + exception_suffix(__file__)
+        )
+    maxbytes = int(float(m.group(1)) * _byte_units[m.group(2)])
+    return ak.layout.LRUArrayCache(maxbytes)
+
+
+def is_arraycache(cache):
+    return isinstance(cache, (ak.layout.ArrayCache, ak.layout.LRUArrayCache))
+
+
+class Worker(threading.Thread):
+    """
+    Calls `function(*args)` in a daemon thread. #get waits for the thread and
+    returns the result or raises the exception that `function` raised.
+    """
+
+    def __init__(self, function, *args):
+        super(Worker, self).__init__()
+        self.daemon = True
+        self.function = function
+        self.args = args
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self.function(*self.args)
+        except Exception as err:
+            self.error = err
+
+    def get(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 class MappingProxy(MutableMapping):
     """
     A type suitable for use with layout.ArrayCache.
@@ -1643,6 +1813,109 @@ class MappingProxy(MutableMapping):
         return len(self.base)
 
 
+class SharedMemoryContainer(MutableMapping):
+    """
+    A container for #ak.to_buffers and #ak.from_buffers that keeps each
+    buffer in a `multiprocessing.shared_memory.SharedMemory` block (Python 3.8
+    or later). Pickling it only sends the names of the blocks, so a process
+    that unpickles it maps the same memory and #ak.from_buffers does not copy
+    the data.
+
+    The arrays made from this container are views of its memory: do not
+    #close it while they are in use. The process that filled the container
+    should #unlink it when no process needs the data anymore.
+    """
+
+    def __init__(self):
+        self._shared_memory = self._import_shared_memory()
+        self._blocks = {}
+        self._owner = True
+
+    @staticmethod
+    def _import_shared_memory():
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            raise ImportError(
+                "SharedMemoryContainer requires multiprocessing.shared_memory "
+                "(Python 3.8 or later)" + exception_suffix(__file__)
+            )
+        return shared_memory
+
+    def __getstate__(self):
+        return dict(
+            (key, (None if block is None else block.name, nbytes))
+            for key, (block, nbytes) in self._blocks.items()
+        )
+
+    def __setstate__(self, state):
+        self._shared_memory = self._import_shared_memory()
+        self._blocks = {}
+        self._owner = False
+        for key, (name, nbytes) in state.items():
+            if name is None:
+                self._blocks[key] = (None, nbytes)
+            else:
+                block = self._shared_memory.SharedMemory(name=name)
+                self._blocks[key] = (block, nbytes)
+
+    def __repr__(self):
+        return "<SharedMemoryContainer with {0} buffers, {1} bytes>".format(
+            len(self._blocks), sum(nbytes for block, nbytes in self._blocks.values())
+        )
+
+    def __getitem__(self, key):
+        block, nbytes = self._blocks[key]
+        if block is None:
+            return ak.nplike.numpy.empty(0, np.uint8)
+        else:
+            return ak.nplike.numpy.frombuffer(block.buf, np.uint8, count=nbytes)
+
+    def __setitem__(self, key, value):
+        data = ak.nplike.numpy.ascontiguousarray(value).reshape(-1).view(np.uint8)
+        if len(data) == 0:
+            block = None
+        else:
+            block = self._shared_memory.SharedMemory(create=True, size=len(data))
+            view = ak.nplike.numpy.frombuffer(block.buf, np.uint8, count=len(data))
+            view[:] = data
+            del view
+        if key in self._blocks:
+            del self[key]
+        self._blocks[key] = (block, len(data))
+
+    def __delitem__(self, key):
+        block, nbytes = self._blocks.pop(key)
+        if block is not None:
+            block.close()
+            if self._owner:
+                block.unlink()
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def close(self):
+        """
+        Unmaps the shared memory from this process.
+        """
+        for block, nbytes in self._blocks.values():
+            if block is not None:
+                block.close()
+
+    def unlink(self):
+        """
+        Closes and frees the shared memory (for all processes).
+        """
+        self.close()
+        for block, nbytes in self._blocks.values():
+            if block is not None:
+                block.unlink()
+        self._blocks = {}
+
+
 def make_union(tags, index, contents, identities, parameters):
     if isinstance(index, ak.layout.Index32):
         return ak.layout.UnionArray8_32(tags, index, contents, identities, parameters)
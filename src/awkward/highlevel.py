@@ -350,6 +350,7 @@ class Array(
     def behavior(self, behavior):
         if behavior is None or isinstance(behavior, dict):
             self._behavior = behavior
+            self._numbaview = None
         else:
             raise TypeError(
                 "behavior must be None or a dict" + ak._util.exception_suffix(__file__)
@@ -1440,14 +1441,13 @@ class Array(
         See [Numba documentation](https://numba.pydata.org/numba-doc/dev/reference/types.html)
         on types and signatures.
         """
-        import awkward._connect._numba  # noqa: F401
-
-        ak._connect._numba.register_and_check()
         if self._numbaview is None:
+            import awkward._connect._numba  # noqa: F401
+
+            ak._connect._numba.register_and_check()
             self._numbaview = ak._connect._numba.arrayview.ArrayView.fromarray(self)
-        import numba
 
-        return numba.typeof(self._numbaview)
+        return ak._connect._numba.arrayview.typeof_view(self._numbaview)
 
     def __getstate__(self):
         form, length, container = ak.operations.convert.to_buffers(self._layout)
@@ -1664,6 +1664,7 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
     def behavior(self, behavior):
         if behavior is None or isinstance(behavior, dict):
             self._behavior = behavior
+            self._numbaview = None
         else:
             raise TypeError(
                 "behavior must be None or a dict" + ak._util.exception_suffix(__file__)
@@ -2037,14 +2038,13 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
         See [Numba documentation](https://numba.pydata.org/numba-doc/dev/reference/types.html)
         on types and signatures.
         """
-        import awkward._connect._numba  # noqa: F401
-
-        ak._connect._numba.register_and_check()
         if self._numbaview is None:
+            import awkward._connect._numba  # noqa: F401
+
+            ak._connect._numba.register_and_check()
             self._numbaview = ak._connect._numba.arrayview.RecordView.fromrecord(self)
-        import numba
 
-        return numba.typeof(self._numbaview)
+        return ak._connect._numba.arrayview.typeof_view(self._numbaview)
 
     def __getstate__(self):
         form, length, container = ak.operations.convert.to_buffers(self._layout.array)
@@ -2216,6 +2216,7 @@ class ArrayBuilder(Iterable, Sized):
     def __init__(self, behavior=None, initial=1024, resize=1.5):
         self._layout = ak.layout.ArrayBuilder(initial=initial, resize=resize)
         self.behavior = behavior
+        self._batch_start = 0
 
     @classmethod
     def _wrap(cls, layout, behavior=None):
@@ -2236,6 +2237,7 @@ class ArrayBuilder(Iterable, Sized):
         out = cls.__new__(cls)
         out._layout = layout
         out.behavior = behavior
+        out._batch_start = 0
         return out
 
     @property
@@ -2412,6 +2414,43 @@ class ArrayBuilder(Iterable, Sized):
         layout = self._layout.snapshot()
         return ak._util.wrap(layout, self._behavior)
 
+    def snapshot_batch(self):
+        """
+        Converts the data accumulated since the previous call to
+        #snapshot_batch (or since the beginning) into an #ak.Array.
+
+        Like #snapshot, this is almost always an *O(1)* operation: each batch
+        is a zero-copy view of the accumulated data, so the batches share the
+        prefix of data that has already been returned, rather than copying
+        it. It does not scale with the size of the accumulated data or of the
+        batch, so a long-running ArrayBuilder can publish its partial results
+        at a constant cost per batch, for instance as partitions of an
+        #ak.partition.IrregularlyPartitionedArray:
+
+            >>> builder = ak.ArrayBuilder()
+            >>> batches = []
+            >>> for i in range(3):
+            ...     builder.append(i)
+            ...     builder.append(i)
+            ...     batches.append(builder.snapshot_batch())
+            ...
+            >>> batches
+            [<Array [0, 0] type='2 * int64'>, <Array [1, 1] type='2 * int64'>,
+             <Array [2, 2] type='2 * int64'>]
+            >>> ak.partitioned(batches)
+            <Array [0, 0, 1, 1, 2, 2] type='6 * int64'>
+
+        Each batch has the type of the accumulated data when it was taken, so
+        if the type changes (such as integers becoming floating-point numbers),
+        the batches must be converted to a common type before they can be
+        partitions of the same array.
+
+        The calls to #snapshot do not affect the start of the next batch.
+        """
+        layout = self._layout.snapshot()
+        start, self._batch_start = self._batch_start, len(layout)
+        return ak._util.wrap(layout[start:], self._behavior)
+
     def null(self):
         """
         Appends a None value at the current position in the accumulated array.
@@ -52,5 +52,6 @@ from awkward._ext import VirtualArray
 from awkward._ext import ArrayGenerator
 from awkward._ext import SliceGenerator
 from awkward._ext import ArrayCache
+from awkward._ext import LRUArrayCache
 
 from awkward._ext import kernel_lib
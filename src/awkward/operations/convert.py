@@ -5,6 +5,7 @@ from __future__ import absolute_import
 import numbers
 import json
 import collections
+import itertools
 import math
 import os
 import threading
@@ -828,7 +829,13 @@ def to_kernels(array, kernels, highlevel=True, behavior=None):
 
 
 def from_iter(
-    iterable, highlevel=True, behavior=None, allow_record=True, initial=1024, resize=1.5
+    iterable,
+    highlevel=True,
+    behavior=None,
+    allow_record=True,
+    initial=1024,
+    resize=1.5,
+    form=None,
 ):
     """
     Args:
@@ -845,6 +852,9 @@ def from_iter(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, str, or dict): If not None, the expected
+            Form of the output array (or its JSON), which lets the data be
+            converted without #ak.layout.ArrayBuilder (see below).
 
     Converts Python data into an Awkward Array.
 
@@ -870,6 +880,16 @@ def from_iter(
        * iterable, including np.ndarray: converted into
          #ak.layout.ListOffsetArray.
 
+    If the `iterable` is a list whose items all have the same type, such as
+    dicts with the same numeric fields or lists of floats, or if a `form` is
+    given, the data are converted one field or level of nesting at a time:
+    the values of each leaf are collected from all items and converted to a
+    NumPy array in one step, rather than one at a time. Without a `form`,
+    the type is taken from the first items. If an item does not match that
+    type, all of the data are converted with #ak.layout.ArrayBuilder, so the
+    result is the same either way; this does not apply to the `form`, which
+    only determines the result if all of the data match it.
+
     See also #ak.to_list.
     """
     if isinstance(iterable, dict):
@@ -880,22 +900,232 @@ def from_iter(
                 behavior=behavior,
                 initial=initial,
                 resize=resize,
+                form=form,
             )[0]
         else:
             raise ValueError(
                 "cannot produce an array from a dict"
                 + ak._util.exception_suffix(__file__)
             )
-    out = ak.layout.ArrayBuilder(initial=initial, resize=resize)
-    for x in iterable:
-        out.fromiter(x)
-    layout = out.snapshot()
+
+    layout = None
+    if form is not None or isinstance(iterable, list):
+        if not isinstance(iterable, list):
+            iterable = list(iterable)
+        if isinstance(form, str) or (
+            ak._util.py27 and isinstance(form, ak._util.unicode)
+        ):
+            form = ak.forms.Form.fromjson(form)
+        elif isinstance(form, dict):
+            form = ak.forms.Form.fromjson(json.dumps(form))
+        layout = _from_iter_columnar(iterable, form, initial, resize)
+
+    if layout is None:
+        out = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        for x in iterable:
+            out.fromiter(x)
+        layout = out.snapshot()
+
     if highlevel:
         return ak._util.wrap(layout, behavior)
     else:
         return layout
 
 
+# lists of at most this many items are always converted by an ArrayBuilder,
+# which determines the Form of longer lists from their first items
+_from_iter_sample_size = 64
+
+
+class _FromIterMismatch(Exception):
+    pass
+
+
+def _from_iter_columnar(items, form, initial, resize):
+    # returns None if the items do not match the form
+    if form is None:
+        builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        for x in items[:_from_iter_sample_size]:
+            builder.fromiter(x)
+        if len(items) <= _from_iter_sample_size:
+            return builder.snapshot()
+        form = builder.snapshot().form
+    try:
+        return _from_iter_layout(form, items)
+    except _FromIterMismatch:
+        return None
+
+
+_from_iter_booleans = (bool, np.bool_)
+_from_iter_integers = (numbers.Integral,)
+_from_iter_reals = (numbers.Real,)
+if ak._util.py27:
+    _from_iter_strings = (ak._util.unicode,)
+else:
+    _from_iter_strings = (str,)
+
+
+def _from_iter_require(items, allowed):
+    # checks each distinct type, rather than each item; booleans are only
+    # allowed where they are asked for, although bool is an int
+    for t in set(map(type, items)):
+        if not issubclass(t, allowed) or (
+            issubclass(t, _from_iter_booleans) and allowed is not _from_iter_booleans
+        ):
+            raise _FromIterMismatch()
+
+
+def _from_iter_index(form_index, array):
+    if form_index == "i32":
+        if len(array) != 0 and array.max() > np.iinfo(np.int32).max:
+            raise _FromIterMismatch()
+        return ak.layout.Index32(array.astype(np.int32))
+    elif form_index == "u32":
+        if len(array) != 0 and array.max() > np.iinfo(np.uint32).max:
+            raise _FromIterMismatch()
+        return ak.layout.IndexU32(array.astype(np.uint32))
+    elif form_index == "i64":
+        return ak.layout.Index64(array)
+    else:
+        raise _FromIterMismatch()
+
+
+def _from_iter_layout(form, items):
+    parameters = form.parameters
+
+    if isinstance(form, ak.forms.NumpyForm):
+        if len(form.inner_shape) != 0:
+            raise _FromIterMismatch()
+        try:
+            dtype = np.dtype(form.primitive)
+            if dtype.kind == "b":
+                _from_iter_require(items, _from_iter_booleans)
+                data = numpy.array(items, dtype=dtype)
+            elif dtype.kind in "iu":
+                _from_iter_require(items, _from_iter_integers)
+                data = numpy.array(items, dtype=np.int64)
+                if dtype != np.int64 and len(data) != 0:
+                    info = np.iinfo(dtype)
+                    if data.min() < info.min or data.max() > info.max:
+                        raise _FromIterMismatch()
+                    data = data.astype(dtype)
+            elif dtype.kind == "f":
+                _from_iter_require(items, _from_iter_reals)
+                data = numpy.array(items, dtype=dtype)
+            else:
+                raise _FromIterMismatch()
+        except (OverflowError, TypeError, ValueError):
+            raise _FromIterMismatch()
+        return ak.layout.NumpyArray(data, parameters=parameters)
+
+    elif isinstance(
+        form, (ak.forms.ListOffsetForm, ak.forms.ListForm, ak.forms.RegularForm)
+    ):
+        if form.parameter("__array__") in ("string", "bytestring"):
+            if form.parameter("__array__") == "string":
+                _from_iter_require(items, _from_iter_strings)
+                try:
+                    items = [x.encode("utf-8") for x in items]
+                except UnicodeEncodeError:
+                    raise _FromIterMismatch()
+            else:
+                _from_iter_require(items, (bytes,))
+            if not (
+                isinstance(form.content, ak.forms.NumpyForm)
+                and form.content.primitive == "uint8"
+            ):
+                raise _FromIterMismatch()
+            content = ak.layout.NumpyArray(
+                numpy.frombuffer(b"".join(items), np.uint8),
+                parameters=form.content.parameters,
+            )
+        else:
+            _from_iter_require(items, (list,))
+            content = _from_iter_layout(
+                form.content, list(itertools.chain.from_iterable(items))
+            )
+        counts = numpy.array(list(map(len, items)), np.int64)
+
+        if isinstance(form, ak.forms.RegularForm):
+            if not (counts == form.size).all():
+                raise _FromIterMismatch()
+            return ak.layout.RegularArray(
+                content, form.size, len(items), parameters=parameters
+            )
+
+        offsets = numpy.empty(len(items) + 1, np.int64)
+        offsets[0] = 0
+        numpy.cumsum(counts, out=offsets[1:])
+        if isinstance(form, ak.forms.ListOffsetForm):
+            offsets = _from_iter_index(form.offsets, offsets)
+            cls = {
+                ak.layout.Index32: ak.layout.ListOffsetArray32,
+                ak.layout.IndexU32: ak.layout.ListOffsetArrayU32,
+                ak.layout.Index64: ak.layout.ListOffsetArray64,
+            }[type(offsets)]
+            return cls(offsets, content, parameters=parameters)
+        else:
+            starts = _from_iter_index(form.starts, offsets[:-1])
+            stops = _from_iter_index(form.stops, offsets[1:])
+            cls = {
+                ak.layout.Index32: ak.layout.ListArray32,
+                ak.layout.IndexU32: ak.layout.ListArrayU32,
+                ak.layout.Index64: ak.layout.ListArray64,
+            }[type(starts)]
+            return cls(starts, stops, content, parameters=parameters)
+
+    elif isinstance(form, ak.forms.RecordForm):
+        if form.istuple:
+            _from_iter_require(items, (tuple,))
+        else:
+            _from_iter_require(items, (dict,))
+        if len(items) != 0 and set(map(len, items)) != set([form.numfields]):
+            raise _FromIterMismatch()
+        contents = []
+        for i in range(form.numfields):
+            if form.istuple:
+                field = [x[i] for x in items]
+            else:
+                key = form.key(i)
+                try:
+                    field = [x[key] for x in items]
+                except KeyError:
+                    raise _FromIterMismatch()
+            contents.append(_from_iter_layout(form.content(i), field))
+        if form.istuple:
+            keys = None
+        else:
+            keys = form.keys()
+        return ak.layout.RecordArray(contents, keys, len(items), parameters=parameters)
+
+    elif isinstance(form, ak.forms.IndexedOptionForm):
+        missing = numpy.array([x is None for x in items], np.bool_)
+        valid = [x for x in items if x is not None]
+        index = numpy.full(len(items), -1, np.int64)
+        index[~missing] = numpy.arange(len(valid))
+        index = _from_iter_index(form.index, index)
+        if isinstance(index, ak.layout.IndexU32):
+            raise _FromIterMismatch()
+        cls = {
+            ak.layout.Index32: ak.layout.IndexedOptionArray32,
+            ak.layout.Index64: ak.layout.IndexedOptionArray64,
+        }[type(index)]
+        return cls(index, _from_iter_layout(form.content, valid), parameters=parameters)
+
+    elif isinstance(form, ak.forms.UnmaskedForm):
+        return ak.layout.UnmaskedArray(
+            _from_iter_layout(form.content, items), parameters=parameters
+        )
+
+    elif isinstance(form, ak.forms.EmptyForm):
+        if len(items) != 0:
+            raise _FromIterMismatch()
+        return ak.layout.EmptyArray(parameters=parameters)
+
+    else:
+        raise _FromIterMismatch()
+
+
 def to_list(array):
     """
     Converts `array` (many types supported, including all Awkward Arrays and
@@ -940,7 +1170,7 @@ def to_list(array):
         return ak.behaviors.string.CharBehavior(array).__str__()
 
     elif isinstance(array, ak.highlevel.Array):
-        return [to_list(x) for x in array]
+        return _layout_to_list(array.layout)
 
     elif isinstance(array, ak.highlevel.Record):
         return to_list(array.layout)
@@ -955,13 +1185,10 @@ def to_list(array):
         return {n: to_list(x) for n, x in array.fielditems()}
 
     elif isinstance(array, ak.layout.ArrayBuilder):
-        return [to_list(x) for x in array.snapshot()]
-
-    elif isinstance(array, ak.layout.NumpyArray):
-        return ak.nplike.of(array).asarray(array).tolist()
+        return _layout_to_list(array.snapshot())
 
     elif isinstance(array, (ak.layout.Content, ak.partition.PartitionedArray)):
-        return [to_list(x) for x in array]
+        return _layout_to_list(array)
 
     elif isinstance(array, dict):
         return dict((n, to_list(x)) for n, x in array.items())
@@ -976,6 +1203,102 @@ def to_list(array):
         )
 
 
+def _form_to_json_schema(form):
+    num_form_keys = [0]
+
+    def recurse(form):
+        if isinstance(form, ak.forms.VirtualForm):
+            if form.form is None:
+                raise TypeError(
+                    "VirtualForm without a Form cannot be used to read JSON"
+                    + ak._util.exception_suffix(__file__)
+                )
+            return recurse(form.form)
+
+        if form.has_identities:
+            raise NotImplementedError(
+                "ak.from_json with a form that has Identities"
+                + ak._util.exception_suffix(__file__)
+            )
+
+        parameters = form.parameters
+        form_key = "node{0}".format(num_form_keys[0])
+        num_form_keys[0] += 1
+
+        if isinstance(form, ak.forms.NumpyForm):
+            out = ak.forms.NumpyForm(
+                [],
+                form.itemsize,
+                form.format,
+                parameters=parameters,
+                form_key=form_key,
+            )
+            for size in form.inner_shape[::-1]:
+                out = ak.forms.RegularForm(
+                    out, size, form_key="node{0}".format(num_form_keys[0])
+                )
+                num_form_keys[0] += 1
+            return out
+
+        elif isinstance(form, (ak.forms.ListForm, ak.forms.ListOffsetForm)):
+            return ak.forms.ListOffsetForm(
+                "i64",
+                recurse(form.content),
+                parameters=parameters,
+                form_key=form_key,
+            )
+
+        elif isinstance(form, ak.forms.RegularForm):
+            return ak.forms.RegularForm(
+                recurse(form.content),
+                form.size,
+                parameters=parameters,
+                form_key=form_key,
+            )
+
+        elif isinstance(form, ak.forms.RecordForm):
+            if form.istuple:
+                raise TypeError(
+                    "RecordForm without field names (tuples) cannot be used "
+                    "to read JSON" + ak._util.exception_suffix(__file__)
+                )
+            keys = form.keys()
+            contents = [recurse(form.content(i)) for i in range(len(keys))]
+            return ak.forms.RecordForm(
+                contents,
+                keys,
+                parameters=parameters,
+                form_key=form_key,
+            )
+
+        elif isinstance(
+            form,
+            (
+                ak.forms.IndexedOptionForm,
+                ak.forms.ByteMaskedForm,
+                ak.forms.BitMaskedForm,
+                ak.forms.UnmaskedForm,
+            ),
+        ):
+            return ak.forms.IndexedOptionForm(
+                "i64",
+                recurse(form.content),
+                parameters=parameters,
+                form_key=form_key,
+            )
+
+        elif isinstance(form, ak.forms.EmptyForm):
+            return ak.forms.EmptyForm(parameters=parameters, form_key=form_key)
+
+        else:
+            raise TypeError(
+                "{0} cannot be used to read JSON".format(type(form).__name__)
+                + ak._util.exception_suffix(__file__)
+            )
+
+    return recurse(form)
+
+
 def from_json(
     source,
     nan_string=None,
@@ -987,6 +1310,7 @@ def from_json(
     initial=1024,
     resize=1.5,
     buffersize=65536,
+    form=None,
 ):
     """
     Args:
@@ -1010,6 +1334,10 @@ def from_json(
             should be strictly greater than 1.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
             parser.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            known Form of the items in the output array; the data are read
+            directly into buffers of that type, without discovering types
+            with an #ak.layout.ArrayBuilder.
 
     Converts a JSON string into an Awkward Array.
 
@@ -1019,6 +1347,33 @@ def from_json(
     and deeply nested JSON can be converted, but the output will never have
     regular-typed array lengths.
 
+    If a `form` is given, the JSON is instead read into preallocated buffers
+    of exactly that type and assembled with #ak.from_buffers. This avoids
+    type discovery and promotion (e.g. integers to floating-point), but any
+    value that does not conform to the `form`, such as a record with an
+    unexpected or missing field, raises an error. The following nodes are
+    supported:
+
+       * #ak.forms.NumpyForm of booleans, integers, and floating-point numbers
+         (JSON integers are accepted by floating-point types, and an
+         `inner_shape` is read as nested #ak.forms.RegularForm);
+       * #ak.forms.ListOffsetForm and #ak.forms.ListForm, including strings
+         (the output always has 64-bit offsets);
+       * #ak.forms.RegularForm, which requires lists of exactly `size` items;
+       * #ak.forms.RecordForm with field names (missing fields are only
+         allowed if they are option-type);
+       * #ak.forms.IndexedOptionForm, #ak.forms.ByteMaskedForm,
+         #ak.forms.BitMaskedForm, and #ak.forms.UnmaskedForm (the output is
+         always an #ak.layout.IndexedOptionArray64);
+       * #ak.forms.EmptyForm, which only allows empty lists;
+       * #ak.forms.VirtualForm, which is read as its underlying Form.
+
+    The `form` describes each item of the output array, and the JSON may be
+    either a single array of items or a sequence of items (such as JSON
+    Lines). As without a `form`, if the JSON contains exactly one top-level
+    value that is not an array of items, that value is returned, rather than
+    an array of length 1.
+
     See also #ak.to_json.
     """
 
@@ -1033,7 +1388,48 @@ def from_json(
     ):
         complex_real_string, complex_imag_string = complex_record_fields
 
-    if os.path.isfile(source):
+    if form is not None:
+        if isinstance(form, str) or (
+            ak._util.py27 and isinstance(form, ak._util.unicode)
+        ):
+            form = ak.forms.Form.fromjson(form)
+        elif isinstance(form, dict):
+            form = ak.forms.Form.fromjson(json.dumps(form))
+        form = _form_to_json_schema(form)
+
+        if os.path.isfile(source):
+            length, single, container = ak._ext.fromjsonfileschema(
+                source,
+                form,
+                nan_string=nan_string,
+                infinity_string=infinity_string,
+                minus_infinity_string=minus_infinity_string,
+                initial=initial,
+                resize=resize,
+                buffersize=buffersize,
+            )
+        else:
+            length, single, container = ak._ext.fromjsonschema(
+                source,
+                form,
+                nan_string=nan_string,
+                infinity_string=infinity_string,
+                minus_infinity_string=minus_infinity_string,
+                initial=initial,
+                resize=resize,
+            )
+
+        layout = from_buffers(
+            form,
+            length,
+            container,
+            key_format="{form_key}-{attribute}",
+            highlevel=False,
+        )
+        if single:
+            layout = layout[0]
+
+    elif os.path.isfile(source):
         layout = ak._ext.fromjsonfile(
             source,
             nan_string=nan_string,
@@ -1088,6 +1484,475 @@ def from_json(
         return layout
 
 
+def _json_lines(file, buffersize):
+    position = 0
+    remainder = b""
+    while True:
+        chunk = file.read(buffersize)
+        if not isinstance(chunk, bytes):
+            chunk = chunk.encode("utf-8")
+        if len(chunk) == 0:
+            break
+        pieces = (remainder + chunk).split(b"\n")
+        remainder = pieces.pop()
+        for piece in pieces:
+            yield position, piece
+            position += len(piece) + 1
+    if len(remainder) != 0:
+        yield position, remainder
+
+
+def _json_lines_batches(file, batch_size, batch_bytes, buffersize):
+    if batch_size is None and batch_bytes is None:
+        batch_size = 65536
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(
+            "batch_size must be at least 1" + ak._util.exception_suffix(__file__)
+        )
+    if batch_bytes is not None and batch_bytes < 1:
+        raise ValueError(
+            "batch_bytes must be at least 1" + ak._util.exception_suffix(__file__)
+        )
+
+    start, stop, lines, nbytes = None, None, [], 0
+    for position, line in _json_lines(file, buffersize):
+        if len(line.strip()) == 0:
+            continue
+        if start is None:
+            start = position
+        stop = position + len(line)
+        lines.append(line)
+        nbytes += len(line)
+        if (batch_size is not None and len(lines) >= batch_size) or (
+            batch_bytes is not None and nbytes >= batch_bytes
+        ):
+            yield start, stop, lines
+            start, stop, lines, nbytes = None, None, [], 0
+    if len(lines) != 0:
+        yield start, stop, lines
+
+
+def _json_lines_to_layout(lines, options):
+    # an explicit outer array keeps a batch of one line from being unwrapped
+    source = (b"[" + b",".join(lines) + b"]").decode("utf-8")
+    return from_json(source, highlevel=False, **options)
+
+
+def _json_lines_options(
+    nan_string,
+    infinity_string,
+    minus_infinity_string,
+    complex_record_fields,
+    initial,
+    resize,
+    buffersize,
+    form,
+):
+    if isinstance(form, str) or (ak._util.py27 and isinstance(form, ak._util.unicode)):
+        form = ak.forms.Form.fromjson(form)
+    elif isinstance(form, dict):
+        form = ak.forms.Form.fromjson(json.dumps(form))
+    return {
+        "nan_string": nan_string,
+        "infinity_string": infinity_string,
+        "minus_infinity_string": minus_infinity_string,
+        "complex_record_fields": complex_record_fields,
+        "initial": initial,
+        "resize": resize,
+        "buffersize": buffersize,
+        "form": form,
+    }
+
+
+def _json_lines_parallel(batches, options, threads):
+    # at most `threads` batches are held in memory or parsed at a time; each
+    # worker has its own ArrayBuilder and the parser releases the GIL
+    workers = collections.deque()
+    for start, stop, lines in batches:
+        if len(workers) >= threads:
+            yield workers.popleft().get()
+        worker = ak._util.Worker(_json_lines_to_layout, lines, options)
+        worker.start()
+        workers.append(worker)
+    while len(workers) != 0:
+        yield workers.popleft().get()
+
+
+def iter_json_lines(
+    source,
+    batch_size=None,
+    batch_bytes=None,
+    threads=None,
+    nan_string=None,
+    infinity_string=None,
+    minus_infinity_string=None,
+    complex_record_fields=None,
+    highlevel=True,
+    behavior=None,
+    initial=1024,
+    resize=1.5,
+    buffersize=65536,
+    form=None,
+):
+    """
+    Args:
+        source (str or file-like object): Name of a JSON Lines file or a file
+            object (opened in binary or text mode) to read from.
+        batch_size (None or int): Maximum number of records (lines) in each
+            batch.
+        batch_bytes (None or int): Approximate maximum number of bytes in each
+            batch; a batch is yielded as soon as its lines reach this size, so
+            it may exceed `batch_bytes` by at most one line. If both
+            `batch_size` and `batch_bytes` are None, batches have 65536
+            records.
+        threads (None or int): If greater than 1, parse up to this many
+            batches concurrently, each in its own thread.
+        nan_string (None or str): If not None, strings with this value will be
+            interpreted as floating-point NaN values.
+        infinity_string (None or str): If not None, strings with this value will
+            be interpreted as floating-point positive infinity values.
+        minus_infinity_string (None or str): If not None, strings with this value
+            will be interpreted as floating-point negative infinity values.
+        complex_record_fields (None or (str, str)): If not None, defines a pair of
+            field names to interpret records as complex numbers.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
+        buffersize (int): Size (in bytes) of the chunks read from the file
+            and of the buffer used by the JSON parser.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            known Form of each record (see #ak.from_json).
+
+    Reads a newline-delimited JSON (JSON Lines) file in chunks of `buffersize`
+    bytes and yields one array per batch of lines, so that memory use is
+    bounded by the size of a batch, rather than the size of the file. Blank
+    lines are skipped.
+
+    With `threads`, the batches are still yielded in order, and at most
+    `threads` batches are held in memory at a time.
+
+    Each batch is converted with #ak.from_json; without a `form`, the type of
+    each batch is discovered independently, so different batches might have
+    different types. Providing a `form` guarantees that all batches have the
+    same type.
+
+    See also #ak.from_json_lines.
+    """
+    options = _json_lines_options(
+        nan_string,
+        infinity_string,
+        minus_infinity_string,
+        complex_record_fields,
+        initial,
+        resize,
+        buffersize,
+        form,
+    )
+
+    if hasattr(source, "read"):
+        file = source
+        opened = False
+    else:
+        file = open(_regularize_path(source), "rb")
+        opened = True
+
+    batches = _json_lines_batches(file, batch_size, batch_bytes, buffersize)
+    if threads is None or threads <= 1:
+        layouts = (_json_lines_to_layout(lines, options) for _, _, lines in batches)
+    else:
+        layouts = _json_lines_parallel(batches, options, threads)
+
+    try:
+        for layout in layouts:
+            if highlevel:
+                yield ak._util.wrap(layout, behavior)
+            else:
+                yield layout
+    finally:
+        if opened:
+            file.close()
+
+
+_from_json_lines_key_number = 0
+_from_json_lines_key_lock = threading.Lock()
+
+
+def _from_json_lines_key():
+    global _from_json_lines_key_number
+    with _from_json_lines_key_lock:
+        out = _from_json_lines_key_number
+        _from_json_lines_key_number += 1
+    return out
+
+
+class _JsonLinesPartition(object):
+    def __init__(self, filename, options):
+        self.filename = filename
+        self.options = options
+
+    def __call__(self, start, stop):
+        with open(self.filename, "rb") as file:
+            file.seek(start)
+            data = file.read(stop - start)
+        lines = [x for x in data.split(b"\n") if len(x.strip()) != 0]
+        return _json_lines_to_layout(lines, self.options)
+
+
+def from_json_lines(
+    source,
+    batch_size=None,
+    batch_bytes=None,
+    threads=None,
+    lazy=False,
+    lazy_cache="new",
+    lazy_cache_key=None,
+    nan_string=None,
+    infinity_string=None,
+    minus_infinity_string=None,
+    complex_record_fields=None,
+    highlevel=True,
+    behavior=None,
+    initial=1024,
+    resize=1.5,
+    buffersize=65536,
+    form=None,
+):
+    """
+    Args:
+        source (str or file-like object): Name of a JSON Lines file or (if not
+            `lazy`) a file object to read from.
+        batch_size (None or int): Maximum number of records (lines) in each
+            partition.
+        batch_bytes (None or int): Approximate maximum number of bytes in each
+            partition (see #ak.iter_json_lines). If both `batch_size` and
+            `batch_bytes` are None, partitions have 65536 records.
+        threads (None or int): If greater than 1 and not `lazy`, parse up to
+            this many partitions concurrently, each in its own thread.
+        lazy (bool): If True, read the file only to find the byte range and
+            number of records of each partition and create a partitioned
+            array of #ak.layout.VirtualArray that parse their lines on
+            demand; otherwise, parse all partitions immediately.
+        lazy_cache (None, "new", "lru:<size>", or MutableMapping): If lazy,
+            pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created. If a string like "lru:4GB", a new
+            #ak.layout.LRUArrayCache with that budget is created. If None, no
+            cache is used.
+        lazy_cache_key (None or str): If lazy, pass this cache_key to the
+            VirtualArrays. If None, a process-unique string is constructed.
+        nan_string (None or str): If not None, strings with this value will be
+            interpreted as floating-point NaN values.
+        infinity_string (None or str): If not None, strings with this value will
+            be interpreted as floating-point positive infinity values.
+        minus_infinity_string (None or str): If not None, strings with this value
+            will be interpreted as floating-point negative infinity values.
+        complex_record_fields (None or (str, str)): If not None, defines a pair of
+            field names to interpret records as complex numbers.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
+        buffersize (int): Size (in bytes) of the chunks read from the file
+            and of the buffer used by the JSON parser.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            known Form of each record (see #ak.from_json).
+
+    Reads a newline-delimited JSON (JSON Lines) file into an
+    #ak.partition.IrregularlyPartitionedArray with one partition per batch of
+    lines (see #ak.iter_json_lines). If there is only one batch, the array
+    is not partitioned.
+
+    With `lazy=True`, each partition is an #ak.layout.VirtualArray that reads
+    its own byte range of the file, so only the partitions that are accessed
+    are parsed. A `form` should be given in this case; without it, the type
+    of each partition is not known until it is read.
+
+    See also #ak.from_json.
+    """
+    options = _json_lines_options(
+        nan_string,
+        infinity_string,
+        minus_infinity_string,
+        complex_record_fields,
+        initial,
+        resize,
+        buffersize,
+        form,
+    )
+
+    partitions = []
+    stops = []
+    if lazy:
+        if hasattr(source, "read"):
+            raise TypeError(
+                "lazy from_json_lines requires a file name, not a file object"
+                + ak._util.exception_suffix(__file__)
+            )
+        source = _regularize_path(source)
+
+        if ak._util.is_lru_cache_string(lazy_cache):
+            lazy_cache = ak._util.lru_cache_from_string(lazy_cache)
+        elif lazy_cache == "new":
+            hold_cache = ak._util.MappingProxy({})
+            lazy_cache = ak.layout.ArrayCache(hold_cache)
+        elif lazy_cache is not None and not ak._util.is_arraycache(lazy_cache):
+            hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
+            if not isinstance(hold_cache, MutableMapping):
+                raise TypeError("lazy_cache must be a MutableMapping")
+            lazy_cache = ak.layout.ArrayCache(hold_cache)
+
+        if lazy_cache_key is None:
+            lazy_cache_key = "ak.from_json_lines:{0}".format(_from_json_lines_key())
+
+        if options["form"] is None or complex_record_fields is not None:
+            partition_form = None
+        else:
+            partition_form = _form_to_json_schema(options["form"])
+
+        state = _JsonLinesPartition(source, options)
+        with open(source, "rb") as file:
+            for start, stop, lines in _json_lines_batches(
+                file, batch_size, batch_bytes, buffersize
+            ):
+                length = len(lines)
+                generator = ak.layout.ArrayGenerator(
+                    state, (start, stop), length=length, form=partition_form
+                )
+                if lazy_cache is None:
+                    cache_key = None
+                else:
+                    cache_key = "{0}[{1}]".format(lazy_cache_key, len(partitions))
+                partitions.append(
+                    ak.layout.VirtualArray(generator, lazy_cache, cache_key)
+                )
+                stops.append(length if len(stops) == 0 else stops[-1] + length)
+
+    else:
+        for partition in iter_json_lines(
+            source,
+            batch_size=batch_size,
+            batch_bytes=batch_bytes,
+            threads=threads,
+            highlevel=False,
+            **options
+        ):
+            partitions.append(partition)
+            stops.append(
+                len(partition) if len(stops) == 0 else stops[-1] + len(partition)
+            )
+
+    if len(partitions) == 0:
+        out = ak.layout.EmptyArray()
+    elif len(partitions) == 1:
+        out = partitions[0]
+    else:
+        out = ak.partition.IrregularlyPartitionedArray(partitions, stops)
+    if highlevel:
+        return ak._util.wrap(out, behavior)
+    else:
+        return out
+
+
+def _layout_to_list(layout):
+    # converts each node of the layout as a whole, rather than each element;
+    # nodes that can repeat items (indexes, unions, overlapping lists) are
+    # projected first so that no two items share a Python list or dict
+    if isinstance(layout, ak.partition.PartitionedArray):
+        out = []
+        for partition in layout.partitions:
+            out.extend(_layout_to_list(partition))
+        return out
+
+    elif isinstance(layout, ak.layout.VirtualArray):
+        return _layout_to_list(layout.array)
+
+    elif isinstance(layout, ak.layout.NumpyArray):
+        return ak.nplike.of(layout).asarray(layout).tolist()
+
+    elif isinstance(layout, ak.layout.EmptyArray):
+        return []
+
+    elif isinstance(layout, ak._util.listtypes):
+        if isinstance(layout, ak.layout.RegularArray):
+            starts = [i * layout.size for i in range(len(layout))]
+            stops = [i + layout.size for i in starts]
+            content = layout.content[: len(layout) * layout.size]
+        else:
+            if isinstance(
+                layout,
+                (ak.layout.ListArray32, ak.layout.ListArrayU32, ak.layout.ListArray64),
+            ):
+                layout = layout.toListOffsetArray64(True)
+            offsets = ak.nplike.of(layout).asarray(layout.offsets)
+            content = layout.content[offsets[0] : offsets[-1]]
+            offsets = offsets - offsets[0]
+            starts = offsets[:-1].tolist()
+            stops = offsets[1:].tolist()
+
+        if layout.parameter("__array__") in ("string", "bytestring"):
+            data = ak.nplike.of(content).asarray(content)
+            if layout.parameter("__array__") == "bytestring":
+                data = data.tobytes()
+                return [data[start:stop] for start, stop in zip(starts, stops)]
+            elif (data < 128).all():
+                # each character is one byte, so the whole buffer is decoded
+                # once and sliced
+                data = data.tobytes().decode("ascii")
+                return [data[start:stop] for start, stop in zip(starts, stops)]
+            else:
+                data = data.tobytes()
+                return [
+                    data[start:stop].decode("utf-8", "surrogateescape")
+                    for start, stop in zip(starts, stops)
+                ]
+        else:
+            flat = _layout_to_list(content)
+            return [flat[start:stop] for start, stop in zip(starts, stops)]
+
+    elif isinstance(layout, ak._util.optiontypes):
+        missing = ak.nplike.of(layout).asarray(layout.bytemask()).tolist()
+        valid = iter(_layout_to_list(layout.project()))
+        return [None if x else next(valid) for x in missing]
+
+    elif isinstance(layout, ak._util.indexedtypes):
+        return _layout_to_list(layout.project())
+
+    elif isinstance(layout, ak.layout.RecordArray):
+        length = len(layout)
+        fields = [_layout_to_list(x[:length]) for x in layout.fields()]
+        if layout.istuple:
+            if len(fields) == 0:
+                return [() for i in range(length)]
+            else:
+                return list(zip(*fields))
+        else:
+            keys = layout.keys()
+            if len(fields) == 0:
+                return [{} for i in range(length)]
+            else:
+                return [dict(zip(keys, values)) for values in zip(*fields)]
+
+    elif isinstance(layout, ak._util.uniontypes):
+        tags = ak.nplike.of(layout).asarray(layout.tags).tolist()
+        contents = [
+            iter(_layout_to_list(layout.project(i))) for i in range(layout.numcontents)
+        ]
+        return [next(contents[tag]) for tag in tags]
+
+    else:
+        return [to_list(x) for x in layout]
+
+
 def to_json(
     array,
     destination=None,
@@ -2895,6 +3760,7 @@ def to_parquet(
     list_to32=False,
     string_to32=True,
     bytestring_to32=True,
+    row_group_size=None,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     """
@@ -2910,6 +3776,12 @@ def to_parquet(
             all others map to Arrow `LargeListType`.
         string_to32 (bool): Same as the above for Arrow `string` and `large_string`.
         bytestring_to32 (bool): Same as the above for Arrow `binary` and `large_binary`.
+        row_group_size (None, int, or str): If None, each partition of the
+            `array` is written as one row group; if an int, the array is
+            divided into row groups of this many rows (the last may have
+            fewer); if a string like `"64MB"`, the array is divided into row
+            groups of approximately this many bytes of Arrow data, regardless
+            of how it is partitioned.
         options: All other options are passed to pyarrow.parquet.ParquetWriter.
             In particular, if no `schema` is given, a schema is derived from
             the array type.
@@ -2942,6 +3814,10 @@ def to_parquet(
 
     (If it is large, you will likely want to load it lazily.)
 
+    Each partition is converted to Arrow (see #ak.to_arrow) in a background
+    thread while the previous one is being written, so a lazy `array` is
+    read while the file is being compressed and written.
+
     See also #ak.to_arrow, which is used as an intermediate step.
     See also #ak.from_parquet.
     """
@@ -2988,28 +3864,110 @@ def to_parquet(
                 pa_arrays, schema=pyarrow.schema(pa_fields)
             )
 
+    if row_group_size is None:
+        pass
+    elif isinstance(row_group_size, str) or (
+        ak._util.py27 and isinstance(row_group_size, ak._util.unicode)
+    ):
+        row_group_size = ak._util.bytes_from_string(row_group_size, "row_group_size")
+        row_group_unit = "bytes"
+    else:
+        row_group_unit = "rows"
+    if row_group_size is not None and row_group_size < 1:
+        raise ValueError(
+            "row_group_size must be at least 1, not {0}".format(row_group_size)
+            + ak._util.exception_suffix(__file__)
+        )
+
     layout = to_layout(array, allow_record=False, allow_other=False)
-    iterator = batch_iterator(layout)
+    iterator = _read_ahead(batch_iterator(layout))
     first = next(iterator)
 
     if "schema" not in options:
         options["schema"] = first.schema
 
-    writer = pyarrow.parquet.ParquetWriter(**options)
-    writer.write_table(pyarrow.Table.from_batches([first]))
+    if row_group_size is None:
+        groups = ([x] for x in _chain_first(first, iterator))
+    else:
+        groups = _parquet_row_groups(
+            _chain_first(first, iterator), row_group_size, row_group_unit
+        )
 
+    writer = pyarrow.parquet.ParquetWriter(**options)
     try:
-        while True:
-            try:
-                record_batch = next(iterator)
-            except StopIteration:
-                break
+        for group in groups:
+            table = pyarrow.Table.from_batches(group)
+            if row_group_size is None:
+                writer.write_table(table)
             else:
-                writer.write_table(pyarrow.Table.from_batches([record_batch]))
+                writer.write_table(table, row_group_size=table.num_rows)
     finally:
         writer.close()
 
 
+def _read_ahead(iterator):
+    # the next item is computed in a worker thread while the caller uses
+    # this one; only one worker advances the iterator at a time
+    worker = ak._util.Worker(next, iterator)
+    worker.start()
+    while True:
+        try:
+            item = worker.get()
+        except StopIteration:
+            break
+        worker = ak._util.Worker(next, iterator)
+        worker.start()
+        yield item
+
+
+def _chain_first(first, iterator):
+    yield first
+    for x in iterator:
+        yield x
+
+
+def _arrow_nbytes(record_batch):
+    return sum(
+        buffer.size
+        for column in record_batch.columns
+        for buffer in column.buffers()
+        if buffer is not None
+    )
+
+
+def _parquet_row_groups(record_batches, row_group_size, row_group_unit):
+    # yields lists of RecordBatch slices that make up one row group each,
+    # of row_group_size rows or (approximately) bytes
+    group = []
+    size = 0
+    for record_batch in record_batches:
+        num_rows = record_batch.num_rows
+        if row_group_unit == "rows":
+            row_size = 1
+        elif num_rows == 0:
+            row_size = 0
+        else:
+            row_size = float(_arrow_nbytes(record_batch)) / num_rows
+
+        start = 0
+        while start < num_rows:
+            if row_size == 0:
+                take = num_rows - start
+            else:
+                take = int(math.ceil((row_group_size - size) / float(row_size)))
+                take = min(max(take, 1), num_rows - start)
+            group.append(record_batch.slice(start, take))
+            size += take * row_size
+            start += take
+            if size >= row_group_size:
+                yield group
+                group = []
+                size = 0
+
+    if len(group) != 0:
+        yield group
+
+
 def _common_parquet_schema(pq, filenames, relpaths):
     assert len(filenames) != 0
 
@@ -3263,13 +4221,13 @@ class _ParquetFile(object):
                 sample = None
                 if lazy_cache is not None:
                     try:
-                        sample = lazy_cache.mutablemapping[samplekey]
+                        sample = ak._util.cache_mapping(lazy_cache)[samplekey]
                     except KeyError:
                         pass
                 if sample is None:
                     sample = self.get(row_group, unpack, sampleform, struct_only)
                 if lazy_cache is not None:
-                    lazy_cache.mutablemapping[samplekey] = sample
+                    ak._util.cache_mapping(lazy_cache)[samplekey] = sample
 
                 offsets = [sample.offsets]
                 sublength = offsets[-1][-1]
@@ -3462,6 +4420,203 @@ def _ParquetFile_arrow_to_awkward(table, struct_only, masked, unpack):
     return out
 
 
+_parquet_filter_operators = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _parquet_regularize_filter(filter):
+    # returns a list of alternatives (OR), each a list of terms (AND)
+    if isinstance(filter, tuple):
+        filter = [filter]
+    if all(isinstance(x, tuple) for x in filter):
+        filter = [filter]
+    out = []
+    for conjunction in filter:
+        terms = []
+        for term in conjunction:
+            if (
+                not isinstance(term, tuple)
+                or len(term) != 3
+                or term[1] not in _parquet_filter_operators
+            ):
+                raise ValueError(
+                    "filter terms must be (column, operator, value) tuples with "
+                    "an operator in {0}, not {1}".format(
+                        ", ".join(repr(x) for x in _parquet_filter_operators),
+                        repr(term),
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            column, operator, value = term
+            if operator == "=":
+                operator = "=="
+            if operator in ("in", "not in"):
+                value = list(value)
+            elif value is None and operator not in ("==", "!="):
+                raise ValueError(
+                    "filter terms can only compare with None using '==' or '!=', "
+                    "not {0}".format(repr(term)) + ak._util.exception_suffix(__file__)
+                )
+            terms.append((column, operator, value))
+        out.append(terms)
+    return out
+
+
+def _parquet_flat_path(path):
+    # "jets.list.item.pt" (as pyarrow names nested columns) -> "jets.pt"
+    out = []
+    names = path.split(".")
+    i = 0
+    while i < len(names):
+        if (
+            names[i] == "list"
+            and i + 1 < len(names)
+            and names[i + 1] in ("item", "element")
+        ):
+            i += 2
+        else:
+            out.append(names[i])
+            i += 1
+    return ".".join(out)
+
+
+def _parquet_statistics(row_group_metadata):
+    out = {}
+    for i in range(row_group_metadata.num_columns):
+        column = row_group_metadata.column(i)
+        for name in (column.path_in_schema, _parquet_flat_path(column.path_in_schema)):
+            if name not in out:
+                out[name] = column.statistics
+    return out
+
+
+def _parquet_might_match(low, high, operator, value):
+    # whether a value between low and high (inclusive) might satisfy the term
+    try:
+        if operator == "==":
+            return low <= value <= high
+        elif operator == "!=":
+            return not (low == high == value)
+        elif operator == "<":
+            return low < value
+        elif operator == "<=":
+            return low <= value
+        elif operator == ">":
+            return high > value
+        elif operator == ">=":
+            return high >= value
+        elif operator == "in":
+            return any(low <= x <= high for x in value)
+        else:
+            return not (low == high and low in value)
+    except TypeError:
+        return True
+
+
+def _parquet_partition_value(string, value):
+    # partition values are strings in directory names; compare them as the
+    # type of the filter's value
+    if isinstance(value, list):
+        if len(value) == 0:
+            return string
+        value = value[0]
+    if isinstance(value, bool):
+        return string
+    elif isinstance(value, numbers.Integral):
+        return int(string)
+    elif isinstance(value, numbers.Real):
+        return float(string)
+    else:
+        return string
+
+
+def _parquet_term_might_match(statistics, partition_values, column, operator, value):
+    if column in partition_values:
+        try:
+            actual = _parquet_partition_value(partition_values[column], value)
+        except ValueError:
+            return True
+        if value is None:
+            return operator == "!="
+        return _parquet_might_match(actual, actual, operator, value)
+
+    stats = statistics.get(column)
+    if stats is None:
+        return True
+    if value is None:
+        if not stats.has_null_count:
+            return True
+        elif operator == "==":
+            return stats.null_count > 0
+        else:
+            return stats.num_values > 0
+    if stats.has_null_count and stats.num_values == 0:
+        # nulls do not satisfy comparisons
+        return False
+    if not stats.has_min_max:
+        return True
+    return _parquet_might_match(stats.min, stats.max, operator, value)
+
+
+def _parquet_select_row_groups(
+    row_group_metadatas, row_group_paths, schema, filter, row_groups
+):
+    num_row_groups = len(row_group_metadatas)
+    if row_groups is None:
+        selected = list(range(num_row_groups))
+    else:
+        if isinstance(row_groups, (numbers.Integral, np.integer)):
+            row_groups = [row_groups]
+        selected = []
+        for row_group in row_groups:
+            if not 0 <= row_group < num_row_groups:
+                raise ValueError(
+                    "row group {0} is out of range for {1} row groups".format(
+                        row_group, num_row_groups
+                    )
+                    + ak._util.exception_suffix(__file__)
+                )
+            selected.append(int(row_group))
+    if filter is None:
+        return selected
+
+    filter = _parquet_regularize_filter(filter)
+
+    known = set(schema.names)
+    if num_row_groups != 0:
+        known.update(_parquet_statistics(row_group_metadatas[0]))
+    if row_group_paths is not None:
+        for path in row_group_paths:
+            known.update(column for column, value in _parquet_partition_values(path))
+    for conjunction in filter:
+        for column, operator, value in conjunction:
+            if column not in known:
+                raise ValueError(
+                    "filter column {0} not found in schema".format(repr(column))
+                    + ak._util.exception_suffix(__file__)
+                )
+
+    out = []
+    for row_group in selected:
+        statistics = _parquet_statistics(row_group_metadatas[row_group])
+        if row_group_paths is None:
+            partition_values = {}
+        else:
+            partition_values = dict(
+                _parquet_partition_values(row_group_paths[row_group])
+            )
+        if any(
+            all(
+                _parquet_term_might_match(
+                    statistics, partition_values, column, operator, value
+                )
+                for column, operator, value in conjunction
+            )
+            for conjunction in filter
+        ):
+            out.append(row_group)
+    return out
+
+
 def from_parquet(
     source,
     columns=None,
@@ -3473,6 +4628,7 @@ def from_parquet(
     lazy_cache_key=None,
     highlevel=True,
     behavior=None,
+    filter=None,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     """
@@ -3493,15 +4649,20 @@ def from_parquet(
             #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
             if the file has more than one row group); if False, read all
             requested data immediately.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+        lazy_cache (None, "new", "lru:<size>", or MutableMapping): If lazy,
+            pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created. If a string like "lru:4GB", a new
+            #ak.layout.LRUArrayCache with that budget is created. If None, no
+            cache is used.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        filter (None, tuple, list of tuples, or list of lists of tuples): If
+            not None, skip row groups that cannot contain a value satisfying
+            this condition (see below).
         options: All other options are passed to pyarrow.parquet.ParquetFile.
 
     Reads a Parquet file into an Awkward Array (through pyarrow).
@@ -3509,6 +4670,26 @@ def from_parquet(
         >>> ak.from_parquet("array1.parquet")
         <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
 
+    The `filter` is a `(column, operator, value)` tuple, such as
+    `("pt", ">", 30)`, where the operator is one of `"=="`, `"!="`, `"<"`,
+    `"<="`, `">"`, `">="`, `"in"`, and `"not in"` (with a collection of
+    values). A list of tuples requires all of them to be satisfied and a
+    list of lists of tuples requires any of the lists to be satisfied, as
+    in the `filters` of pyarrow.parquet.read_table. A `column` is a
+    top-level column, a column nested in lists and records with its field
+    names joined by dots (such as `"jets.pt"`), or a partition column of a
+    dataset. Comparisons with None (`"=="` or `"!="` only) test for missing
+    values.
+
+    Row groups are selected using the minimum, maximum, and null count of
+    each column in the file metadata and using the partition values in
+    directory names, without reading any data. Row groups that might
+    contain a matching value are read entirely: the `filter` does not
+    remove rows or list items, so it only saves time if the values are
+    clustered, for instance in a sorted or partitioned dataset. Row groups
+    without statistics are always read. A condition on a nested column is
+    satisfied by a row group if any of its values satisfies it.
+
     See also #ak.from_arrow, which is used as an intermediate step.
     See also #ak.to_parquet.
     """
@@ -3525,6 +4706,7 @@ def from_parquet(
             schema = file.schema_arrow
             num_row_groups = file.num_row_groups
             paths_and_counts = []
+            row_group_paths = []
             for i in range(file.num_row_groups):
                 filename = file.metadata.row_group(i).column(0).file_path
                 if i == 0:
@@ -3540,6 +4722,7 @@ def from_parquet(
                     last_filename = filename
                     paths_and_counts.append([filename, 0])
                 paths_and_counts[-1][-1] += file.metadata.row_group(i).num_rows
+                row_group_paths.append(last_filename)
             if include_partition_columns:
                 partition_columns = _parquet_partitions_to_awkward(paths_and_counts)
             else:
@@ -3556,6 +4739,7 @@ def from_parquet(
         schema = None
         lookup = []
         paths_and_counts = []
+        row_group_paths = []
         for filename in source:
             single_file = pyarrow.parquet.ParquetFile(filename)
             if schema is None:
@@ -3570,6 +4754,7 @@ def from_parquet(
                 )
             for i in range(single_file.num_row_groups):
                 lookup.append((single_file, i))
+                row_group_paths.append(os.path.relpath(filename, relative_to))
             paths_and_counts.append(
                 (os.path.relpath(filename, relative_to), single_file.metadata.num_rows)
             )
@@ -3585,6 +4770,7 @@ def from_parquet(
         schema = file.schema_arrow
         partition_columns = []
         num_row_groups = file.num_row_groups
+        row_group_paths = None
         multimode = "single"
 
     all_columns = schema.names
@@ -3598,7 +4784,26 @@ def from_parquet(
                 + ak._util.exception_suffix(__file__)
             )
 
-    if num_row_groups == 0:
+    if multimode == "multifile":
+        row_group_metadatas = [
+            single_file.metadata.row_group(i) for single_file, i in lookup
+        ]
+    else:
+        row_group_metadatas = [
+            file.metadata.row_group(i) for i in range(num_row_groups)
+        ]
+    global_offsets = [0]
+    for row_group_metadata in row_group_metadatas:
+        global_offsets.append(global_offsets[-1] + row_group_metadata.num_rows)
+
+    if filter is None and row_groups is None:
+        selected = None
+    else:
+        selected = _parquet_select_row_groups(
+            row_group_metadatas, row_group_paths, schema, filter, row_groups
+        )
+
+    if num_row_groups == 0 or selected == []:
         out = ak.layout.RecordArray(
             [ak.layout.EmptyArray() for x in columns], columns, 0
         )
@@ -3607,36 +4812,28 @@ def from_parquet(
         else:
             return out
 
+    if selected is None:
+        selected = list(range(num_row_groups))
+
     hold_cache = None
     if lazy:
         if multimode == "dir":
             state = _ParquetDataset(pyarrow.parquet, source, file, use_threads, options)
-            lengths = [
-                file.metadata.row_group(i).num_rows for i in range(num_row_groups)
-            ]
-
         elif multimode == "multifile":
             state = _ParquetDatasetOfFiles(lookup, use_threads)
-            lengths = []
-            for single_file, local_row_group in lookup:
-                lengths.append(single_file.metadata.row_group(local_row_group).num_rows)
-
         else:
             state = _ParquetFile(file, use_threads)
-            lengths = [
-                file.metadata.row_group(i).num_rows for i in range(num_row_groups)
-            ]
 
-        if lazy_cache == "new":
+        if ak._util.is_lru_cache_string(lazy_cache):
+            lazy_cache = ak._util.lru_cache_from_string(lazy_cache)
+        elif lazy_cache == "new":
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
         elif lazy_cache == "attach":
             raise TypeError("lazy_cache must be a MutableMapping")
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
-        elif lazy_cache is not None and not isinstance(
-            lazy_cache, ak.layout.ArrayCache
-        ):
+        elif lazy_cache is not None and not ak._util.is_arraycache(lazy_cache):
             hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
             if not isinstance(hold_cache, MutableMapping):
                 raise TypeError("lazy_cache must be a MutableMapping")
@@ -3649,8 +4846,8 @@ def from_parquet(
 
         partitions = []
         offsets = [0]
-        for row_group in range(num_row_groups):
-            length = lengths[row_group]
+        for row_group in selected:
+            length = row_group_metadatas[row_group].num_rows
             offsets.append(offsets[-1] + length)
 
             contents = []
@@ -3690,7 +4887,8 @@ def from_parquet(
                     field_names = recordlookup
                     fields = contents
                 else:
-                    start, stop = offsets[row_group], offsets[row_group + 1]
+                    start = global_offsets[row_group]
+                    stop = global_offsets[row_group + 1]
                     field_names = [x[0] for x in partition_columns] + recordlookup
                     fields = [x[1][start:stop] for x in partition_columns] + contents
                 recordarray = ak.layout.RecordArray(fields, field_names, length)
@@ -3707,45 +4905,42 @@ def from_parquet(
 
     else:
         if multimode == "dir":
+            first_row_groups = {}
+            for i, filename in enumerate(row_group_paths):
+                if filename not in first_row_groups:
+                    first_row_groups[filename] = i
+            local_files = {}
             batches = []
-            for i in range(file.num_row_groups):
-                filename = file.metadata.row_group(i).column(0).file_path
-                if i == 0:
-                    if filename == "":
-                        raise ValueError(
-                            "Parquet _metadata file does not contain file paths "
-                            "(e.g. was not made with 'set_file_path')"
-                            + ak._util.exception_suffix(__file__)
-                        )
-                    local_file = pyarrow.parquet.ParquetFile(
-                        os.path.join(source, filename), **options
-                    )
-                    last_filename = filename
-                    start_i = 0
-                elif filename != "" and last_filename != filename:
-                    local_file = pyarrow.parquet.ParquetFile(
+            for i in selected:
+                filename = row_group_paths[i]
+                if filename not in local_files:
+                    local_files[filename] = pyarrow.parquet.ParquetFile(
                         os.path.join(source, filename), **options
                     )
-                    last_filename = filename
-                    start_i = i
                 batches.extend(
-                    local_file.read_row_group(
-                        i - start_i, columns, use_threads=use_threads
-                    ).to_batches()
+                    local_files[filename]
+                    .read_row_group(
+                        i - first_row_groups[filename], columns, use_threads=use_threads
+                    )
+                    .to_batches()
                 )
 
         elif multimode == "multifile":
             batches = []
-            for single_file, local_row_group in lookup:
+            for i in selected:
+                single_file, local_row_group = lookup[i]
                 batches.extend(
                     single_file.read_row_group(
                         local_row_group, columns, use_threads=use_threads
                     ).to_batches()
                 )
 
-        else:
+        elif selected == list(range(num_row_groups)):
             batches = file.read(columns, use_threads=use_threads)
 
+        else:
+            batches = file.read_row_groups(selected, columns, use_threads=use_threads)
+
         out = _from_arrow(batches, False, highlevel=False)
         assert isinstance(out, ak.layout.RecordArray) and not out.istuple
 
@@ -3754,8 +4949,18 @@ def from_parquet(
 
         if partition_columns != []:
             field_names = [x[0] for x in partition_columns] + out.keys()
-            fields = [x[1] for x in partition_columns] + out.contents
-            out = ak.layout.RecordArray(fields, field_names)
+            fields = [x[1] for x in partition_columns]
+            if selected != list(range(num_row_groups)):
+                index = numpy.concatenate(
+                    [
+                        numpy.arange(
+                            global_offsets[i], global_offsets[i + 1], dtype=np.int64
+                        )
+                        for i in selected
+                    ]
+                )
+                fields = [x[index] for x in fields]
+            out = ak.layout.RecordArray(fields + out.contents, field_names)
 
         if highlevel:
             return ak._util.wrap(out, behavior)
@@ -4184,6 +5389,69 @@ differs from the first Form:
     return form, length, container
 
 
+def to_shared_memory(
+    array,
+    partition_start=0,
+    form_key="node{id}",
+    key_format="part{partition}-{form_key}-{attribute}",
+):
+    """
+    Args:
+        array: Data to decompose into named buffers.
+        partition_start (non-negative int): If `array` is not partitioned, this is
+            the partition number that will be used as part of the container
+            key. If `array` is partitioned, this is the first partition number.
+        form_key (str, callable): Python format string containing
+            `"{id}"` or a function that takes non-negative integer as a string
+            and the current `layout` as keyword arguments and returns a string,
+            for use as a `form_key` on each Form node and in `key_format` (below).
+        key_format (str or callable): Python format string containing
+            `"{partition}"`, `"{form_key}"`, and/or `"{attribute}"` or a function
+            that takes these as keyword arguments and returns a string to use
+            as keys for buffers in the `container`.
+
+    Decomposes an Awkward Array like #ak.to_buffers, but copies the buffers
+    into shared memory (`multiprocessing.shared_memory`, Python 3.8 or later),
+    so that other processes on the same machine can use them without copying.
+
+    This function returns the same 3-tuple as #ak.to_buffers,
+
+        (form, length, container)
+
+    but the `container` is a SharedMemoryContainer, which pickles as the names
+    of its shared memory blocks, rather than their contents. A process that
+    unpickles it (such as a `concurrent.futures.ProcessPoolExecutor` worker)
+    can pass it to #ak.from_buffers to get an array that views the shared
+    memory:
+
+        >>> def work(form, length, container):
+        ...     array = ak.from_buffers(form, length, container)
+        ...     return ak.sum(array)
+        ...
+        >>> form, length, container = ak.to_shared_memory(original)
+        >>> with concurrent.futures.ProcessPoolExecutor() as executor:
+        ...     future = executor.submit(work, form, length, container)
+        ...     print(future.result())
+        ...
+        >>> container.unlink()
+
+    The shared memory stays allocated until the calling process calls
+    `container.unlink()`. Arrays made from a container view its memory, so
+    they must not be used after the container is closed or unlinked.
+
+    (Plain pickling of #ak.Array and #ak.Record with protocol 5 also supports
+    out-of-band buffers, through NumPy's `PickleBuffer` support.)
+
+    See also #ak.to_buffers and #ak.from_buffers.
+    """
+    container = ak._util.SharedMemoryContainer()
+    try:
+        return to_buffers(array, container, partition_start, form_key, key_format)
+    except Exception:
+        container.unlink()
+        raise
+
+
 _index_form_to_dtype = _index_form_to_index = _form_to_layout_class = None
 
 
@@ -4736,9 +6004,11 @@ def from_buffers(
             if `num_partitions` is not None); if False, read all requested data
             immediately. Any RecordArray child nodes will additionally be
             read on demand.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+        lazy_cache (None, "new", "lru:<size>", or MutableMapping): If lazy,
+            pass this cache to the VirtualArrays. If "new", a new dict
+            (keep-forever cache) is created. If a string like "lru:4GB", a new
+            #ak.layout.LRUArrayCache with that budget is created. If None, no
+            cache is used.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
@@ -4790,12 +6060,12 @@ def from_buffers(
     if lazy:
         form = _wrap_record_with_virtual(form)
 
-        if lazy_cache == "new":
+        if ak._util.is_lru_cache_string(lazy_cache):
+            lazy_cache = ak._util.lru_cache_from_string(lazy_cache)
+        elif lazy_cache == "new":
             hold_cache = ak._util.MappingProxy({})
             lazy_cache = ak.layout.ArrayCache(hold_cache)
-        elif lazy_cache is not None and not isinstance(
-            lazy_cache, ak.layout.ArrayCache
-        ):
+        elif lazy_cache is not None and not ak._util.is_arraycache(lazy_cache):
             hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
             if not isinstance(hold_cache, MutableMapping):
                 raise TypeError("lazy_cache must be a MutableMapping")
@@ -5131,6 +6401,7 @@ __all__ = [
         "numbers",
         "json",
         "collections",
+        "itertools",
         "math",
         "threading",
         "Iterable",
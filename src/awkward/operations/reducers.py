@@ -7,6 +7,28 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
+def _reduce_flattened(layout, partial, combine):
+    # Reduces the completely flattened arrays of a layout one at a time,
+    # partition by partition, so that an axis=None reduction of a (lazy)
+    # PartitionedArray only needs one partition at a time. The `partial`
+    # function may return None to skip an array (e.g. empty for min/max).
+    if isinstance(layout, ak.partition.PartitionedArray):
+        flattened = (
+            x
+            for partition in layout.partitions
+            for x in ak._util.completely_flatten(partition)
+        )
+    else:
+        flattened = ak._util.completely_flatten(layout)
+
+    out = None
+    for x in flattened:
+        tmp = partial(x)
+        if tmp is not None:
+            out = tmp if out is None else combine(out, tmp)
+    return out
+
+
 def count(array, axis=None, keepdims=False, mask_identity=False):
     """
     Args:
@@ -80,15 +102,8 @@ def count(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] + reduce(xs[1:])
-
-        return reduce(
-            [ak.nplike.of(x).size(x) for x in ak._util.completely_flatten(layout)]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).size(x), lambda x, y: x + y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -133,18 +148,8 @@ def count_nonzero(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] + reduce(xs[1:])
-
-        return reduce(
-            [
-                ak.nplike.of(x).count_nonzero(x)
-                for x in ak._util.completely_flatten(layout)
-            ]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).count_nonzero(x), lambda x, y: x + y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -330,15 +335,8 @@ def sum(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] + reduce(xs[1:])
-
-        return reduce(
-            [ak.nplike.of(x).sum(x) for x in ak._util.completely_flatten(layout)]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).sum(x), lambda x, y: x + y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -379,15 +377,8 @@ def prod(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] * reduce(xs[1:])
-
-        return reduce(
-            [ak.nplike.of(x).prod(x) for x in ak._util.completely_flatten(layout)]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).prod(x), lambda x, y: x * y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -430,15 +421,8 @@ def any(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] or reduce(xs[1:])
-
-        return reduce(
-            [ak.nplike.of(x).any(x) for x in ak._util.completely_flatten(layout)]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).any(x), lambda x, y: x or y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -481,15 +465,8 @@ def all(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 1:
-                return xs[0]
-            else:
-                return xs[0] and reduce(xs[1:])
-
-        return reduce(
-            [ak.nplike.of(x).all(x) for x in ak._util.completely_flatten(layout)]
+        return _reduce_flattened(
+            layout, lambda x: ak.nplike.of(x).all(x), lambda x, y: x and y
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -537,18 +514,11 @@ def min(array, axis=None, keepdims=False, initial=None, mask_identity=True):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 0:
-                return None
-            elif len(xs) == 1:
-                return xs[0]
-            else:
-                x, y = xs[0], reduce(xs[1:])
-                return x if x < y else y
-
-        tmp = ak._util.completely_flatten(layout)
-        return reduce([ak.nplike.of(x).min(x) for x in tmp if len(x) > 0])
+        return _reduce_flattened(
+            layout,
+            lambda x: ak.nplike.of(x).min(x) if len(x) > 0 else None,
+            lambda x, y: x if x < y else y,
+        )
     else:
         behavior = ak._util.behaviorof(array)
         return ak._util.wrap(
@@ -598,18 +568,11 @@ def max(array, axis=None, keepdims=False, initial=None, mask_identity=True):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
-
-        def reduce(xs):
-            if len(xs) == 0:
-                return None
-            elif len(xs) == 1:
-                return xs[0]
-            else:
-                x, y = xs[0], reduce(xs[1:])
-                return x if x > y else y
-
-        tmp = ak._util.completely_flatten(layout)
-        return reduce([ak.nplike.of(x).max(x) for x in tmp if len(x) > 0])
+        return _reduce_flattened(
+            layout,
+            lambda x: ak.nplike.of(x).max(x) if len(x) > 0 else None,
+            lambda x, y: x if x > y else y,
+        )
     else:
         behavior = ak._util.behaviorof(array)
         return ak._util.wrap(
@@ -764,6 +727,59 @@ def argmax(array, axis=None, keepdims=False, mask_identity=True):
 # reducers and ufuncs.
 
 
+def _axis_none_partitions(x, weight):
+    # If x or weight is partitioned, returns an iterator over matching
+    # (x, weight) partitions, so that axis=None statistics can be accumulated
+    # one partition at a time; otherwise, returns None.
+    behavior = ak._util.behaviorof(x, weight)
+    x = ak.operations.convert.to_layout(x, allow_record=False, allow_other=True)
+    weight = ak.operations.convert.to_layout(
+        weight, allow_record=False, allow_other=True
+    )
+    if isinstance(x, ak.partition.PartitionedArray):
+        sample = x
+    elif isinstance(weight, ak.partition.PartitionedArray):
+        sample = weight
+    else:
+        return None
+
+    arrays = ak.partition.partition_as(sample, (x, weight))
+    return (
+        (ak._util.wrap(xi, behavior), ak._util.wrap(wi, behavior))
+        for xi, wi in ak.partition.iterate(sample.numpartitions, arrays)
+    )
+
+
+def _var_partials(partitions):
+    # Merges the sum of weights, weighted mean, and weighted sum of squared
+    # deviations of each partition (Chan et al.), so that the mean need not
+    # be known before the squared deviations are summed.
+    sumw, xmean, sumwxx = 0, 0, 0
+    for xi, wi in partitions:
+        if wi is None:
+            sumwi = count(xi)
+            sumwxi = sum(xi)
+        else:
+            sumwi = sum(xi * 0 + wi)
+            sumwxi = sum(xi * wi)
+        if sumwi == 0:
+            continue
+
+        xmeani = sumwxi / sumwi
+        if wi is None:
+            sumwxxi = sum((xi - xmeani) ** 2)
+        else:
+            sumwxxi = sum((xi - xmeani) ** 2 * wi)
+
+        delta = xmeani - xmean
+        total = sumw + sumwi
+        xmean = xmean + delta * sumwi / total
+        sumwxx = sumwxx + sumwxxi + delta ** 2 * sumw * sumwi / total
+        sumw = total
+
+    return sumw, sumwxx
+
+
 def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
     """
     Args:
@@ -807,7 +823,17 @@ def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
-        if weight is None:
+        partitions = None if axis is not None else _axis_none_partitions(x, weight)
+        if partitions is not None:
+            sumw, sumwxn = 0, 0
+            for xi, wi in partitions:
+                if wi is None:
+                    sumw = sumw + count(xi)
+                    sumwxn = sumwxn + sum(xi ** n)
+                else:
+                    sumw = sumw + sum(xi * 0 + wi)
+                    sumwxn = sumwxn + sum((xi * wi) ** n)
+        elif weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwxn = sum(
                 x ** n, axis=axis, keepdims=keepdims, mask_identity=mask_identity
@@ -891,7 +917,17 @@ def mean(x, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers.
     """
     with np.errstate(invalid="ignore"):
-        if weight is None:
+        partitions = None if axis is not None else _axis_none_partitions(x, weight)
+        if partitions is not None:
+            sumw, sumwx = 0, 0
+            for xi, wi in partitions:
+                if wi is None:
+                    sumw = sumw + count(xi)
+                    sumwx = sumwx + sum(xi)
+                else:
+                    sumw = sumw + sum(xi * 0 + wi)
+                    sumwx = sumwx + sum(xi * wi)
+        elif weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
         else:
@@ -957,30 +993,40 @@ def var(x, weight=None, ddof=0, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxx = sum(
-                (x - xmean) ** 2,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
+        partitions = None if axis is not None else _axis_none_partitions(x, weight)
+        if partitions is not None:
+            sumw, sumwxx = _var_partials(partitions)
         else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxx = sum(
-                (x - xmean) ** 2 * weight,
+            xmean = mean(
+                x,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
+            if weight is None:
+                sumw = count(
+                    x, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwxx = sum(
+                    (x - xmean) ** 2,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+            else:
+                sumw = sum(
+                    x * 0 + weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxx = sum(
+                    (x - xmean) ** 2 * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
         if ddof != 0:
             return ak.nplike.of(sumwxx, sumw).true_divide(sumwxx, sumw) * ak.nplike.of(
                 sumw
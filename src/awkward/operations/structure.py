@@ -3551,6 +3551,143 @@ def repartition(array, lengths, highlevel=True, behavior=None):
         return out
 
 
+def _prefetch(layout, columns):
+    # returns the number of bytes materialized; errors are not reported here:
+    # the same generator runs again (and raises) when the caller touches it
+    nbytes = 0
+    try:
+        if columns is None:
+            nbytes += materialized(layout, highlevel=False).nbytes
+        else:
+            for column in columns:
+                sublayout = layout
+                for field in column:
+                    sublayout = sublayout[field]
+                nbytes += materialized(sublayout, highlevel=False).nbytes
+    except Exception:
+        pass
+    return nbytes
+
+
+def _with_own_caches(layout):
+    # uncached VirtualArrays get a cache that lives as long as this partition,
+    # so that what is generated by _prefetch is kept for the caller
+    cache = ak.layout.LRUArrayCache(np.iinfo(np.int64).max, num_shards=1)
+
+    def getfunction(layout):
+        if isinstance(layout, ak.layout.VirtualArray):
+            if layout.cache is not None:
+                return lambda: layout
+            return lambda: ak.layout.VirtualArray(
+                layout.generator,
+                cache,
+                layout.cache_key,
+                layout.identities,
+                layout.parameters,
+            )
+        else:
+            return None
+
+    return ak._util.recursively_apply(layout, getfunction, pass_depth=False)
+
+
+def iter_partitions(
+    array, prefetch=2, columns=None, max_bytes=None, highlevel=True, behavior=None
+):
+    """
+    Args:
+        array: A possibly-partitioned array.
+        prefetch (int): Number of partitions after the current one to
+            materialize in background threads while the current one is being
+            processed. If 0, the partitions are returned as they are.
+        columns (None or iterable of str): Fields to materialize, with nested
+            fields separated by dots, like `"muons.pt"`. If None, all virtual
+            arrays in each partition are materialized.
+        max_bytes (None, int, or str): If not None, the number of bytes (or a
+            string like `"1GB"`) at which reading ahead pauses: no more
+            partitions are started while those already read ahead hold this
+            much (measured by #ak.layout.Content.nbytes) or are still being
+            read. At least one partition is always read ahead.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays,
+            if high-level.
+
+    Iterates over the partitions of an array, overlapping the generation of
+    lazy (#ak.layout.VirtualArray) partitions, such as those of
+    #ak.from_parquet or #ak.from_buffers with `lazy=True`, with the work done
+    on each one.
+
+        >>> array = ak.from_parquet("events.parquet", lazy=True)
+        >>> for partition in ak.iter_partitions(array, columns=["muons.pt"]):
+        ...     total += ak.sum(partition.muons.pt)
+
+    Materialized arrays are stored in the virtual arrays' caches, so that
+    they are not generated again when the partition is used; virtual arrays
+    without a cache are given one that lasts as long as the partition. An
+    array that is not partitioned is yielded as a single partition.
+
+    See also #ak.partitions.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    behavior = ak._util.behaviorof(array, behavior=behavior)
+    if isinstance(layout, ak.partition.PartitionedArray):
+        partitions = layout.partitions
+    else:
+        partitions = [layout]
+
+    if not isinstance(prefetch, (int, numbers.Integral, np.integer)) or prefetch < 0:
+        raise ValueError(
+            "prefetch must be a non-negative integer, not {0}".format(repr(prefetch))
+            + ak._util.exception_suffix(__file__)
+        )
+    if isinstance(max_bytes, str) or (
+        ak._util.py27 and isinstance(max_bytes, ak._util.unicode)
+    ):
+        max_bytes = ak._util.bytes_from_string(max_bytes, "max_bytes")
+    if columns is not None:
+        if isinstance(columns, str) or (
+            ak._util.py27 and isinstance(columns, ak._util.unicode)
+        ):
+            columns = [columns]
+        columns = [tuple(x.split(".")) for x in columns]
+
+    workers = []
+    start = 1
+    for partitionid, partition in enumerate(partitions):
+        if prefetch != 0:
+            if partitionid == 0:
+                worker = ak._util.Worker(
+                    _prefetch, _with_own_caches(partition), columns
+                )
+                worker.start()
+                workers.append(worker)
+            while start < len(partitions) and start <= partitionid + prefetch:
+                if max_bytes is not None and len(workers) > 1:
+                    # the size of a partition is only known when it is done
+                    if any(x.is_alive() for x in workers[1:]):
+                        break
+                    if sum(x.result for x in workers[1:]) >= max_bytes:
+                        break
+                worker = ak._util.Worker(
+                    _prefetch, _with_own_caches(partitions[start]), columns
+                )
+                worker.start()
+                workers.append(worker)
+                start += 1
+
+            worker = workers.pop(0)
+            worker.get()
+            partition = worker.args[0]
+
+        if highlevel:
+            yield ak._util.wrap(partition, behavior=behavior)
+        else:
+            yield partition
+
+
 def virtual(
     generate,
     args=(),
@@ -3578,8 +3715,13 @@ def virtual(
             array is unknown until it is generated, which might require it to
             be generated earlier than intended; if a non-negative int, use this
             to predict the length and verify that the generated array complies.
-        cache (None, "new", or MutableMapping): If "new", a new dict (keep-forever
-            cache) is created. If None, no cache is used.
+        cache (None, "new", "self", "lru:<size>", or MutableMapping): If
+            "new", a new dict (keep-forever cache) is created. If "self", the
+            array keeps its own generated value: a new #ak.layout.LRUArrayCache
+            without a budget is created for it, which is looked up without
+            the Python GIL. If a string like "lru:4GB", a new
+            #ak.layout.LRUArrayCache with that budget (in bytes, measured by
+            #ak.layout.Content.nbytes) is created. If None, no cache is used.
         cache_key (None or str): If None, a unique string is generated for this
             virtual array for use with the `cache` (unique per Python process);
             otherwise, the explicitly provided key is used (which ought to
@@ -3706,6 +3848,11 @@ def virtual(
     Functions with a `lazy` option, such as #ak.from_parquet and #ak.from_buffers,
     construct #ak.layout.RecordArray of #ak.layout.VirtualArray in this way.
 
+    If several threads need the same virtual array (same `cache` and
+    `cache_key`) at once, only one of them calls `generate`; the others wait
+    for its result. Without a cache, each thread that needs the array after
+    that generates it again, so use `cache="self"` to generate it only once.
+
     See also #ak.materialized.
     """
     if isinstance(form, str) and form in (
@@ -3734,10 +3881,14 @@ def virtual(
     gen = ak.layout.ArrayGenerator(
         generate, args, kwargs or {}, form=form, length=length
     )
-    if cache == "new":
+    if ak._util.is_lru_cache_string(cache):
+        cache = ak._util.lru_cache_from_string(cache)
+    elif cache == "self":
+        cache = ak.layout.LRUArrayCache(np.iinfo(np.int64).max, num_shards=1)
+    elif cache == "new":
         hold_cache = ak._util.MappingProxy({})
         cache = ak.layout.ArrayCache(hold_cache)
-    elif cache is not None and not isinstance(cache, ak.layout.ArrayCache):
+    elif cache is not None and not ak._util.is_arraycache(cache):
         hold_cache = ak._util.MappingProxy.maybe_wrap(cache)
         cache = ak.layout.ArrayCache(hold_cache)
 
@@ -3790,6 +3941,8 @@ def with_cache(array, cache, highlevel=True, behavior=None):
             re-generated if `__getitem__` raises a `KeyError`. This mapping may
             evict elements according to any caching algorithm (LRU, LFR, RR,
             TTL, etc.). If "new", a new dict (keep-forever cache) is created.
+            If a string like "lru:4GB", a new #ak.layout.LRUArrayCache with
+            that budget is created.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -3823,10 +3976,12 @@ def with_cache(array, cache, highlevel=True, behavior=None):
 
     See #ak.virtual.
     """
-    if cache == "new":
+    if ak._util.is_lru_cache_string(cache):
+        cache = ak._util.lru_cache_from_string(cache)
+    elif cache == "new":
         hold_cache = ak._util.MappingProxy({})
         cache = ak.layout.ArrayCache(hold_cache)
-    elif cache is not None and not isinstance(cache, ak.layout.ArrayCache):
+    elif cache is not None and not ak._util.is_arraycache(cache):
         hold_cache = ak._util.MappingProxy.maybe_wrap(cache)
         cache = ak.layout.ArrayCache(hold_cache)
 
@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import numbers
+import operator
 
 try:
     from collections.abc import Iterable
@@ -91,8 +92,132 @@ def iterate(numpartitions, arrays):
             yield out
 
 
-def apply(function, array):
-    return IrregularlyPartitionedArray([function(x) for x in array.partitions])
+# how to combine the results of reducing each partition of a one-dimensional
+# PartitionedArray at axis=0; reducers not listed here concatenate first
+_combine_partials = {
+    "count": operator.add,
+    "count_nonzero": operator.add,
+    "sum": operator.add,
+    "prod": operator.mul,
+    "any": lambda x, y: x or y,
+    "all": lambda x, y: x and y,
+    "min": lambda x, y: x if x < y else y,
+    "max": lambda x, y: x if x > y else y,
+}
+
+
+# Default executor for per-partition work: any object with a `map` method
+# like `concurrent.futures.Executor.map` or `multiprocessing.pool.Pool.map`,
+# or None to run partitions serially. Set it globally as
+#
+#     ak.partition.executor = concurrent.futures.ThreadPoolExecutor(8)
+#
+# libawkward releases the GIL while it works on a partition, so a thread pool
+# can keep several cores busy. Process pools are also supported: partitions
+# are sent to the workers and back as ak.to_buffers/ak.from_buffers, which
+# materializes lazy (VirtualArray) partitions in the calling process.
+executor = None
+
+
+class _PackedContent(object):
+    # a Content in transit to or from a process pool worker
+    def __init__(self, layout):
+        form, length, container = ak.operations.convert.to_buffers(layout)
+        self.form = form.tojson()
+        self.length = length
+        self.container = container
+
+    def unpack(self):
+        return ak.operations.convert.from_buffers(
+            self.form, self.length, self.container, highlevel=False
+        )
+
+
+def _pack(obj):
+    if isinstance(obj, ak.layout.Content):
+        return _PackedContent(obj)
+    elif isinstance(obj, tuple):
+        return tuple(_pack(x) for x in obj)
+    else:
+        return obj
+
+
+def _unpack(obj):
+    if isinstance(obj, _PackedContent):
+        return obj.unpack()
+    elif isinstance(obj, tuple):
+        return tuple(_unpack(x) for x in obj)
+    else:
+        return obj
+
+
+class _PackedCall(object):
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, packed):
+        return _pack(self.function(_unpack(packed)))
+
+
+def _is_process_pool(executor):
+    try:
+        import concurrent.futures
+    except ImportError:
+        pass
+    else:
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            return True
+    import multiprocessing.pool
+
+    return isinstance(executor, multiprocessing.pool.Pool) and not isinstance(
+        executor, multiprocessing.pool.ThreadPool
+    )
+
+
+def map_partitions(function, partitions, executor=None):
+    """
+    Args:
+        function: Function to apply to each partition.
+        partitions (iterable): Partitions (or tuples of partitions) to pass
+            to `function`.
+        executor (None or executor): Object with a `map` method, such as a
+            `concurrent.futures.ThreadPoolExecutor`; if None, the global
+            `ak.partition.executor` is used, and if that is also None, the
+            partitions are processed serially.
+
+    Returns a list of `function(partition)` results, in the order of
+    `partitions`. With a process pool, `function` must be picklable (e.g.
+    an `operator.methodcaller` or a module-level function), and Contents
+    are transported as #ak.to_buffers.
+    """
+    if executor is None:
+        executor = ak.partition.executor
+    partitions = list(partitions)
+    if executor is None or len(partitions) <= 1:
+        return [function(x) for x in partitions]
+    elif _is_process_pool(executor):
+        return [
+            _unpack(x)
+            for x in executor.map(_PackedCall(function), [_pack(x) for x in partitions])
+        ]
+    else:
+        return list(executor.map(function, partitions))
+
+
+def apply(function, array, executor=None):
+    return IrregularlyPartitionedArray(
+        map_partitions(function, array.partitions, executor=executor)
+    )
+
+
+class _GetItemWith(object):
+    # picklable (partition, head partition) -> partition[(head,) + tail]
+    def __init__(self, tail):
+        self.tail = tail
+
+    def __call__(self, pair):
+        partition, head = pair
+        return partition[(head,) + self.tail]
 
 
 class PartitionedArray(object):
@@ -123,6 +248,9 @@ class PartitionedArray(object):
     def partitionid_index_at(self, at):
         return self._ext.partitionid_index_at(at)
 
+    def _map(self, function):
+        return map_partitions(function, self.partitions)
+
     def repartition(self, *args, **kwargs):
         return PartitionedArray.from_ext(self._ext.repartition(*args, **kwargs))
 
@@ -238,7 +366,7 @@ class PartitionedArray(object):
         elif isinstance(where, str) or (
             ak._util.py27 and isinstance(where, ak._util.unicode)
         ):
-            return self.replace_partitions([x[where] for x in self.partitions])
+            return self.replace_partitions(self._map(operator.itemgetter(where)))
 
         elif isinstance(where, tuple) and len(where) == 0:
             return self
@@ -254,7 +382,7 @@ class PartitionedArray(object):
                 for x in where
             )
         ):
-            return self.replace_partitions([x[where] for x in self.partitions])
+            return self.replace_partitions(self._map(operator.itemgetter(where)))
 
         else:
             if not isinstance(where, tuple):
@@ -279,18 +407,20 @@ class PartitionedArray(object):
                     head.start, head.stop, head.step
                 ).partitions
                 return IrregularlyPartitionedArray(
-                    [x[(slice(None),) + tail] for x in partitions]
+                    map_partitions(
+                        operator.itemgetter((slice(None),) + tail), partitions
+                    )
                 )
 
             elif head is Ellipsis:
                 return IrregularlyPartitionedArray(
-                    [x[(head,) + tail] for x in self.partitions]
+                    self._map(operator.itemgetter((head,) + tail))
                 )
 
             elif isinstance(head, str) or (
                 ak._util.py27 and isinstance(head, ak._util.unicode)
             ):
-                y = IrregularlyPartitionedArray([x[head] for x in self.partitions])
+                y = IrregularlyPartitionedArray(self._map(operator.itemgetter(head)))
                 if len(tail) == 0:
                     return y
                 else:
@@ -308,7 +438,7 @@ class PartitionedArray(object):
                 )
             ):
                 y = IrregularlyPartitionedArray(
-                    [x[list(head)] for x in self.partitions]
+                    self._map(operator.itemgetter(list(head)))
                 )
                 if len(tail) == 0:
                     return y
@@ -364,13 +494,12 @@ class PartitionedArray(object):
                         layout = IrregularlyPartitionedArray.toPartitioned(
                             layout, stops
                         )
-                    inparts = self.partitions
-                    headparts = layout.partitions
-                    outparts = []
+                    outparts = map_partitions(
+                        _GetItemWith(tail), zip(self.partitions, layout.partitions)
+                    )
                     outoffsets = [0]
-                    for i in range(len(inparts)):
-                        outparts.append(inparts[i][(headparts[i],) + tail])
-                        outoffsets.append(outoffsets[-1] + len(outparts[-1]))
+                    for outpart in outparts:
+                        outoffsets.append(outoffsets[-1] + len(outpart))
                     return IrregularlyPartitionedArray(outparts, outoffsets[1:])
 
     def __iter__(self):
@@ -478,12 +607,14 @@ class PartitionedArray(object):
 
     def num(self, axis):
         if first(self).axis_wrap_if_negative(axis) == 0:
-            return sum(x.num(axis) for x in self.partitions)
+            return sum(self._map(operator.methodcaller("num", axis)))
         else:
-            return self.replace_partitions([x.num(axis) for x in self.partitions])
+            return self.replace_partitions(
+                self._map(operator.methodcaller("num", axis))
+            )
 
     def flatten(self, *args, **kwargs):
-        return apply(lambda x: x.flatten(*args, **kwargs), self)
+        return apply(operator.methodcaller("flatten", *args, **kwargs), self)
 
     def offsets_and_flatten(self, axis):
         return self.toContent().offsets_and_flatten(axis)
@@ -493,7 +624,7 @@ class PartitionedArray(object):
             return self.toContent().rpad(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad(length, axis) for x in self.partitions]
+                self._map(operator.methodcaller("rpad", length, axis))
             )
 
     def rpad_and_clip(self, length, axis):
@@ -501,7 +632,7 @@ class PartitionedArray(object):
             return self.toContent().rpad_and_clip(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad_and_clip(length, axis) for x in self.partitions]
+                self._map(operator.methodcaller("rpad_and_clip", length, axis))
             )
 
     def mergeable(self, other):
@@ -538,14 +669,32 @@ class PartitionedArray(object):
         if not branch and negaxis <= 0:
             negaxis += depth
         if not branch and negaxis == depth:
-            if initial is None:
+            if depth == 1 and not keepdims and name in _combine_partials:
+                return self._reduce_partials(name, axis, mask, initial)
+            elif initial is None:
                 return getattr(self.toContent(), name)(axis, mask, keepdims)
             else:
                 return getattr(self.toContent(), name)(axis, mask, keepdims, initial)
         else:
             return self.replace_partitions(
-                [getattr(x, name)(axis, mask, keepdims) for x in self.partitions]
+                self._map(operator.methodcaller(name, axis, mask, keepdims))
+            )
+
+    def _reduce_partials(self, name, axis, mask, initial):
+        # reduces one partition at a time, so that (lazy) partitions do not
+        # need to be concatenated; masked (None) partials are empty partitions
+        combine = _combine_partials[name]
+        if initial is None:
+            partials = self._map(operator.methodcaller(name, axis, mask, False))
+        else:
+            partials = self._map(
+                operator.methodcaller(name, axis, mask, False, initial)
             )
+        out = None
+        for tmp in partials:
+            if tmp is not None:
+                out = tmp if out is None else combine(out, tmp)
+        return out
 
     def count(self, axis, mask, keepdims):
         return self.reduce("count", axis, mask, keepdims)
@@ -2,8 +2,37 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_ListArray_combinations.cpp", line)
 
+#include <vector>
+
 #include "awkward/kernels.h"
 #include "awkward/kernel-utils.h"
+#include "awkward/kernel-parallel.h"
+
+// Same count as in awkward_ListArray_combinations_length.
+int64_t awkward_ListArray_combinations_count(
+  int64_t size,
+  int64_t n,
+  bool replacement) {
+  if (replacement) {
+    size += (n - 1);
+  }
+  int64_t thisn = n;
+  if (thisn > size) {
+    return 0;
+  }
+  else if (thisn == size) {
+    return 1;
+  }
+  if (thisn * 2 > size) {
+    thisn = size - thisn;
+  }
+  int64_t combinationslen = size;
+  for (int64_t j = 2;  j <= thisn;  j++) {
+    combinationslen *= (size - j + 1);
+    combinationslen /= j;
+  }
+  return combinationslen;
+}
 
 template <typename C>
 ERROR awkward_ListArray_combinations(
@@ -18,18 +47,49 @@ ERROR awkward_ListArray_combinations(
   for (int64_t j = 0;  j < n;  j++) {
     toindex[j] = 0;
   }
+  if (awkward_get_num_threads() <= 1) {
+    for (int64_t i = 0;  i < length;  i++) {
+      int64_t start = (int64_t)starts[i];
+      int64_t stop = (int64_t)stops[i];
+      fromindex[0] = start;
+      awkward_ListArray_combinations_step_64(
+        tocarry,
+        toindex,
+        fromindex,
+        0,
+        stop,
+        n,
+        replacement);
+    }
+    return success();
+  }
+
+  // Where each list's combinations begin in tocarry, so that ranges of
+  // lists can be filled independently, with their own toindex/fromindex.
+  std::vector<int64_t> outoffsets(length + 1);
+  outoffsets[0] = 0;
   for (int64_t i = 0;  i < length;  i++) {
-    int64_t start = (int64_t)starts[i];
-    int64_t stop = (int64_t)stops[i];
-    fromindex[0] = start;
-    awkward_ListArray_combinations_step_64(
-      tocarry,
-      toindex,
-      fromindex,
-      0,
-      stop,
-      n,
-      replacement);
+    outoffsets[i + 1] = outoffsets[i] + awkward_ListArray_combinations_count(
+      (int64_t)(stops[i] - starts[i]), n, replacement);
+  }
+  awkward_parallel_sublists(outoffsets.data(), length,
+                            [&](int64_t begin, int64_t end) {
+    std::vector<int64_t> localtoindex(n, outoffsets[begin]);
+    std::vector<int64_t> localfromindex(n);
+    for (int64_t i = begin;  i < end;  i++) {
+      localfromindex[0] = (int64_t)starts[i];
+      awkward_ListArray_combinations_step_64(
+        tocarry,
+        localtoindex.data(),
+        localfromindex.data(),
+        0,
+        (int64_t)stops[i],
+        n,
+        replacement);
+    }
+  });
+  for (int64_t j = 0;  j < n;  j++) {
+    toindex[j] = outoffsets[length];
   }
   return success();
 }
@@ -7,6 +7,51 @@
 #include <vector>
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-parallel.h"
+#include "awkward/kernel-sort.h"
+
+// Sublists at most this long are sorted by a sorting network.
+const int64_t kSmallArgsortMax = 16;
+
+// Odd-even transposition sort of an index: only adjacent items that are
+// strictly out of order are exchanged, so it is stable, and the exchanges
+// are selects, not branches.
+template <typename T, typename COMPARE>
+void small_argsort(int64_t* index,
+                   int64_t length,
+                   const T* fromptr,
+                   COMPARE less) {
+  for (int64_t round = 0;  round < length;  round++) {
+    for (int64_t j = round & 1;  j + 1 < length;  j += 2) {
+      int64_t a = index[j];
+      int64_t b = index[j + 1];
+      bool swap = less(fromptr[b], fromptr[a]);
+      index[j] = swap ? b : a;
+      index[j + 1] = swap ? a : b;
+    }
+  }
+}
+
+template <typename T, typename COMPARE>
+void argsort_range(int64_t* index,
+                   int64_t length,
+                   const T* fromptr,
+                   bool stable,
+                   COMPARE less) {
+  if (length <= kSmallArgsortMax) {
+    small_argsort(index, length, fromptr, less);
+  }
+  else if (stable) {
+    std::stable_sort(index, index + length, [&](int64_t i1, int64_t i2) {
+      return less(fromptr[i1], fromptr[i2]);
+    });
+  }
+  else {
+    std::sort(index, index + length, [&](int64_t i1, int64_t i2) {
+      return less(fromptr[i1], fromptr[i2]);
+    });
+  }
+}
 
 template <typename T>
 ERROR awkward_argsort(
@@ -17,61 +62,23 @@ ERROR awkward_argsort(
   int64_t offsetslength,
   bool ascending,
   bool stable) {
-  std::vector<int64_t> result(length);
-  std::iota(result.begin(), result.end(), 0);
-
-  if (ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
-  else if (!ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
+  awkward_parallel_sublists(offsets, offsetslength - 1,
+                            [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin;  i < end;  i++) {
+      int64_t* start = toptr + offsets[i];
+      int64_t sublength = offsets[i + 1] - offsets[i];
+      std::iota(start, start + sublength, offsets[i]);
+      if (ascending) {
+        argsort_range(start, sublength, fromptr, stable, sort_less<T>());
+      }
+      else {
+        argsort_range(start, sublength, fromptr, stable, sort_greater<T>());
+      }
+      for (int64_t j = 0;  j < sublength;  j++) {
+        start[j] -= offsets[i];
+      }
     }
-  }
-  else if (ascending  &&  !stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
-  else {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(result.begin(), offsets[i]);
-      auto stop = std::next(result.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-      std::transform(start, stop, start, [&](int64_t j) -> int64_t {
-        return j - offsets[i];
-      });
-    }
-  }
-
-  for (int64_t i = 0;  i < length;  i++) {
-    toptr[i] = result[i];
-  }
+  });
 
   return success();
 }
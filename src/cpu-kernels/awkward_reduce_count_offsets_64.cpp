@@ -0,0 +1,15 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_count_offsets_64.cpp", line)
+
+#include "awkward/kernels.h"
+
+ERROR awkward_reduce_count_offsets_64(
+  int64_t* toptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    toptr[i] = offsets[i + 1] - offsets[i];
+  }
+  return success();
+}
@@ -0,0 +1,153 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_max_offsets.cpp", line)
+
+#include "awkward/kernels.h"
+
+template <typename OUT, typename IN>
+ERROR awkward_reduce_max_offsets(
+  OUT* toptr,
+  const IN* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  OUT identity) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    OUT x = identity;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      IN y = fromptr[j];
+      x = (y > x ? y : x);
+    }
+    toptr[i] = x;
+  }
+  return success();
+}
+ERROR awkward_reduce_max_offsets_int8_int8_64(
+  int8_t* toptr,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int8_t identity) {
+  return awkward_reduce_max_offsets<int8_t, int8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_int16_int16_64(
+  int16_t* toptr,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int16_t identity) {
+  return awkward_reduce_max_offsets<int16_t, int16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_int32_int32_64(
+  int32_t* toptr,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int32_t identity) {
+  return awkward_reduce_max_offsets<int32_t, int32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_int64_int64_64(
+  int64_t* toptr,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t identity) {
+  return awkward_reduce_max_offsets<int64_t, int64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_uint8_uint8_64(
+  uint8_t* toptr,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  uint8_t identity) {
+  return awkward_reduce_max_offsets<uint8_t, uint8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_uint16_uint16_64(
+  uint16_t* toptr,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  uint16_t identity) {
+  return awkward_reduce_max_offsets<uint16_t, uint16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_uint32_uint32_64(
+  uint32_t* toptr,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  uint32_t identity) {
+  return awkward_reduce_max_offsets<uint32_t, uint32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_uint64_uint64_64(
+  uint64_t* toptr,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  uint64_t identity) {
+  return awkward_reduce_max_offsets<uint64_t, uint64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_float32_float32_64(
+  float* toptr,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  float identity) {
+  return awkward_reduce_max_offsets<float, float>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
+ERROR awkward_reduce_max_offsets_float64_float64_64(
+  double* toptr,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double identity) {
+  return awkward_reduce_max_offsets<double, double>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength,
+    identity);
+}
@@ -3,11 +3,112 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_sort.cpp", line)
 
 #include "awkward/kernels.h"
+#include "awkward/kernel-parallel.h"
+#include "awkward/kernel-sort.h"
 
 #include <algorithm>
-#include <numeric>
 #include <vector>
 
+// Sublists at most this long are sorted by a sorting network; sublists at
+// least as long as kRadixSortMin are radix sorted (if the type allows it).
+const int64_t kSmallSortMax = 16;
+const int64_t kRadixSortMin = 256;
+
+// Odd-even transposition sort: only adjacent items that are strictly out
+// of order are exchanged, so it is stable, and the exchanges are selects,
+// not branches.
+template <typename T, typename COMPARE>
+void small_sort(T* data, int64_t length, COMPARE less) {
+  for (int64_t round = 0;  round < length;  round++) {
+    for (int64_t j = round & 1;  j + 1 < length;  j += 2) {
+      T a = data[j];
+      T b = data[j + 1];
+      bool swap = less(b, a);
+      data[j] = swap ? b : a;
+      data[j + 1] = swap ? a : b;
+    }
+  }
+}
+
+// LSD radix sort, one byte per pass; passes in which every key has the
+// same byte are skipped. The values are moved with their keys, since keys
+// that compare equal (such as those of -0.0 and 0.0) may be of different
+// values. The sort is stable in both directions.
+template <typename T>
+void radix_sort(T* data, int64_t length, bool ascending) {
+  typedef typename radix_key<T>::type U;
+  const int64_t passes = (int64_t)sizeof(U);
+  std::vector<U> keys(length);
+  std::vector<U> keybuffer(length);
+  std::vector<T> buffer(length);
+  std::vector<int64_t> counts(passes*256, 0);
+  for (int64_t i = 0;  i < length;  i++) {
+    U key = ascending ? radix_key<T>::encode(data[i])
+                      : radix_key<T>::encode_descending(data[i]);
+    keys[i] = key;
+    for (int64_t pass = 0;  pass < passes;  pass++) {
+      counts[pass*256 + ((key >> (8*pass)) & 0xff)]++;
+    }
+  }
+  U* from = keys.data();
+  U* to = keybuffer.data();
+  T* fromdata = data;
+  T* todata = buffer.data();
+  for (int64_t pass = 0;  pass < passes;  pass++) {
+    int64_t* count = &counts[pass*256];
+    if (count[(from[0] >> (8*pass)) & 0xff] == length) {
+      continue;
+    }
+    int64_t total = 0;
+    for (int64_t digit = 0;  digit < 256;  digit++) {
+      int64_t tmp = count[digit];
+      count[digit] = total;
+      total += tmp;
+    }
+    for (int64_t i = 0;  i < length;  i++) {
+      int64_t j = count[(from[i] >> (8*pass)) & 0xff]++;
+      to[j] = from[i];
+      todata[j] = fromdata[i];
+    }
+    std::swap(from, to);
+    std::swap(fromdata, todata);
+  }
+  if (fromdata != data) {
+    std::copy(fromdata, fromdata + length, data);
+  }
+}
+
+template <typename T>
+bool can_radix_sort(const T*) {
+  return true;
+}
+
+inline bool can_radix_sort(const bool*) {
+  return false;
+}
+
+inline void radix_sort(bool* data, int64_t length, bool ascending) { }
+
+template <typename T, typename COMPARE>
+void sort_range(T* data,
+                int64_t length,
+                bool ascending,
+                bool stable,
+                COMPARE less) {
+  if (length <= kSmallSortMax) {
+    small_sort(data, length, less);
+  }
+  else if (length >= kRadixSortMin  &&  can_radix_sort(data)) {
+    radix_sort(data, length, ascending);
+  }
+  else if (stable) {
+    std::stable_sort(data, data + length, less);
+  }
+  else {
+    std::sort(data, data + length, less);
+  }
+}
+
 template <typename T>
 ERROR awkward_sort(
   T* toptr,
@@ -18,49 +119,23 @@ ERROR awkward_sort(
   int64_t parentslength,
   bool ascending,
   bool stable) {
-  std::vector<int64_t> index(length);
-  std::iota(index.begin(), index.end(), 0);
+  // Values are copied and then sorted in place, sublist by sublist; no
+  // index over the whole array is needed.
+  std::copy(fromptr, fromptr + parentslength, toptr);
 
-  if (ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
+  awkward_parallel_sublists(offsets, offsetslength - 1,
+                            [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin;  i < end;  i++) {
+      T* start = toptr + offsets[i];
+      int64_t sublength = offsets[i + 1] - offsets[i];
+      if (ascending) {
+        sort_range(start, sublength, ascending, stable, sort_less<T>());
+      }
+      else {
+        sort_range(start, sublength, ascending, stable, sort_greater<T>());
+      }
     }
-  }
-  else if (!ascending  &&  stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-    }
-  }
-  else if (ascending  &&  !stable) {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] < fromptr[i2];
-      });
-    }
-  }
-  else {
-    for (int64_t i = 0;  i < offsetslength - 1;  i++) {
-      auto start = std::next(index.begin(), offsets[i]);
-      auto stop = std::next(index.begin(), offsets[i + 1]);
-      std::sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
-        return fromptr[i1] > fromptr[i2];
-      });
-    }
-  }
-
-  for (int64_t i = 0;  i < parentslength;  i++) {
-    toptr[i] = fromptr[index[i]];
-  }
+  });
 
   return success();
 }
@@ -0,0 +1,241 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/kernel-parallel.cpp", line)
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstdlib>
+#include <deque>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#ifndef _WIN32
+#include <unistd.h>
+#endif
+
+#include "awkward/kernel-parallel.h"
+
+namespace {
+  // Fewer items than this are processed on the calling thread: starting
+  // the workers costs more than it saves.
+  const int64_t kParallelMinItems = 65536;
+
+  // Each thread gets several ranges so that threads finishing early can
+  // take over the work of slower ones.
+  const int64_t kRangesPerThread = 4;
+
+  // One call of awkward_parallel_sublists: every participating thread runs
+  // `task` until the shared range counter is exhausted.
+  struct Job {
+    std::function<void()> task;
+    int64_t unfinished;
+    std::exception_ptr error;
+  };
+
+  // A fixed set of worker threads waiting for Jobs. Several threads may
+  // submit Jobs at the same time; each waits only for its own.
+  class ThreadPool {
+  public:
+    explicit ThreadPool(int64_t num_workers): stopping_(false) {
+      for (int64_t i = 0;  i < num_workers;  i++) {
+        workers_.emplace_back([this]() { work(); });
+      }
+    }
+
+    ~ThreadPool() {
+      {
+        std::lock_guard<std::mutex> lock(mutex_);
+        stopping_ = true;
+      }
+      wakeup_.notify_all();
+      for (auto& worker : workers_) {
+        worker.join();
+      }
+    }
+
+    int64_t
+    num_workers() const {
+      return (int64_t)workers_.size();
+    }
+
+    void
+    run(const std::function<void()>& task) {
+      Job job;
+      job.task = task;
+      job.unfinished = 1 + num_workers();
+      {
+        std::lock_guard<std::mutex> lock(mutex_);
+        for (int64_t i = 0;  i < num_workers();  i++) {
+          queue_.push_back(&job);
+        }
+      }
+      wakeup_.notify_all();
+
+      execute(&job);
+
+      std::unique_lock<std::mutex> lock(mutex_);
+      // Copies that no worker has started yet would find no ranges left.
+      int64_t dropped = (int64_t)std::count(queue_.begin(), queue_.end(), &job);
+      queue_.erase(std::remove(queue_.begin(), queue_.end(), &job),
+                   queue_.end());
+      job.unfinished -= dropped;
+      finished_.wait(lock, [&job]() { return job.unfinished == 0; });
+      if (job.error) {
+        std::rethrow_exception(job.error);
+      }
+    }
+
+  private:
+    void
+    work() {
+      std::unique_lock<std::mutex> lock(mutex_);
+      while (true) {
+        wakeup_.wait(lock, [this]() { return stopping_  ||  !queue_.empty(); });
+        if (queue_.empty()) {
+          return;
+        }
+        Job* job = queue_.front();
+        queue_.pop_front();
+        lock.unlock();
+        execute(job);
+        lock.lock();
+      }
+    }
+
+    void
+    execute(Job* job) {
+      std::exception_ptr error;
+      try {
+        job->task();
+      }
+      catch (...) {
+        error = std::current_exception();
+      }
+      {
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (error  &&  !job->error) {
+          job->error = error;
+        }
+        job->unfinished--;
+      }
+      finished_.notify_all();
+    }
+
+    std::vector<std::thread> workers_;
+    std::deque<Job*> queue_;
+    std::mutex mutex_;
+    std::condition_variable wakeup_;
+    std::condition_variable finished_;
+    bool stopping_;
+  };
+
+  int64_t
+  num_threads_from_environment() {
+    const char* value = std::getenv("AWKWARD_NUM_THREADS");
+    if (value == nullptr) {
+      return 1;
+    }
+    return (int64_t)std::atoll(value);
+  }
+
+  int64_t
+  normalize_num_threads(int64_t num_threads) {
+    if (num_threads <= 0) {
+      num_threads = (int64_t)std::thread::hardware_concurrency();
+    }
+    return std::max(num_threads, (int64_t)1);
+  }
+
+  std::mutex pool_mutex;
+  int64_t num_threads = normalize_num_threads(num_threads_from_environment());
+
+  // Replaced when the number of threads changes; calls that are still
+  // running keep the old pool alive through their own shared_ptr.
+  std::shared_ptr<ThreadPool> pool;
+
+#ifndef _WIN32
+  pid_t pool_pid = 0;
+#endif
+
+  std::shared_ptr<ThreadPool>
+  get_pool() {
+    std::lock_guard<std::mutex> lock(pool_mutex);
+    if (num_threads <= 1) {
+      return std::shared_ptr<ThreadPool>(nullptr);
+    }
+#ifndef _WIN32
+    // A forked process inherits the pool but not its threads, which can
+    // be neither used nor joined; it is abandoned and a new one started.
+    if (pool.get() != nullptr  &&  pool_pid != getpid()) {
+      new std::shared_ptr<ThreadPool>(pool);
+      pool.reset();
+    }
+#endif
+    if (pool.get() == nullptr) {
+      pool = std::make_shared<ThreadPool>(num_threads - 1);
+#ifndef _WIN32
+      pool_pid = getpid();
+#endif
+    }
+    return pool;
+  }
+}
+
+void awkward_set_num_threads(int64_t value) {
+  std::shared_ptr<ThreadPool> old;
+  {
+    std::lock_guard<std::mutex> lock(pool_mutex);
+    num_threads = normalize_num_threads(value);
+    old.swap(pool);
+  }
+}
+
+int64_t awkward_get_num_threads() {
+  std::lock_guard<std::mutex> lock(pool_mutex);
+  return num_threads;
+}
+
+void awkward_parallel_sublists(
+  const int64_t* offsets,
+  int64_t length,
+  const std::function<void(int64_t, int64_t)>& body) {
+  if (length <= 0) {
+    return;
+  }
+  int64_t total = offsets[length] - offsets[0];
+  std::shared_ptr<ThreadPool> threads(nullptr);
+  if (total >= kParallelMinItems  &&  length > 1) {
+    threads = get_pool();
+  }
+  if (threads.get() == nullptr) {
+    body(0, length);
+    return;
+  }
+
+  // Range boundaries are the sublists at which an equal share of the
+  // items begins.
+  int64_t numranges = std::min((1 + threads.get()->num_workers())*kRangesPerThread,
+                               length);
+  std::vector<int64_t> bounds(numranges + 1);
+  bounds[0] = 0;
+  for (int64_t k = 1;  k < numranges;  k++) {
+    int64_t target = offsets[0] + (total / numranges)*k;
+    bounds[k] = std::max(
+      (int64_t)(std::lower_bound(offsets, offsets + length, target) - offsets),
+      bounds[k - 1]);
+  }
+  bounds[numranges] = length;
+
+  std::atomic<int64_t> next(0);
+  threads.get()->run([&]() {
+    for (int64_t k = next++;  k < numranges;  k = next++) {
+      if (bounds[k] < bounds[k + 1]) {
+        body(bounds[k], bounds[k + 1]);
+      }
+    }
+  });
+}
@@ -7,6 +7,98 @@
 #include "awkward/Reducer.h"
 
 namespace awkward {
+  namespace {
+    // Sums and products of small integers are widened to 64 bits, except
+    // where the platform's native integer is 32 bits (see return_dtype).
+#if defined _MSC_VER || defined __i386__
+    typedef int32_t widened_int;
+    typedef uint32_t widened_uint;
+#else
+    typedef int64_t widened_int;
+    typedef uint64_t widened_uint;
+#endif
+
+    template <typename OUT, typename IN>
+    const std::shared_ptr<void>
+    sum_offsets(const std::string& name,
+                const void* data,
+                const Index64& offsets,
+                int64_t outlength) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<OUT> ptr = kernel::malloc<OUT>(
+        ptr_lib, outlength*(int64_t)sizeof(OUT));
+      struct Error err = kernel::reduce_sum_offsets_64<OUT, IN>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const IN*>(data),
+        offsets.data(),
+        outlength);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+
+    template <typename OUT, typename IN>
+    const std::shared_ptr<void>
+    prod_offsets(const std::string& name,
+                 const void* data,
+                 const Index64& offsets,
+                 int64_t outlength) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<OUT> ptr = kernel::malloc<OUT>(
+        ptr_lib, outlength*(int64_t)sizeof(OUT));
+      struct Error err = kernel::reduce_prod_offsets_64<OUT, IN>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const IN*>(data),
+        offsets.data(),
+        outlength);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+
+    template <typename T>
+    const std::shared_ptr<void>
+    min_offsets(const std::string& name,
+                const void* data,
+                const Index64& offsets,
+                int64_t outlength,
+                T identity) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<T> ptr = kernel::malloc<T>(
+        ptr_lib, outlength*(int64_t)sizeof(T));
+      struct Error err = kernel::reduce_min_offsets_64<T, T>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const T*>(data),
+        offsets.data(),
+        outlength,
+        identity);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+
+    template <typename T>
+    const std::shared_ptr<void>
+    max_offsets(const std::string& name,
+                const void* data,
+                const Index64& offsets,
+                int64_t outlength,
+                T identity) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<T> ptr = kernel::malloc<T>(
+        ptr_lib, outlength*(int64_t)sizeof(T));
+      struct Error err = kernel::reduce_max_offsets_64<T, T>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const T*>(data),
+        offsets.data(),
+        outlength,
+        identity);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+  }
+
   util::dtype
   Reducer::return_dtype(util::dtype given_dtype) const {
     return given_dtype;
@@ -17,6 +109,14 @@ namespace awkward {
     return false;
   }
 
+  const std::shared_ptr<void>
+  Reducer::apply_offsets(util::dtype dtype,
+                         const void* data,
+                         const Index64& offsets,
+                         int64_t outlength) const {
+    return std::shared_ptr<void>(nullptr);
+  }
+
   ////////// count
 
   const std::string
@@ -160,6 +260,23 @@ namespace awkward {
                       outlength);
   }
 
+  const std::shared_ptr<void>
+  ReducerCount::apply_offsets(util::dtype dtype,
+                              const void* data,
+                              const Index64& offsets,
+                              int64_t outlength) const {
+    kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+    std::shared_ptr<int64_t> ptr = kernel::malloc<int64_t>(
+      ptr_lib, outlength*(int64_t)sizeof(int64_t));
+    struct Error err = kernel::reduce_count_offsets_64(
+      ptr_lib,
+      ptr.get(),
+      offsets.data(),
+      outlength);
+    util::handle_error(err, util::quote(name()), nullptr);
+    return ptr;
+  }
+
   ////////// count nonzero
 
   const std::string
@@ -766,6 +883,47 @@ namespace awkward {
     return ptr;
   }
 
+  const std::shared_ptr<void>
+  ReducerSum::apply_offsets(util::dtype dtype,
+                            const void* data,
+                            const Index64& offsets,
+                            int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return sum_offsets<widened_int, int8_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int16:
+      return sum_offsets<widened_int, int16_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int32:
+      return sum_offsets<widened_int, int32_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int64:
+      return sum_offsets<int64_t, int64_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint8:
+      return sum_offsets<widened_uint, uint8_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint16:
+      return sum_offsets<widened_uint, uint16_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint32:
+      return sum_offsets<widened_uint, uint32_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint64:
+      return sum_offsets<uint64_t, uint64_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::float32:
+      return sum_offsets<float, float>(
+        name(), data, offsets, outlength);
+    case util::dtype::float64:
+      return sum_offsets<double, double>(
+        name(), data, offsets, outlength);
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   ////////// prod (multiplication)
 
   const std::string
@@ -1121,6 +1279,47 @@ namespace awkward {
     return ptr;
   }
 
+  const std::shared_ptr<void>
+  ReducerProd::apply_offsets(util::dtype dtype,
+                             const void* data,
+                             const Index64& offsets,
+                             int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return prod_offsets<widened_int, int8_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int16:
+      return prod_offsets<widened_int, int16_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int32:
+      return prod_offsets<widened_int, int32_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::int64:
+      return prod_offsets<int64_t, int64_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint8:
+      return prod_offsets<widened_uint, uint8_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint16:
+      return prod_offsets<widened_uint, uint16_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint32:
+      return prod_offsets<widened_uint, uint32_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::uint64:
+      return prod_offsets<uint64_t, uint64_t>(
+        name(), data, offsets, outlength);
+    case util::dtype::float32:
+      return prod_offsets<float, float>(
+        name(), data, offsets, outlength);
+    case util::dtype::float64:
+      return prod_offsets<double, double>(
+        name(), data, offsets, outlength);
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   ////////// any (logical or)
 
   const std::string
@@ -1943,6 +2142,67 @@ namespace awkward {
     return ptr;
   }
 
+  const std::shared_ptr<void>
+  ReducerMin::apply_offsets(util::dtype dtype,
+                            const void* data,
+                            const Index64& offsets,
+                            int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return min_offsets<int8_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int8_t)initial_i64_
+                     : std::numeric_limits<int8_t>::max());
+    case util::dtype::int16:
+      return min_offsets<int16_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int16_t)initial_i64_
+                     : std::numeric_limits<int16_t>::max());
+    case util::dtype::int32:
+      return min_offsets<int32_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int32_t)initial_i64_
+                     : std::numeric_limits<int32_t>::max());
+    case util::dtype::int64:
+      return min_offsets<int64_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int64_t)initial_i64_
+                     : std::numeric_limits<int64_t>::max());
+    case util::dtype::uint8:
+      return min_offsets<uint8_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint8_t)initial_u64_
+                     : std::numeric_limits<uint8_t>::max());
+    case util::dtype::uint16:
+      return min_offsets<uint16_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint16_t)initial_u64_
+                     : std::numeric_limits<uint16_t>::max());
+    case util::dtype::uint32:
+      return min_offsets<uint32_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint32_t)initial_u64_
+                     : std::numeric_limits<uint32_t>::max());
+    case util::dtype::uint64:
+      return min_offsets<uint64_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint64_t)initial_u64_
+                     : std::numeric_limits<uint64_t>::max());
+    case util::dtype::float32:
+      return min_offsets<float>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (float)initial_f64_
+                     : std::numeric_limits<float>::infinity());
+    case util::dtype::float64:
+      return min_offsets<double>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (double)initial_f64_
+                     : std::numeric_limits<double>::infinity());
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   ////////// max (maximum, in which -infinity is the identity)
 
   ReducerMax::ReducerMax(double initial_f64,
@@ -2263,6 +2523,67 @@ namespace awkward {
     return ptr;
   }
 
+  const std::shared_ptr<void>
+  ReducerMax::apply_offsets(util::dtype dtype,
+                            const void* data,
+                            const Index64& offsets,
+                            int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return max_offsets<int8_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int8_t)initial_i64_
+                     : std::numeric_limits<int8_t>::min());
+    case util::dtype::int16:
+      return max_offsets<int16_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int16_t)initial_i64_
+                     : std::numeric_limits<int16_t>::min());
+    case util::dtype::int32:
+      return max_offsets<int32_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int32_t)initial_i64_
+                     : std::numeric_limits<int32_t>::min());
+    case util::dtype::int64:
+      return max_offsets<int64_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (int64_t)initial_i64_
+                     : std::numeric_limits<int64_t>::min());
+    case util::dtype::uint8:
+      return max_offsets<uint8_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint8_t)initial_u64_
+                     : std::numeric_limits<uint8_t>::min());
+    case util::dtype::uint16:
+      return max_offsets<uint16_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint16_t)initial_u64_
+                     : std::numeric_limits<uint16_t>::min());
+    case util::dtype::uint32:
+      return max_offsets<uint32_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint32_t)initial_u64_
+                     : std::numeric_limits<uint32_t>::min());
+    case util::dtype::uint64:
+      return max_offsets<uint64_t>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (uint64_t)initial_u64_
+                     : std::numeric_limits<uint64_t>::min());
+    case util::dtype::float32:
+      return max_offsets<float>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (float)initial_f64_
+                     : -std::numeric_limits<float>::infinity());
+    case util::dtype::float64:
+      return max_offsets<double>(
+        name(), data, offsets, outlength,
+        has_initial_ ? (double)initial_f64_
+                     : -std::numeric_limits<double>::infinity());
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   ////////// argmin (argument minimum, in which -1 is the identity)
 
   const std::string
@@ -1479,34 +1479,46 @@ namespace awkward {
     }
 
     else {
-      int64_t globalstart;
-      int64_t globalstop;
-      struct Error err1 = kernel::ListOffsetArray_reduce_global_startstop_64(
-        kernel::lib::cpu,   // DERIVE
-        &globalstart,
-        &globalstop,
-        offsets_.data(),
-        offsets_.length() - 1);
-      util::handle_error(err1, classname(), identities_.get());
+      // Lists of numbers are reduced segment by segment, straight from
+      // the offsets, without materializing a parents index for the content.
+      ContentPtr outcontent(nullptr);
+      if (NumpyArray* rawcontent = dynamic_cast<NumpyArray*>(content_.get())) {
+        outcontent = rawcontent->reduce_segments(reducer,
+                                                 offsets_,
+                                                 mask,
+                                                 keepdims);
+      }
 
-      Index64 nextparents(globalstop - globalstart);
-      struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
-        kernel::lib::cpu,   // DERIVE
-        nextparents.data(),
-        offsets_.data(),
-        offsets_.length() - 1);
-      util::handle_error(err2, classname(), identities_.get());
+      if (outcontent.get() == nullptr) {
+        int64_t globalstart;
+        int64_t globalstop;
+        struct Error err1 = kernel::ListOffsetArray_reduce_global_startstop_64(
+          kernel::lib::cpu,   // DERIVE
+          &globalstart,
+          &globalstop,
+          offsets_.data(),
+          offsets_.length() - 1);
+        util::handle_error(err1, classname(), identities_.get());
 
-      ContentPtr trimmed = content_.get()->getitem_range_nowrap(globalstart,
-                                                                globalstop);
-      ContentPtr outcontent = trimmed.get()->reduce_next(reducer,
-                                                         negaxis,
-                                                         util::make_starts(offsets_),
-                                                         shifts,
-                                                         nextparents,
-                                                         offsets_.length() - 1,
-                                                         mask,
-                                                         keepdims);
+        Index64 nextparents(globalstop - globalstart);
+        struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
+          kernel::lib::cpu,   // DERIVE
+          nextparents.data(),
+          offsets_.data(),
+          offsets_.length() - 1);
+        util::handle_error(err2, classname(), identities_.get());
+
+        ContentPtr trimmed = content_.get()->getitem_range_nowrap(globalstart,
+                                                                  globalstop);
+        outcontent = trimmed.get()->reduce_next(reducer,
+                                                negaxis,
+                                                util::make_starts(offsets_),
+                                                shifts,
+                                                nextparents,
+                                                offsets_.length() - 1,
+                                                mask,
+                                                keepdims);
+      }
 
       Index64 outoffsets(outlength + 1);
       struct Error err3 = kernel::ListOffsetArray_reduce_local_outoffsets_64(
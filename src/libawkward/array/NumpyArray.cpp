@@ -3189,6 +3189,67 @@ namespace awkward {
     }
   }
 
+  const ContentPtr
+  NumpyArray::reduce_segments(const Reducer& reducer,
+                              const Index64& offsets,
+                              bool mask,
+                              bool keepdims) const {
+    if (shape_.size() != 1  ||  !iscontiguous()  ||
+        reducer.returns_positions()) {
+      return ContentPtr(nullptr);
+    }
+    int64_t outlength = offsets.length() - 1;
+    std::shared_ptr<void> ptr = reducer.apply_offsets(dtype_,
+                                                      data(),
+                                                      offsets,
+                                                      outlength);
+    if (ptr.get() == nullptr) {
+      return ContentPtr(nullptr);
+    }
+
+    util::dtype dtype = reducer.return_dtype(dtype_);
+    std::string format = util::dtype_to_format(dtype);
+    ssize_t itemsize = util::dtype_to_itemsize(dtype);
+
+    std::vector<ssize_t> shape({ (ssize_t)outlength });
+    std::vector<ssize_t> strides({ itemsize });
+    ContentPtr out = std::make_shared<NumpyArray>(Identities::none(),
+                                                  util::Parameters(),
+                                                  ptr,
+                                                  shape,
+                                                  strides,
+                                                  0,
+                                                  itemsize,
+                                                  format,
+                                                  dtype,
+                                                  ptr_lib_);
+
+    if (mask) {
+      Index8 outmask(outlength);
+      struct Error err = kernel::ListOffsetArray_reduce_mask_ByteMaskedArray_64(
+        kernel::lib::cpu,   // DERIVE
+        outmask.data(),
+        offsets.data(),
+        outlength);
+      util::handle_error(err, classname(), nullptr);
+      out = std::make_shared<ByteMaskedArray>(Identities::none(),
+                                              util::Parameters(),
+                                              outmask,
+                                              out,
+                                              false);
+    }
+
+    if (keepdims) {
+      out = std::make_shared<RegularArray>(Identities::none(),
+                                           util::Parameters(),
+                                           out,
+                                           1,
+                                           length());
+    }
+
+    return out;
+  }
+
   const ContentPtr
   NumpyArray::localindex(int64_t axis, int64_t depth) const {
     int64_t posaxis = axis_wrap_if_negative(axis);
@@ -5327,48 +5388,17 @@ namespace awkward {
       parents.length());
     util::handle_error(err2, classname(), nullptr);
 
-    if (stable) {
-      struct Error err3 = kernel::NumpyArray_sort<T>(
-        kernel::lib::cpu,   // DERIVE
-        ptr.get(),
-        data,
-        length,
-        offsets.data(),
-        offsets_length,
-        parents.length(),
-        ascending,
-        stable);
-      util::handle_error(err3, classname(), nullptr);
-    }
-    else {
-      std::shared_ptr<int64_t> tmp_beg_ptr = kernel::malloc<int64_t>(kernel::lib::cpu,   // DERIVE
-                                                                     kMaxLevels*((int64_t)sizeof(int64_t)));
-      std::shared_ptr<int64_t> tmp_end_ptr = kernel::malloc<int64_t>(kernel::lib::cpu,   // DERIVE
-                                                                     kMaxLevels*((int64_t)sizeof(int64_t)));
-
-      struct Error err3 = kernel::NumpyArray_fill(
-        kernel::lib::cpu,   // DERIVE
-        ptr.get(),
-        0,
-        data,
-        length);
-      util::handle_error(err3, classname(), nullptr);
-
-      Index64 sort_starts = util::make_starts(offsets);
-      Index64 sort_stops = util::make_stops(offsets);
-
-      struct Error err4 = kernel::NumpyArray_quick_sort<T>(
-        kernel::lib::cpu,   // DERIVE
-        ptr.get(),
-        tmp_beg_ptr.get(),
-        tmp_end_ptr.get(),
-        sort_starts.data(),
-        sort_stops.data(),
-        ascending,
-        sort_starts.length(),
-        kMaxLevels);
-      util::handle_error(err4, classname(), nullptr);
-    }
+    struct Error err3 = kernel::NumpyArray_sort<T>(
+      kernel::lib::cpu,   // DERIVE
+      ptr.get(),
+      data,
+      length,
+      offsets.data(),
+      offsets_length,
+      parents.length(),
+      ascending,
+      stable);
+    util::handle_error(err3, classname(), nullptr);
 
     return ptr;
   }
@@ -3,9 +3,14 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/array/VirtualArray.cpp", line)
 #define FILENAME_C(line) FILENAME_FOR_EXCEPTIONS_C("src/libawkward/array/VirtualArray.cpp", line)
 
+#include <condition_variable>
 #include <iomanip>
+#include <map>
+#include <mutex>
 #include <sstream>
 #include <stdexcept>
+#include <thread>
+#include <tuple>
 
 #include "awkward/common.h"
 #include "awkward/Reducer.h"
@@ -365,30 +370,132 @@ namespace awkward {
     return kernel::lib::cpu;
   }
 
+  namespace {
+    /// @brief One generation of a VirtualArray's content, shared by the
+    /// thread that runs the generator and any threads waiting for it.
+    struct InFlight {
+      std::mutex mutex;
+      std::condition_variable finished;
+      bool done = false;
+      bool failed = false;
+      ContentPtr result;
+      std::thread::id owner;
+    };
+
+    /// @brief Identifies a generation: arrays that share a cache and a key
+    /// share their generated array, but uncached arrays share only their
+    /// generator (so arrays with the same key and no cache are distinct).
+    typedef std::tuple<const ArrayCache*, const ArrayGenerator*, std::string>
+      InFlightKey;
+
+    std::mutex in_flight_mutex;
+    std::map<InFlightKey, std::shared_ptr<InFlight>> in_flight;
+
+    std::function<void(const std::function<void()>&)> wait_function =
+      [](const std::function<void()>& wait) { wait(); };
+
+    void
+    finish_generation(const InFlightKey& key,
+                      const std::shared_ptr<InFlight>& generation,
+                      const ContentPtr& result) {
+      {
+        std::lock_guard<std::mutex> lock(in_flight_mutex);
+        in_flight.erase(key);
+      }
+      {
+        std::lock_guard<std::mutex> lock(generation.get()->mutex);
+        generation.get()->done = true;
+        generation.get()->failed = (result.get() == nullptr);
+        generation.get()->result = result;
+      }
+      generation.get()->finished.notify_all();
+    }
+  }
+
+  void
+  VirtualArray::set_wait_function(
+    const std::function<void(const std::function<void()>&)>& wait) {
+    wait_function = wait;
+  }
+
   const ContentPtr
   VirtualArray::array() const {
     ContentPtr out(nullptr);
     kernel::lib src_ptrlib = check_key(cache_key_);
 
     if (cache_.get() != nullptr) {
-      if (src_ptrlib != ptr_lib_) {
-        out = cache_.get()->get(cache_key())->copy_to(ptr_lib_);
+      out = cache_.get()->get(cache_key());
+      if (out.get() != nullptr) {
+        if (src_ptrlib == ptr_lib_) {
+          // already cached under this key; setting it again would only
+          // make another call into the cache
+          return out;
+        }
+        out = out.get()->copy_to(ptr_lib_);
+        cache_.get()->set(
+          kernel::fully_qualified_cache_key(ptr_lib_, cache_key()), out);
+        return out;
       }
-      else {
-        out = cache_.get()->get(cache_key());
+    }
+
+    // Only one thread generates a given (cache, key) at a time, or a given
+    // generator if there is no cache; the others wait for its result. A
+    // thread that reenters its own generation (a generator that reads this
+    // array) generates again instead of waiting on itself.
+    InFlightKey key(cache_.get(),
+                    cache_.get() == nullptr ? generator_.get() : nullptr,
+                    cache_key_);
+    std::shared_ptr<InFlight> generation;
+    bool owner = false;
+    {
+      std::lock_guard<std::mutex> lock(in_flight_mutex);
+      auto found = in_flight.find(key);
+      if (found == in_flight.end()) {
+        generation = std::make_shared<InFlight>();
+        generation.get()->owner = std::this_thread::get_id();
+        in_flight[key] = generation;
+        owner = true;
+      }
+      else if (found->second.get()->owner != std::this_thread::get_id()) {
+        generation = found->second;
+      }
+    }
+
+    if (generation.get() != nullptr  &&  !owner) {
+      InFlight* waiting = generation.get();
+      wait_function([waiting]() {
+        std::unique_lock<std::mutex> lock(waiting->mutex);
+        waiting->finished.wait(lock, [waiting]() { return waiting->done; });
+      });
+      if (!waiting->failed) {
+        return waiting->result;
       }
+      // The generator raised an exception in the other thread; run it here
+      // so that this thread gets an exception of its own.
     }
-    if (out.get() == nullptr) {
+
+    try {
       if (src_ptrlib != ptr_lib_) {
         out = generator_.get()->generate_and_check()->copy_to(src_ptrlib);
       }
       else {
         out = generator_.get()->generate_and_check();
       }
+      // set before finishing the generation, so that threads arriving after
+      // it has finished find the array in the cache
+      if (cache_.get() != nullptr) {
+        cache_.get()->set(
+          kernel::fully_qualified_cache_key(ptr_lib_, cache_key()), out);
+      }
     }
-    if (cache_.get() != nullptr) {
-      cache_.get()->set(kernel::fully_qualified_cache_key(ptr_lib_, cache_key()),
-                        out);
+    catch (...) {
+      if (owner) {
+        finish_generation(key, generation, nullptr);
+      }
+      throw;
+    }
+    if (owner) {
+      finish_generation(key, generation, out);
     }
     return out;
   }
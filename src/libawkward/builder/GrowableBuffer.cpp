@@ -63,6 +63,10 @@ namespace awkward {
                                     int64_t reserved)
       : options_(options)
       , ptr_(ptr)
+      , ptr_reserved_(reserved)
+      , tail_(ptr.get())
+      , tail_length_(length)
+      , tail_reserved_(reserved)
       , length_(length)
       , reserved_(reserved) { }
 
@@ -76,6 +80,9 @@ namespace awkward {
   template <typename T>
   const std::shared_ptr<T>
   GrowableBuffer<T>::ptr() const {
+    if (!panels_.empty()) {
+      concatenate(reserved_);
+    }
     return ptr_;
   }
 
@@ -91,7 +98,11 @@ namespace awkward {
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
+    else if (!panels_.empty()) {
+      concatenate(reserved_);
+    }
     length_ = newlength;
+    tail_length_ = newlength;
   }
 
   template <typename T>
@@ -104,34 +115,84 @@ namespace awkward {
   void
   GrowableBuffer<T>::set_reserved(int64_t minreserved) {
     if (minreserved > reserved_) {
-      std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, minreserved*(int64_t)sizeof(T));
-      memcpy(ptr.get(), ptr_.get(), (size_t)length_ * sizeof(T));
-      ptr_ = ptr;
+      concatenate(minreserved);
       reserved_ = minreserved;
     }
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate(int64_t newreserved) const {
+    std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, newreserved*(int64_t)sizeof(T));
+    int64_t remaining = length_;
+    int64_t copying = (remaining < ptr_reserved_ ? remaining : ptr_reserved_);
+    memcpy(ptr.get(), ptr_.get(), (size_t)copying * sizeof(T));
+    remaining -= copying;
+    ptr_ = ptr;
+    // release each panel as soon as it is copied, so that the old and new
+    // data are never both fully in memory
+    T* rawptr = ptr.get() + copying;
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      copying = (remaining < panels_reserved_[i] ? remaining : panels_reserved_[i]);
+      memcpy(rawptr, panels_[i].get(), (size_t)copying * sizeof(T));
+      rawptr += copying;
+      remaining -= copying;
+      panels_[i] = std::shared_ptr<T>(nullptr);
+    }
+    panels_.clear();
+    panels_reserved_.clear();
+    ptr_reserved_ = newreserved;
+    tail_ = ptr_.get();
+    tail_length_ = length_;
+    tail_reserved_ = newreserved;
+  }
+
   template <typename T>
   void
   GrowableBuffer<T>::clear() {
     length_ = 0;
     reserved_ = options_.initial();
     ptr_ = kernel::malloc<T>(kernel::lib::cpu, options_.initial()*(int64_t)sizeof(T));
+    ptr_reserved_ = reserved_;
+    panels_.clear();
+    panels_reserved_.clear();
+    tail_ = ptr_.get();
+    tail_length_ = 0;
+    tail_reserved_ = reserved_;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::append(T datum) {
-    if (length_ == reserved_) {
-      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+    if (tail_length_ == tail_reserved_) {
+      int64_t newreserved = (int64_t)ceil(reserved_ * options_.resize());
+      int64_t panel = (newreserved > reserved_ ? newreserved - reserved_ : 1);
+      panels_.push_back(
+        kernel::malloc<T>(kernel::lib::cpu, panel*(int64_t)sizeof(T)));
+      panels_reserved_.push_back(panel);
+      tail_ = panels_.back().get();
+      tail_length_ = 0;
+      tail_reserved_ = panel;
+      reserved_ += panel;
     }
-    ptr_.get()[length_] = datum;
+    tail_[tail_length_] = datum;
+    tail_length_++;
     length_++;
   }
 
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
+    if (at < ptr_reserved_) {
+      return ptr_.get()[at];
+    }
+    at -= ptr_reserved_;
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      if (at < panels_reserved_[i]) {
+        return panels_[i].get()[at];
+      }
+      at -= panels_reserved_[i];
+    }
     return ptr_.get()[at];
   }
 
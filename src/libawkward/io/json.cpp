@@ -2,7 +2,9 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/io/json.cpp", line)
 
+#include <cmath>
 #include <complex>
+#include <limits>
 
 #include "rapidjson/document.h"
 #include "rapidjson/reader.h"
@@ -14,7 +16,15 @@
 #include "rapidjson/error/en.h"
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/GrowableBuffer.h"
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/RegularArray.h"
 #include "awkward/Content.h"
+#include "awkward/Identities.h"
 
 #include "awkward/io/json.h"
 
@@ -761,6 +771,11 @@ namespace awkward {
       return builder_.snapshot();
     }
 
+    const std::string
+    error() const {
+      return std::string();
+    }
+
   private:
     ArrayBuilder builder_;
     bool moved_;
@@ -769,40 +784,771 @@ namespace awkward {
     const char* minus_infinity_string_;
   };
 
-  template<typename HANDLER, typename STREAM>
+  template <typename T>
   const ContentPtr
-  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
-    int64_t number = 0;
+  growablebuffer_to_numpyarray(const GrowableBuffer<T>& buffer,
+                               util::dtype dtype) {
+    std::vector<ssize_t> shape = { (ssize_t)buffer.length() };
+    std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+    return std::make_shared<NumpyArray>(Identities::none(),
+                                        util::Parameters(),
+                                        buffer.ptr(),
+                                        shape,
+                                        strides,
+                                        0,
+                                        sizeof(T),
+                                        util::dtype_to_format(dtype),
+                                        dtype,
+                                        kernel::lib::cpu);
+  }
+
+  template <typename T>
+  bool
+  append_integer(GrowableBuffer<T>& buffer, int64_t x) {
+    if (x < (int64_t)std::numeric_limits<T>::min()  ||
+        (x > 0  &&  (uint64_t)x > (uint64_t)std::numeric_limits<T>::max())) {
+      return false;
+    }
+    buffer.append((T)x);
+    return true;
+  }
+
+  // Fills typed buffers for a fixed Form. Each Form node is compiled into
+  // a SchemaNode; since a Form is a tree, a node can appear at most once in
+  // the stack of open lists and records, so per-node state suffices.
+  class HandlerSchema: public rj::BaseReaderHandler<rj::UTF8<>, HandlerSchema> {
+  public:
+    HandlerSchema(const FormPtr& form,
+                  const ArrayBuilderOptions& options,
+                  bool outer_list,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string)
+        : options_(options)
+        , moved_(false)
+        , outer_(outer_list ? Outer::waiting : Outer::none)
+        , nan_string_(nan_string)
+        , infinity_string_(infinity_string)
+        , minus_infinity_string_(minus_infinity_string) {
+      root_ = compile(form);
+    }
+
+    void
+    reset_moved() {
+      moved_ = false;
+    }
+
+    bool
+    moved() const {
+      return moved_;
+    }
+
+    bool Null() {
+      moved_ = true;
+      int64_t node = target();
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::option) {
+        n.length++;
+        int64_[(size_t)n.buffer].append(-1);
+        return true;
+      }
+      return mismatch(node, "null");
+    }
+
+    bool Bool(bool x) {
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::boolean) {
+        n.length++;
+        boolean_[(size_t)n.buffer].append(x);
+        return true;
+      }
+      return mismatch(node, "boolean");
+    }
+
+    bool Int(int x) {
+      return integer((int64_t)x);
+    }
+
+    bool Uint(unsigned int x) {
+      return integer((int64_t)x);
+    }
+
+    bool Int64(int64_t x) {
+      return integer(x);
+    }
+
+    bool Uint64(uint64_t x) {
+      if (x <= (uint64_t)std::numeric_limits<int64_t>::max()) {
+        return integer((int64_t)x);
+      }
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::integer  &&  n.dtype == util::dtype::uint64) {
+        n.length++;
+        uint64_[(size_t)n.buffer].append(x);
+        return true;
+      }
+      else if (n.kind == Kind::real) {
+        return real(n, (double)x);
+      }
+      return mismatch(node, "integer " + std::to_string(x));
+    }
+
+    bool Double(double x) {
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::real) {
+        return real(n, x);
+      }
+      return mismatch(node, "floating-point number");
+    }
+
+    bool
+    String(const char* str, rj::SizeType length, bool copy) {
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::string) {
+        SchemaNode& content = nodes_[(size_t)n.content];
+        GrowableBuffer<uint8_t>& chars = uint8_[(size_t)content.buffer];
+        int64_t start = chars.length();
+        int64_t stop = start + (int64_t)length;
+        if (stop > chars.reserved()) {
+          int64_t grown = (int64_t)ceil((double)chars.reserved() * options_.resize());
+          chars.set_reserved(grown > stop ? grown : stop);
+        }
+        chars.set_length(stop);
+        memcpy(chars.ptr().get() + start, str, (size_t)length);
+        content.length = stop;
+        int64_[(size_t)n.buffer].append(stop);
+        n.length++;
+        return true;
+      }
+      else if (n.kind == Kind::real) {
+        if (nan_string_ != nullptr  &&  strcmp(str, nan_string_) == 0) {
+          return real(n, std::numeric_limits<double>::quiet_NaN());
+        }
+        else if (infinity_string_ != nullptr  &&  strcmp(str, infinity_string_) == 0) {
+          return real(n, std::numeric_limits<double>::infinity());
+        }
+        else if (minus_infinity_string_ != nullptr  &&  strcmp(str, minus_infinity_string_) == 0) {
+          return real(n, -std::numeric_limits<double>::infinity());
+        }
+      }
+      return mismatch(node, "string");
+    }
+
+    bool
+    StartArray() {
+      moved_ = true;
+      if (stack_.empty()  &&  outer_ == Outer::waiting) {
+        outer_ = Outer::open;
+        stack_.push_back(-1);
+        return true;
+      }
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::list) {
+        n.length++;
+        stack_.push_back(node);
+        return true;
+      }
+      else if (n.kind == Kind::regular) {
+        n.length++;
+        n.current = 0;
+        stack_.push_back(node);
+        return true;
+      }
+      return mismatch(node, "list");
+    }
+
+    bool
+    EndArray(rj::SizeType numfields) {
+      moved_ = true;
+      int64_t node = stack_.back();
+      if (node == -1) {
+        outer_ = Outer::closed;
+        stack_.pop_back();
+        return true;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::list) {
+        int64_[(size_t)n.buffer].append(nodes_[(size_t)n.content].length);
+      }
+      else if (n.current != n.size) {
+        return mismatch(node, "list of length " + std::to_string(n.current));
+      }
+      stack_.pop_back();
+      return true;
+    }
+
+    bool
+    StartObject() {
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      if (n.kind == Kind::record) {
+        n.length++;
+        n.current = -1;
+        std::fill(n.seen.begin(), n.seen.end(), false);
+        stack_.push_back(node);
+        return true;
+      }
+      return mismatch(node, "record");
+    }
+
+    bool
+    EndObject(rj::SizeType numfields) {
+      moved_ = true;
+      int64_t node = stack_.back();
+      SchemaNode& n = nodes_[(size_t)node];
+      for (size_t i = 0;  i < n.fields.size();  i++) {
+        if (!n.seen[i]) {
+          SchemaNode& field = nodes_[(size_t)n.fields[i]];
+          if (field.kind != Kind::option) {
+            error_ = std::string("JSON record is missing field \"") + n.names[i]
+                     + std::string("\" (form_key \"") + n.form_key
+                     + std::string("\"), which is not an option-type");
+            return false;
+          }
+          field.length++;
+          int64_[(size_t)field.buffer].append(-1);
+        }
+      }
+      stack_.pop_back();
+      return true;
+    }
+
+    bool
+    Key(const char* str, rj::SizeType length, bool copy) {
+      moved_ = true;
+      SchemaNode& n = nodes_[(size_t)stack_.back()];
+      // fields usually arrive in the same order, so start after the last one
+      int64_t numfields = (int64_t)n.names.size();
+      int64_t found = -1;
+      for (int64_t j = 0;  j < numfields;  j++) {
+        int64_t i = (n.current + 1 + j) % numfields;
+        const std::string& name = n.names[(size_t)i];
+        if (name.length() == (size_t)length  &&
+            memcmp(name.data(), str, (size_t)length) == 0) {
+          found = i;
+          break;
+        }
+      }
+      if (found == -1) {
+        error_ = std::string("JSON record has unexpected field \"")
+                 + std::string(str, (size_t)length)
+                 + std::string("\" (form_key \"") + n.form_key
+                 + std::string("\")");
+        return false;
+      }
+      if (n.seen[(size_t)found]) {
+        error_ = std::string("JSON record has duplicate field \"")
+                 + n.names[(size_t)found] + std::string("\" (form_key \"")
+                 + n.form_key + std::string("\")");
+        return false;
+      }
+      n.seen[(size_t)found] = true;
+      n.current = found;
+      return true;
+    }
+
+    const std::string
+    error() const {
+      return error_;
+    }
+
+    const JsonSchemaOutput
+    output(bool single) const {
+      std::map<std::string, ContentPtr> buffers;
+      for (auto x : outputs_) {
+        size_t i = (size_t)x.buffer;
+        switch (x.dtype) {
+        case util::dtype::boolean:
+          buffers[x.name] = growablebuffer_to_numpyarray(boolean_[i], x.dtype);
+          break;
+        case util::dtype::int8:
+          buffers[x.name] = growablebuffer_to_numpyarray(int8_[i], x.dtype);
+          break;
+        case util::dtype::int16:
+          buffers[x.name] = growablebuffer_to_numpyarray(int16_[i], x.dtype);
+          break;
+        case util::dtype::int32:
+          buffers[x.name] = growablebuffer_to_numpyarray(int32_[i], x.dtype);
+          break;
+        case util::dtype::int64:
+          buffers[x.name] = growablebuffer_to_numpyarray(int64_[i], x.dtype);
+          break;
+        case util::dtype::uint8:
+          buffers[x.name] = growablebuffer_to_numpyarray(uint8_[i], x.dtype);
+          break;
+        case util::dtype::uint16:
+          buffers[x.name] = growablebuffer_to_numpyarray(uint16_[i], x.dtype);
+          break;
+        case util::dtype::uint32:
+          buffers[x.name] = growablebuffer_to_numpyarray(uint32_[i], x.dtype);
+          break;
+        case util::dtype::uint64:
+          buffers[x.name] = growablebuffer_to_numpyarray(uint64_[i], x.dtype);
+          break;
+        case util::dtype::float32:
+          buffers[x.name] = growablebuffer_to_numpyarray(float32_[i], x.dtype);
+          break;
+        default:
+          buffers[x.name] = growablebuffer_to_numpyarray(float64_[i], x.dtype);
+          break;
+        }
+      }
+      return JsonSchemaOutput(nodes_[(size_t)root_].length, single, buffers);
+    }
+
+  private:
+    enum class Kind {
+      boolean, integer, real, string, list, regular, record, option, empty
+    };
+
+    struct SchemaNode {
+      Kind kind;
+      util::dtype dtype;
+      std::string form_key;
+      // index of the data, offsets, or index buffer in its typed vector
+      int64_t buffer;
+      // child node of lists, strings, and options
+      int64_t content;
+      // RegularForm size
+      int64_t size;
+      std::vector<int64_t> fields;
+      std::vector<std::string> names;
+      std::vector<bool> seen;
+      // current field of a record or number of items in a regular list
+      int64_t current;
+      // number of values assigned to this node so far
+      int64_t length;
+    };
+
+    enum class Outer {
+      none, waiting, open, closed
+    };
+
+    struct SchemaOutput {
+      std::string name;
+      util::dtype dtype;
+      int64_t buffer;
+    };
+
+    int64_t
+    compile(const FormPtr& form) {
+      if (form.get()->form_key().get() == nullptr) {
+        throw std::invalid_argument(
+          std::string("every node of a Form used to read JSON must have a "
+                      "form_key: ") + form.get()->tostring()
+          + FILENAME(__LINE__));
+      }
+      std::string form_key = *form.get()->form_key().get();
+
+      SchemaNode node;
+      node.dtype = util::dtype::NOT_PRIMITIVE;
+      node.form_key = form_key;
+      node.buffer = -1;
+      node.content = -1;
+      node.size = 0;
+      node.current = -1;
+      node.length = 0;
+
+      if (NumpyForm* raw = dynamic_cast<NumpyForm*>(form.get())) {
+        if (!raw->inner_shape().empty()) {
+          throw std::invalid_argument(
+            std::string("NumpyForm with inner_shape cannot be used to read "
+                        "JSON; use RegularForm instead")
+            + FILENAME(__LINE__));
+        }
+        node.dtype = raw->dtype();
+        switch (node.dtype) {
+        case util::dtype::boolean:
+          node.kind = Kind::boolean;
+          break;
+        case util::dtype::int8:
+        case util::dtype::int16:
+        case util::dtype::int32:
+        case util::dtype::int64:
+        case util::dtype::uint8:
+        case util::dtype::uint16:
+        case util::dtype::uint32:
+        case util::dtype::uint64:
+          node.kind = Kind::integer;
+          break;
+        case util::dtype::float32:
+        case util::dtype::float64:
+          node.kind = Kind::real;
+          break;
+        default:
+          throw std::invalid_argument(
+            std::string("NumpyForm of type ") + raw->primitive()
+            + std::string(" cannot be used to read JSON")
+            + FILENAME(__LINE__));
+        }
+        node.buffer = add_buffer(node.dtype, form_key + std::string("-data"));
+      }
+
+      else if (ListOffsetForm* raw = dynamic_cast<ListOffsetForm*>(form.get())) {
+        if (raw->offsets() != Index::Form::i64) {
+          throw std::invalid_argument(
+            std::string("ListOffsetForm used to read JSON must have i64 offsets")
+            + FILENAME(__LINE__));
+        }
+        node.kind = Kind::list;
+        if (raw->parameter_equals("__array__", "\"string\"")  ||
+            raw->parameter_equals("__array__", "\"bytestring\"")) {
+          node.kind = Kind::string;
+        }
+        node.buffer = add_buffer(util::dtype::int64,
+                                 form_key + std::string("-offsets"));
+        int64_[(size_t)node.buffer].append(0);
+        node.content = compile(raw->content());
+        if (node.kind == Kind::string  &&
+            nodes_[(size_t)node.content].dtype != util::dtype::uint8) {
+          throw std::invalid_argument(
+            std::string("strings used to read JSON must have uint8 content")
+            + FILENAME(__LINE__));
+        }
+      }
+
+      else if (RegularForm* raw = dynamic_cast<RegularForm*>(form.get())) {
+        node.kind = Kind::regular;
+        node.size = raw->size();
+        node.content = compile(raw->content());
+      }
+
+      else if (RecordForm* raw = dynamic_cast<RecordForm*>(form.get())) {
+        if (raw->istuple()) {
+          throw std::invalid_argument(
+            std::string("RecordForm used to read JSON must have field names")
+            + FILENAME(__LINE__));
+        }
+        node.kind = Kind::record;
+        for (auto pair : raw->items()) {
+          node.names.push_back(pair.first);
+          node.fields.push_back(compile(pair.second));
+          node.seen.push_back(false);
+        }
+      }
+
+      else if (IndexedOptionForm* raw =
+               dynamic_cast<IndexedOptionForm*>(form.get())) {
+        if (raw->index() != Index::Form::i64) {
+          throw std::invalid_argument(
+            std::string("IndexedOptionForm used to read JSON must have an "
+                        "i64 index")
+            + FILENAME(__LINE__));
+        }
+        node.kind = Kind::option;
+        node.buffer = add_buffer(util::dtype::int64,
+                                 form_key + std::string("-index"));
+        node.content = compile(raw->content());
+      }
+
+      else if (dynamic_cast<EmptyForm*>(form.get())) {
+        node.kind = Kind::empty;
+      }
+
+      else {
+        throw std::invalid_argument(
+          std::string("Form cannot be used to read JSON: ")
+          + form.get()->tostring()
+          + FILENAME(__LINE__));
+      }
+
+      nodes_.push_back(node);
+      return (int64_t)nodes_.size() - 1;
+    }
+
+    int64_t
+    add_buffer(util::dtype dtype, const std::string& name) {
+      int64_t buffer;
+      switch (dtype) {
+      case util::dtype::boolean:
+        buffer = (int64_t)boolean_.size();
+        boolean_.push_back(GrowableBuffer<bool>::empty(options_));
+        break;
+      case util::dtype::int8:
+        buffer = (int64_t)int8_.size();
+        int8_.push_back(GrowableBuffer<int8_t>::empty(options_));
+        break;
+      case util::dtype::int16:
+        buffer = (int64_t)int16_.size();
+        int16_.push_back(GrowableBuffer<int16_t>::empty(options_));
+        break;
+      case util::dtype::int32:
+        buffer = (int64_t)int32_.size();
+        int32_.push_back(GrowableBuffer<int32_t>::empty(options_));
+        break;
+      case util::dtype::int64:
+        buffer = (int64_t)int64_.size();
+        int64_.push_back(GrowableBuffer<int64_t>::empty(options_));
+        break;
+      case util::dtype::uint8:
+        buffer = (int64_t)uint8_.size();
+        uint8_.push_back(GrowableBuffer<uint8_t>::empty(options_));
+        break;
+      case util::dtype::uint16:
+        buffer = (int64_t)uint16_.size();
+        uint16_.push_back(GrowableBuffer<uint16_t>::empty(options_));
+        break;
+      case util::dtype::uint32:
+        buffer = (int64_t)uint32_.size();
+        uint32_.push_back(GrowableBuffer<uint32_t>::empty(options_));
+        break;
+      case util::dtype::uint64:
+        buffer = (int64_t)uint64_.size();
+        uint64_.push_back(GrowableBuffer<uint64_t>::empty(options_));
+        break;
+      case util::dtype::float32:
+        buffer = (int64_t)float32_.size();
+        float32_.push_back(GrowableBuffer<float>::empty(options_));
+        break;
+      default:
+        buffer = (int64_t)float64_.size();
+        float64_.push_back(GrowableBuffer<double>::empty(options_));
+        break;
+      }
+      outputs_.push_back(SchemaOutput{ name, dtype, buffer });
+      return buffer;
+    }
+
+    // Returns the node for the next value or -1 if there should be none.
+    int64_t
+    target() {
+      if (stack_.empty()  &&  outer_ == Outer::closed) {
+        error_ = std::string("JSON has more top-level values after an array "
+                             "of items");
+        return -1;
+      }
+      if (stack_.empty()  ||  stack_.back() == -1) {
+        return root_;
+      }
+      SchemaNode& top = nodes_[(size_t)stack_.back()];
+      if (top.kind == Kind::list) {
+        return top.content;
+      }
+      else if (top.kind == Kind::regular) {
+        top.current++;
+        return top.content;
+      }
+      else {
+        return top.fields[(size_t)top.current];
+      }
+    }
+
+    int64_t
+    nonnull(int64_t node) {
+      while (node != -1  &&  nodes_[(size_t)node].kind == Kind::option) {
+        SchemaNode& option = nodes_[(size_t)node];
+        option.length++;
+        int64_[(size_t)option.buffer].append(
+          nodes_[(size_t)option.content].length);
+        node = option.content;
+      }
+      return node;
+    }
+
+    bool
+    integer(int64_t x) {
+      moved_ = true;
+      int64_t node = nonnull(target());
+      if (node == -1) {
+        return false;
+      }
+      SchemaNode& n = nodes_[(size_t)node];
+      size_t i = (size_t)n.buffer;
+      bool ok = true;
+      if (n.kind == Kind::integer) {
+        switch (n.dtype) {
+        case util::dtype::int8:
+          ok = append_integer(int8_[i], x);
+          break;
+        case util::dtype::int16:
+          ok = append_integer(int16_[i], x);
+          break;
+        case util::dtype::int32:
+          ok = append_integer(int32_[i], x);
+          break;
+        case util::dtype::int64:
+          int64_[i].append(x);
+          break;
+        case util::dtype::uint8:
+          ok = append_integer(uint8_[i], x);
+          break;
+        case util::dtype::uint16:
+          ok = append_integer(uint16_[i], x);
+          break;
+        case util::dtype::uint32:
+          ok = append_integer(uint32_[i], x);
+          break;
+        default:
+          ok = append_integer(uint64_[i], x);
+          break;
+        }
+        if (ok) {
+          n.length++;
+          return true;
+        }
+      }
+      else if (n.kind == Kind::real) {
+        return real(n, (double)x);
+      }
+      return mismatch(node, std::string("integer ") + std::to_string(x));
+    }
+
+    bool
+    real(SchemaNode& n, double x) {
+      if (n.dtype == util::dtype::float32) {
+        float32_[(size_t)n.buffer].append((float)x);
+      }
+      else {
+        float64_[(size_t)n.buffer].append(x);
+      }
+      n.length++;
+      return true;
+    }
+
+    bool
+    mismatch(int64_t node, const std::string& found) {
+      const SchemaNode& n = nodes_[(size_t)node];
+      std::string expected;
+      switch (n.kind) {
+      case Kind::boolean:
+      case Kind::integer:
+      case Kind::real:
+        expected = util::dtype_to_name(n.dtype);
+        break;
+      case Kind::string:
+        expected = "string";
+        break;
+      case Kind::list:
+        expected = "list";
+        break;
+      case Kind::regular:
+        expected = std::string("list of length ") + std::to_string(n.size);
+        break;
+      case Kind::record:
+        expected = "record";
+        break;
+      case Kind::option:
+        expected = "option";
+        break;
+      default:
+        expected = "no values (EmptyForm)";
+        break;
+      }
+      error_ = std::string("JSON does not conform to the form: expected ")
+               + expected + std::string(" (form_key \"") + n.form_key
+               + std::string("\"), found ") + found;
+      return false;
+    }
+
+    const ArrayBuilderOptions options_;
+    bool moved_;
+    Outer outer_;
+    int64_t root_;
+    const char* nan_string_;
+    const char* infinity_string_;
+    const char* minus_infinity_string_;
+    std::string error_;
+    std::vector<SchemaNode> nodes_;
+    std::vector<int64_t> stack_;
+    std::vector<SchemaOutput> outputs_;
+    std::vector<GrowableBuffer<bool>> boolean_;
+    std::vector<GrowableBuffer<int8_t>> int8_;
+    std::vector<GrowableBuffer<int16_t>> int16_;
+    std::vector<GrowableBuffer<int32_t>> int32_;
+    std::vector<GrowableBuffer<int64_t>> int64_;
+    std::vector<GrowableBuffer<uint8_t>> uint8_;
+    std::vector<GrowableBuffer<uint16_t>> uint16_;
+    std::vector<GrowableBuffer<uint32_t>> uint32_;
+    std::vector<GrowableBuffer<uint64_t>> uint64_;
+    std::vector<GrowableBuffer<float>> float32_;
+    std::vector<GrowableBuffer<double>> float64_;
+  };
+
+  // Parses a sequence of top-level JSON values, returning false with an
+  // error message and the position of the failure if it does not succeed.
+  template<typename HANDLER, typename STREAM>
+  bool
+  parse_documents(HANDLER& handler,
+                  STREAM& stream,
+                  int64_t& number,
+                  std::string& error,
+                  size_t& position) {
+    rj::Reader reader;
+    number = 0;
     while (stream.Peek() != 0) {
       handler.reset_moved();
       bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
+      position = stream.Tell();
       if (handler.moved()) {
         if (!fully_parsed) {
-          if (stream.Peek() == 0) {
-            throw std::invalid_argument(
-                std::string("incomplete JSON object at the end of the stream")
-                + FILENAME(__LINE__));
+          if (!handler.error().empty()) {
+            error = handler.error() + std::string(" at char ")
+                    + std::to_string(position);
+          }
+          else if (stream.Peek() == 0) {
+            error = std::string("incomplete JSON object at the end of the stream");
           }
           else {
-            throw std::invalid_argument(
-              std::string("JSON File error at char ")
-              + std::to_string(stream.Tell()) + std::string(": \'")
-              + stream.Peek() + std::string("\'")
-              + FILENAME(__LINE__));
+            error = std::string("JSON File error at char ")
+                    + std::to_string(position) + std::string(": \'")
+                    + stream.Peek() + std::string("\'");
           }
+          return false;
         }
         else {
           number++;
         }
       }
       else if (stream.Peek() != 0) {
-        throw std::invalid_argument(
-          std::string("JSON File error at char ")
-          + std::to_string(stream.Tell()) + std::string(": \'")
-          + stream.Peek() + std::string("\'")
-          + FILENAME(__LINE__));
+        error = std::string("JSON File error at char ")
+                + std::to_string(position) + std::string(": \'")
+                + stream.Peek() + std::string("\'");
+        return false;
       }
     }
+    return true;
+  }
+
+  template<typename HANDLER, typename STREAM>
+  const ContentPtr
+  do_parse(HANDLER& handler, STREAM& stream) {
+    int64_t number;
+    std::string error;
+    size_t position;
+    if (!parse_documents(handler, stream, number, error, position)) {
+      throw std::invalid_argument(error + FILENAME(__LINE__));
+    }
 
     ContentPtr obj = handler.snapshot();
     if (number == 1) {
@@ -819,13 +1565,12 @@ namespace awkward {
                  const char* nan_string,
                  const char* infinity_string,
                  const char* minus_infinity_string) {
-    rj::Reader reader;
     rj::StringStream stream(source);
     Handler handler(options,
                     nan_string,
                     infinity_string,
                     minus_infinity_string);
-    return do_parse(handler, reader, stream);
+    return do_parse(handler, stream);
   }
 
   const ContentPtr
@@ -835,7 +1580,6 @@ namespace awkward {
                const char* nan_string,
                const char* infinity_string,
                const char* minus_infinity_string) {
-    rj::Reader reader;
     std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
     rj::FileReadStream stream(source,
                               buffer.get(),
@@ -844,6 +1588,100 @@ namespace awkward {
                     nan_string,
                     infinity_string,
                     minus_infinity_string);
-    return do_parse(handler, reader, stream);
+    return do_parse(handler, stream);
+  }
+
+  // Most JSON either consists of a single array of items or a sequence of
+  // items (such as JSON Lines). If the JSON starts with an array, it is first
+  // read as a single array of items; if that fails, it is read again as a
+  // sequence of items, and if both fail, the error that was found furthest
+  // into the JSON is reported.
+  template<typename STREAM, typename MAKE_STREAM>
+  const JsonSchemaOutput
+  do_parse_schema(MAKE_STREAM make_stream,
+                  const FormPtr& form,
+                  const ArrayBuilderOptions& options,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string) {
+    int64_t number;
+    std::string outer_error;
+    size_t outer_position = 0;
+
+    std::shared_ptr<STREAM> peek = make_stream();
+    rj::SkipWhitespace(*peek.get());
+    if (peek.get()->Peek() == '[') {
+      HandlerSchema handler(form,
+                            options,
+                            true,
+                            nan_string,
+                            infinity_string,
+                            minus_infinity_string);
+      if (parse_documents(handler,
+                          *peek.get(),
+                          number,
+                          outer_error,
+                          outer_position)) {
+        return handler.output(false);
+      }
+      peek = make_stream();
+    }
+
+    HandlerSchema handler(form,
+                          options,
+                          false,
+                          nan_string,
+                          infinity_string,
+                          minus_infinity_string);
+    std::string error;
+    size_t position = 0;
+    if (!parse_documents(handler, *peek.get(), number, error, position)) {
+      if (!outer_error.empty()  &&  outer_position > position) {
+        error = outer_error;
+      }
+      throw std::invalid_argument(error + FILENAME(__LINE__));
+    }
+    return handler.output(number == 1);
+  }
+
+  const JsonSchemaOutput
+  FromJsonStringSchema(const char* source,
+                       const FormPtr& form,
+                       const ArrayBuilderOptions& options,
+                       const char* nan_string,
+                       const char* infinity_string,
+                       const char* minus_infinity_string) {
+    return do_parse_schema<rj::StringStream>(
+      [source]() -> std::shared_ptr<rj::StringStream> {
+        return std::make_shared<rj::StringStream>(source);
+      },
+      form,
+      options,
+      nan_string,
+      infinity_string,
+      minus_infinity_string);
+  }
+
+  const JsonSchemaOutput
+  FromJsonFileSchema(FILE* source,
+                     const FormPtr& form,
+                     const ArrayBuilderOptions& options,
+                     int64_t buffersize,
+                     const char* nan_string,
+                     const char* infinity_string,
+                     const char* minus_infinity_string) {
+    std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
+    long start = ftell(source);
+    return do_parse_schema<rj::FileReadStream>(
+      [source, buffer, buffersize, start]() -> std::shared_ptr<rj::FileReadStream> {
+        fseek(source, start, SEEK_SET);
+        return std::make_shared<rj::FileReadStream>(
+          source, buffer.get(), ((size_t)buffersize)*sizeof(char));
+      },
+      form,
+      options,
+      nan_string,
+      infinity_string,
+      minus_infinity_string);
   }
 }
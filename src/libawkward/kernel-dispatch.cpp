@@ -2,6 +2,7 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/kernel-dispatch.cpp", line)
 
+#include <atomic>
 #include <complex>
 
 #include "awkward/common.h"
@@ -12,11 +13,20 @@
 
 #include "awkward/kernel-dispatch.h"
 
-#define CREATE_KERNEL(libFnName, ptr_lib)          \
-  auto handle = acquire_handle(ptr_lib);         \
-  typedef decltype(libFnName) functor_type;      \
-  auto* libFnName##_fcn =                        \
-    reinterpret_cast<functor_type*>(acquire_symbol(handle, #libFnName));
+// The function pointer is resolved on the first call for each ptr_lib and
+// kept in a static (per call site) for all subsequent calls.
+#define CREATE_KERNEL(libFnName, ptr_lib)                                \
+  typedef decltype(libFnName) functor_type;                              \
+  static std::atomic<functor_type*>                                      \
+    libFnName##_symbols[(size_t)kernel::lib::size];                      \
+  functor_type* libFnName##_fcn =                                        \
+    libFnName##_symbols[(size_t)ptr_lib].load(std::memory_order_acquire); \
+  if (libFnName##_fcn == nullptr) {                                      \
+    libFnName##_fcn = reinterpret_cast<functor_type*>(                   \
+      acquire_symbol(acquire_handle(ptr_lib), #libFnName));              \
+    libFnName##_symbols[(size_t)ptr_lib].store(libFnName##_fcn,          \
+                                               std::memory_order_release); \
+  }
 
 namespace awkward {
   namespace kernel {
@@ -24,6 +34,12 @@ namespace awkward {
     std::shared_ptr<LibraryCallback> lib_callback =
       std::make_shared<LibraryCallback>();
 
+    // Handles returned by acquire_handle, indexed by ptr_lib; nullptr until
+    // a library has been successfully opened. Libraries are never closed, so
+    // handles (and symbols found in them) remain valid.
+    std::atomic<void*> lib_handles[(size_t)kernel::lib::size];
+    std::mutex lib_handles_mutex;
+
     LibraryCallback::LibraryCallback() {
       lib_path_callbacks[kernel::lib::cuda] =
         std::vector<std::shared_ptr<LibraryPathCallback>>();
@@ -50,7 +66,15 @@ namespace awkward {
 
     void* acquire_handle(kernel::lib ptr_lib) {
 #ifndef _MSC_VER
-      void *handle = nullptr;
+      void *handle = lib_handles[(size_t)ptr_lib].load(std::memory_order_acquire);
+      if (handle) {
+        return handle;
+      }
+      std::lock_guard<std::mutex> lock(lib_handles_mutex);
+      handle = lib_handles[(size_t)ptr_lib].load(std::memory_order_acquire);
+      if (handle) {
+        return handle;
+      }
       std::string path = lib_callback->awkward_library_path(ptr_lib);
       if (!path.empty()) {
         handle = dlopen(path.c_str(), RTLD_LAZY);
@@ -69,6 +93,8 @@ namespace awkward {
             + FILENAME(__LINE__));
         }
       }
+      // failures are not cached, so that a library path added later is used
+      lib_handles[(size_t)ptr_lib].store(handle, std::memory_order_release);
       return handle;
 #else
       throw std::invalid_argument(
@@ -16404,516 +16430,1931 @@ namespace awkward {
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const bool *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      int32_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_bool_64(
+        return awkward_reduce_sum_offsets_int32_int8_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const int8_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      int32_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_int8_64(
+        return awkward_reduce_sum_offsets_int32_int16_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const uint8_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_uint8_64(
+        return awkward_reduce_sum_offsets_int32_int32_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
       int64_t *toptr,
-      const int16_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      const int8_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_int16_64(
+        return awkward_reduce_sum_offsets_int64_int8_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
       int64_t *toptr,
-      const uint16_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      const int16_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_uint16_64(
+        return awkward_reduce_sum_offsets_int64_int16_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
       int64_t *toptr,
       const int32_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_int32_64(
+        return awkward_reduce_sum_offsets_int64_int32_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
       int64_t *toptr,
-      const uint32_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      const int64_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_uint32_64(
+        return awkward_reduce_sum_offsets_int64_int64_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const int64_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint32_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_int64_64(
+        return awkward_reduce_sum_offsets_uint32_uint8_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const uint64_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint32_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_uint64_64(
+        return awkward_reduce_sum_offsets_uint32_uint16_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const float *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_float32_64(
+        return awkward_reduce_sum_offsets_uint32_uint32_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const double *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint64_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_float64_64(
+        return awkward_reduce_sum_offsets_uint64_uint8_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const std::complex<float> *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint64_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_complex64_64(
+        return awkward_reduce_sum_offsets_uint64_uint16_64(
           toptr,
-          reinterpret_cast<const float*>(fromptr),
-          parents,
-          lenparents,
+          fromptr,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmin_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const std::complex<double> *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint64_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmin_complex128_64(
+        return awkward_reduce_sum_offsets_uint64_uint32_64(
           toptr,
-          reinterpret_cast<const double*>(fromptr),
-          parents,
-          lenparents,
+          fromptr,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const bool *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmax_bool_64(
+        return awkward_reduce_sum_offsets_uint64_uint64_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const int8_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmax_int8_64(
+        return awkward_reduce_sum_offsets_float32_float32_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_sum_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const uint8_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmax_uint8_64(
+        return awkward_reduce_sum_offsets_float64_float64_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          std::string("unrecognized ptr_lib for reduce_sum_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_prod_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const int16_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      int32_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmax_int16_64(
+        return awkward_reduce_prod_offsets_int32_int8_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_prod_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
-      const uint16_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      int32_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_reduce_argmax_uint16_64(
+        return awkward_reduce_prod_offsets_int32_int16_64(
           toptr,
           fromptr,
-          parents,
-          lenparents,
+          offsets,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
           + FILENAME(__LINE__));
       }
       else {
         throw std::runtime_error(
-          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
           + FILENAME(__LINE__));
       }
     }
 
     template<>
-    ERROR reduce_argmax_64(
+    ERROR reduce_prod_offsets_64(
       kernel::lib ptr_lib,
-      int64_t *toptr,
+      int32_t *toptr,
       const int32_t *fromptr,
-      const int64_t *parents,
-      int64_t lenparents,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_int32_int32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_int64_int8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_int64_int16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_int64_int32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_int64_int64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint32_uint8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint32_uint16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint32_uint32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint64_uint8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint64_uint16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint64_uint32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_uint64_uint64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_float32_float32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_prod_offsets_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_prod_offsets_float64_float64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_prod_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_int8_int8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      int16_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_int16_int16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_int32_int32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_int64_int64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      uint8_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_uint8_uint8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      uint16_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_uint16_uint16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_uint32_uint32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_uint64_uint64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      float identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_float32_float32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_min_offsets_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      double identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_min_offsets_float64_float64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_min_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_int8_int8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      int16_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_int16_int16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_int32_int32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_int64_int64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      uint8_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_uint8_uint8_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      uint16_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_uint16_uint16_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_uint32_uint32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_uint64_uint64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      float identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_float32_float32_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_max_offsets_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      double identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_max_offsets_float64_float64_64(
+          toptr,
+          fromptr,
+          offsets,
+          outlength,
+          identity);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_max_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    ERROR reduce_count_offsets_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_count_offsets_64(
+          toptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_count_offsets_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_count_offsets_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const bool *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_bool_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_int8_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_uint8_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_int16_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_uint16_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_int32_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_uint32_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_int64_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_uint64_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const float *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_float32_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const double *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_float64_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const std::complex<float> *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_complex64_64(
+          toptr,
+          reinterpret_cast<const float*>(fromptr),
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmin_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const std::complex<double> *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmin_complex128_64(
+          toptr,
+          reinterpret_cast<const double*>(fromptr),
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmin_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const bool *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmax_bool_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmax_int8_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmax_uint8_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmax_int16_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_reduce_argmax_uint16_64(
+          toptr,
+          fromptr,
+          parents,
+          lenparents,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for reduce_argmax_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR reduce_argmax_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *parents,
+      int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
         return awkward_reduce_argmax_int32_64(
@@ -17410,6 +18851,29 @@ namespace awkward {
       }
     }
 
+    ERROR ListOffsetArray_reduce_mask_ByteMaskedArray_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        return awkward_ListOffsetArray_reduce_mask_ByteMaskedArray_64(
+          toptr,
+          offsets,
+          outlength);
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_mask_ByteMaskedArray_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_mask_ByteMaskedArray_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
     template<>
     ERROR IndexedArray_reduce_next_64<int32_t>(
       kernel::lib ptr_lib,
@@ -1,6 +1,9 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+#include <algorithm>
 #include <atomic>
+#include <functional>
+#include <sstream>
 
 #include "awkward/virtual/ArrayCache.h"
 
@@ -17,4 +20,222 @@ namespace awkward {
   // Note: if you're creating a pure C++ cache (and it's not ridiculously
   // large), define it in
   // include/awkward/virtual/ArrayCache.h and implement it in this file.
+
+  ////////// LRUArrayCache
+
+  LRUArrayCache::LRUArrayCache(int64_t maxbytes, int64_t num_shards)
+      : maxbytes_(maxbytes)
+      , tick_(0)
+      , nbytes_(0)
+      , length_(0)
+      , hits_(0)
+      , misses_(0)
+      , evictions_(0) {
+    for (int64_t i = 0;  i < std::max(num_shards, (int64_t)1);  i++) {
+      shards_.push_back(std::unique_ptr<Shard>(new Shard));
+    }
+  }
+
+  int64_t
+  LRUArrayCache::maxbytes() const {
+    return maxbytes_;
+  }
+
+  int64_t
+  LRUArrayCache::num_shards() const {
+    return (int64_t)shards_.size();
+  }
+
+  int64_t
+  LRUArrayCache::nbytes() const {
+    return nbytes_;
+  }
+
+  int64_t
+  LRUArrayCache::length() const {
+    return length_;
+  }
+
+  int64_t
+  LRUArrayCache::hits() const {
+    return hits_;
+  }
+
+  int64_t
+  LRUArrayCache::misses() const {
+    return misses_;
+  }
+
+  int64_t
+  LRUArrayCache::evictions() const {
+    return evictions_;
+  }
+
+  const std::vector<std::string>
+  LRUArrayCache::keys() const {
+    std::vector<std::pair<int64_t, std::string>> used;
+    for (auto& shard : shards_) {
+      std::lock_guard<std::mutex> lock(shard.get()->mutex);
+      for (auto& entry : shard.get()->entries) {
+        used.push_back(std::make_pair(std::get<3>(entry), std::get<0>(entry)));
+      }
+    }
+    std::sort(used.begin(), used.end(),
+              [](const std::pair<int64_t, std::string>& a,
+                 const std::pair<int64_t, std::string>& b) -> bool {
+      return a.first > b.first;
+    });
+    std::vector<std::string> out;
+    for (auto& pair : used) {
+      out.push_back(pair.second);
+    }
+    return out;
+  }
+
+  bool
+  LRUArrayCache::contains(const std::string& key) const {
+    Shard& shard = LRUArrayCache::shard(key);
+    std::lock_guard<std::mutex> lock(shard.mutex);
+    return shard.lookup.find(key) != shard.lookup.end();
+  }
+
+  ContentPtr
+  LRUArrayCache::get(const std::string& key) const {
+    Shard& shard = LRUArrayCache::shard(key);
+    std::lock_guard<std::mutex> lock(shard.mutex);
+    auto found = shard.lookup.find(key);
+    if (found == shard.lookup.end()) {
+      misses_++;
+      return ContentPtr(nullptr);
+    }
+    hits_++;
+    shard.entries.splice(shard.entries.begin(), shard.entries, found->second);
+    std::get<3>(*found->second) = tick_++;
+    return std::get<1>(*found->second);
+  }
+
+  void
+  LRUArrayCache::set(const std::string& key, const ContentPtr& value) {
+    int64_t size = value.get()->nbytes();
+    // evicted arrays are deleted after the locks are released
+    std::vector<ContentPtr> evicted;
+    {
+      Shard& shard = LRUArrayCache::shard(key);
+      std::lock_guard<std::mutex> lock(shard.mutex);
+      auto found = shard.lookup.find(key);
+      if (found != shard.lookup.end()) {
+        nbytes_ -= std::get<2>(*found->second);
+        length_--;
+        evicted.push_back(std::get<1>(*found->second));
+        shard.entries.erase(found->second);
+        shard.lookup.erase(found);
+      }
+      if (size > maxbytes_) {
+        return;
+      }
+      shard.entries.push_front(Entry(key, value, size, tick_++));
+      shard.lookup[key] = shard.entries.begin();
+      nbytes_ += size;
+      length_++;
+    }
+    // only one shard is locked at a time, so threads that are evicting
+    // from each other's shards cannot deadlock
+    while (nbytes_ > maxbytes_  &&  evict_one(key, evicted)) { }
+  }
+
+  bool
+  LRUArrayCache::del(const std::string& key) {
+    ContentPtr removed(nullptr);
+    {
+      Shard& shard = LRUArrayCache::shard(key);
+      std::lock_guard<std::mutex> lock(shard.mutex);
+      auto found = shard.lookup.find(key);
+      if (found == shard.lookup.end()) {
+        return false;
+      }
+      nbytes_ -= std::get<2>(*found->second);
+      length_--;
+      removed = std::get<1>(*found->second);
+      shard.entries.erase(found->second);
+      shard.lookup.erase(found);
+    }
+    return true;
+  }
+
+  void
+  LRUArrayCache::clear() {
+    std::list<Entry> removed;
+    for (auto& shard : shards_) {
+      std::lock_guard<std::mutex> lock(shard.get()->mutex);
+      for (auto& entry : shard.get()->entries) {
+        nbytes_ -= std::get<2>(entry);
+        length_--;
+      }
+      removed.splice(removed.end(), shard.get()->entries);
+      shard.get()->lookup.clear();
+    }
+    hits_ = 0;
+    misses_ = 0;
+    evictions_ = 0;
+  }
+
+  LRUArrayCache::Shard&
+  LRUArrayCache::shard(const std::string& key) const {
+    size_t index = std::hash<std::string>()(key) % shards_.size();
+    return *shards_[index].get();
+  }
+
+  bool
+  LRUArrayCache::evict_one(const std::string& keep,
+                           std::vector<ContentPtr>& evicted) {
+    // the shard whose least recently used array is the oldest
+    int64_t oldest = -1;
+    int64_t oldest_tick = 0;
+    for (size_t i = 0;  i < shards_.size();  i++) {
+      Shard& shard = *shards_[i].get();
+      std::lock_guard<std::mutex> lock(shard.mutex);
+      if (!shard.entries.empty()  &&  std::get<0>(shard.entries.back()) != keep) {
+        int64_t tick = std::get<3>(shard.entries.back());
+        if (oldest == -1  ||  tick < oldest_tick) {
+          oldest = (int64_t)i;
+          oldest_tick = tick;
+        }
+      }
+    }
+    if (oldest == -1) {
+      return false;
+    }
+    Shard& shard = *shards_[(size_t)oldest].get();
+    std::lock_guard<std::mutex> lock(shard.mutex);
+    // another thread may have changed the shard since it was chosen;
+    // if so, the caller checks the budget and tries again
+    if (!shard.entries.empty()  &&  std::get<0>(shard.entries.back()) != keep) {
+      Entry& last = shard.entries.back();
+      nbytes_ -= std::get<2>(last);
+      length_--;
+      evicted.push_back(std::get<1>(last));
+      shard.lookup.erase(std::get<0>(last));
+      shard.entries.pop_back();
+      evictions_++;
+    }
+    return true;
+  }
+
+  bool
+  LRUArrayCache::is_broken() const {
+    return false;
+  }
+
+  const std::string
+  LRUArrayCache::tostring_part(const std::string& indent,
+                               const std::string& pre,
+                               const std::string& post) const {
+    std::stringstream out;
+    out << indent << pre << "<LRUArrayCache maxbytes=\"" << maxbytes_
+        << "\" nbytes=\"" << nbytes_ << "\" length=\"" << length_
+        << "\" num_shards=\"" << shards_.size()
+        << "\" hits=\"" << hits_ << "\" misses=\"" << misses_
+        << "\" evictions=\"" << evictions_ << "\"/>" << post;
+    return out.str();
+  }
 }
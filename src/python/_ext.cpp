@@ -31,6 +31,8 @@ PYBIND11_MODULE(_ext, m) {
   ////////// kernel_utils.h
 
   make_lib_enum(m, "kernel_lib");
+  make_set_num_threads(m, "set_num_threads");
+  make_get_num_threads(m, "get_num_threads");
 
   ////////// index.h
 
@@ -123,6 +125,7 @@ PYBIND11_MODULE(_ext, m) {
   make_PyArrayGenerator(m, "ArrayGenerator");
   make_SliceGenerator(m, "SliceGenerator");
   make_PyArrayCache(m, "ArrayCache");
+  make_LRUArrayCache(m, "LRUArrayCache");
 
   ////////// partition.h
 
@@ -133,6 +136,8 @@ PYBIND11_MODULE(_ext, m) {
 
   make_fromjson(m, "fromjson");
   make_fromjsonfile(m, "fromjsonfile");
+  make_fromjsonschema(m, "fromjsonschema");
+  make_fromjsonfileschema(m, "fromjsonfileschema");
   make_uproot_issue_90(m);
 
   ////////// forth.h
@@ -761,6 +761,42 @@ tojson_file(const T& self,
   fclose(file);
 }
 
+// Content operations release the GIL while libawkward runs, so that they can
+// run in parallel threads (e.g. one per partition); Python callbacks, such as
+// VirtualArray generators and caches, reacquire it.
+
+template <typename T>
+ak::ContentPtr
+getitem_nogil(const T& self, const ak::Slice& slice) {
+  py::gil_scoped_release release;
+  return self.getitem(slice);
+}
+
+template <>
+ak::ContentPtr
+getitem_nogil(const ak::ArrayBuilder& self, const ak::Slice& slice) {
+  // an ArrayBuilder may be filled by other Python threads
+  return self.getitem(slice);
+}
+
+template <typename T>
+ak::ContentPtr
+reduce_nogil(const T& self,
+             const ak::Reducer& reducer,
+             int64_t axis,
+             bool mask,
+             bool keepdims) {
+  py::gil_scoped_release release;
+  return self.reduce(reducer, axis, mask, keepdims);
+}
+
+template <typename T>
+std::pair<ak::Index64, ak::ContentPtr>
+offsets_and_flattened_nogil(const T& self, int64_t axis) {
+  py::gil_scoped_release release;
+  return self.offsets_and_flattened(axis, 0);
+}
+
 template <typename T>
 py::object
 getitem(const T& self, const py::object& obj) {
@@ -805,7 +841,8 @@ getitem(const T& self, const py::object& obj) {
     }
     // control flow can pass through here; don't make the last line an 'else'!
   }
-  return box(self.getitem(toslice(obj)));
+  ak::Slice slice = toslice(obj);
+  return box(getitem_nogil(self, slice));
 }
 
 ////////// ArrayBuilder
@@ -1214,15 +1251,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
             self.caches(out1);
             py::list out2(out1.size());
             for (size_t i = 0;  i < out1.size();  i++) {
-              if (std::shared_ptr<PyArrayCache> ptr =
-                  std::dynamic_pointer_cast<PyArrayCache>(out1[i])) {
-                out2[i] = py::cast(ptr);
-              }
-              else {
-                throw std::runtime_error(
-                  std::string("VirtualArray's cache is not a PyArrayCache")
-                  + FILENAME(__LINE__));
-              }
+              out2[i] = box_cache(out1[i]);
             }
             return out2;
           })
@@ -1305,26 +1334,41 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
             return box(self.fillna(unbox_content(value)));
           })
           .def("num", [](const T& self, int64_t axis) -> py::object {
-            return box(self.num(axis, 0));
+            ak::ContentPtr out;
+            {
+              py::gil_scoped_release release;
+              out = self.num(axis, 0);
+            }
+            return box(out);
           }, py::arg("axis") = 1)
           .def("flatten", [](const T& self, int64_t axis) -> py::object {
             std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair =
-              self.offsets_and_flattened(axis, 0);
+              offsets_and_flattened_nogil(self, axis);
             return box(pair.second);
           }, py::arg("axis") = 1)
           .def("offsets_and_flatten",
                [](const T& self, int64_t axis) -> py::object {
             std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair =
-              self.offsets_and_flattened(axis, 0);
+              offsets_and_flattened_nogil(self, axis);
             return py::make_tuple(py::cast(pair.first), box(pair.second));
           }, py::arg("axis") = 1)
           .def("rpad",
                [](const T&self, int64_t length, int64_t axis) -> py::object {
-            return box(self.rpad(length, axis, 0));
+            ak::ContentPtr out;
+            {
+              py::gil_scoped_release release;
+              out = self.rpad(length, axis, 0);
+            }
+            return box(out);
           })
           .def("rpad_and_clip",
                [](const T&self, int64_t length, int64_t axis) -> py::object {
-            return box(self.rpad_and_clip(length, axis, 0));
+            ak::ContentPtr out;
+            {
+              py::gil_scoped_release release;
+              out = self.rpad_and_clip(length, axis, 0);
+            }
+            return box(out);
           })
           .def("mergeable",
                [](const T& self, const py::object& other, bool mergebool)
@@ -1355,7 +1399,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerCount reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1363,7 +1407,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerCountNonzero reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1371,7 +1415,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerSum reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
                py::arg("keepdims") = false)
@@ -1379,7 +1423,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerProd reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1387,7 +1431,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerAny reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1395,7 +1439,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerAll reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = false,
              py::arg("keepdims") = false)
@@ -1406,14 +1450,14 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                          const py::object& initial) -> py::object {
             if (initial.is(py::none())) {
               ak::ReducerMin reducer;
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
             else {
               double initial_f64 = initial.cast<double>();
               uint64_t initial_u64 = (initial_f64 > 0 ? initial.cast<uint64_t>() : 0);
               int64_t initial_i64 = initial.cast<int64_t>();
               ak::ReducerMin reducer(initial_f64, initial_u64, initial_i64);
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
@@ -1426,14 +1470,14 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                          const py::object& initial) -> py::object {
             if (initial.is(py::none())) {
               ak::ReducerMax reducer;
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
             else {
               double initial_f64 = initial.cast<double>();
               uint64_t initial_u64 = (initial_f64 > 0 ? initial.cast<uint64_t>() : 0);
               int64_t initial_i64 = initial.cast<int64_t>();
               ak::ReducerMax reducer(initial_f64, initial_u64, initial_i64);
-              return box(self.reduce(reducer, axis, mask, keepdims));
+              return box(reduce_nogil(self, reducer, axis, mask, keepdims));
             }
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
@@ -1443,7 +1487,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerArgmin reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
              py::arg("keepdims") = false)
@@ -1451,7 +1495,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                [](const T& self, int64_t axis, bool mask, bool keepdims)
                -> py::object {
             ak::ReducerArgmax reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(reduce_nogil(self, reducer, axis, mask, keepdims));
           }, py::arg("axis") = -1,
              py::arg("mask") = true,
              py::arg("keepdims") = false)
@@ -2309,15 +2353,7 @@ make_Record(const py::handle& m, const std::string& name) {
         self.caches(out1);
         py::list out2(out1.size());
         for (size_t i = 0;  i < out1.size();  i++) {
-          if (std::shared_ptr<PyArrayCache> ptr =
-              std::dynamic_pointer_cast<PyArrayCache>(out1[i])) {
-            out2[i] = py::cast(ptr);
-          }
-          else {
-            throw std::runtime_error(
-              std::string("VirtualArray's cache is not a PyArrayCache")
-              + FILENAME(__LINE__));
-          }
+          out2[i] = box_cache(out1[i]);
         }
         return out2;
       })
@@ -2683,8 +2719,32 @@ make_UnionArrayOf(const py::handle& m, const std::string& name);
 
 ////////// VirtualArray
 
+bool
+virtualarray_holds_gil() {
+#if PY_MAJOR_VERSION < 3
+  // Python 2.7 has no PyGILState_Check
+  PyThreadState* tstate = PyGILState_GetThisThreadState();
+  return tstate != nullptr  &&  tstate == _PyThreadState_Current;
+#else
+  return PyGILState_Check() != 0;
+#endif
+}
+
 py::class_<ak::VirtualArray, std::shared_ptr<ak::VirtualArray>, ak::Content>
 make_VirtualArray(const py::handle& m, const std::string& name) {
+  // a thread waiting for another thread's generation must not hold the GIL,
+  // since that generation may need it to call a Python generator
+  ak::VirtualArray::set_wait_function(
+    [](const std::function<void()>& wait) -> void {
+      if (virtualarray_holds_gil()) {
+        py::gil_scoped_release release;
+        wait();
+      }
+      else {
+        wait();
+      }
+  });
+
   return content_methods(py::class_<ak::VirtualArray,
                          std::shared_ptr<ak::VirtualArray>,
                          ak::Content>(m, name.c_str())
@@ -2707,17 +2767,7 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
                           "SliceGenerator") + FILENAME(__LINE__));
           }
         }
-        std::shared_ptr<PyArrayCache> cppcache(nullptr);
-        if (!cache.is(py::none())) {
-          try {
-            cppcache = cache.cast<std::shared_ptr<PyArrayCache>>();
-          }
-          catch (py::cast_error err) {
-            throw std::invalid_argument(
-              std::string("VirtualArray 'cache' must be an ArrayCache or None")
-              + FILENAME(__LINE__));
-          }
-        }
+        ak::ArrayCachePtr cppcache = unbox_cache(cache, "VirtualArray 'cache'");
         if (!cache_key.is(py::none())) {
           std::string cppcache_key;
           try {
@@ -2766,19 +2816,7 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
       })
       .def_property_readonly("cache", [](const ak::VirtualArray& self)
                                       -> py::object {
-        std::shared_ptr<ak::ArrayCache> cache = self.cache();
-        if (cache.get() == nullptr) {
-          return py::none();
-        }
-        if (std::shared_ptr<PyArrayCache> ptr =
-               std::dynamic_pointer_cast<PyArrayCache>(cache)) {
-          return py::cast(ptr);
-        }
-        else {
-          throw std::runtime_error(
-            std::string("VirtualArray's cache is not a PyArrayCache")
-            + FILENAME(__LINE__));
-        }
+        return box_cache(self.cache());
       })
       .def_property_readonly("peek_array", [](const ak::VirtualArray& self)
                                            -> py::object {
@@ -2792,7 +2830,12 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
       })
       .def_property_readonly("array", [](const ak::VirtualArray& self)
                                       -> py::object {
-        return box(self.array());
+        ak::ContentPtr out(nullptr);
+        {
+          py::gil_scoped_release release;
+          out = self.array();
+        }
+        return box(out);
       })
       .def_property_readonly("cache_key", &ak::VirtualArray::cache_key)
       .def_property_readonly("ptr_lib", [](const ak::VirtualArray& self) -> py::object {
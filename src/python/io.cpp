@@ -28,11 +28,15 @@ make_fromjson(py::module& m, const std::string& name) {
            int64_t initial,
            double resize,
            int64_t buffersize) -> py::object {
-    ak::ContentPtr out = ak::FromJsonString(source.c_str(),
-                                            ak::ArrayBuilderOptions(initial, resize),
-                                            nan_string,
-                                            infinity_string,
-                                            minus_infinity_string);
+    ak::ContentPtr out(nullptr);
+    {
+      py::gil_scoped_release release;
+      out = ak::FromJsonString(source.c_str(),
+                               ak::ArrayBuilderOptions(initial, resize),
+                               nan_string,
+                               infinity_string,
+                               minus_infinity_string);
+    }
     return box(out);
   }, py::arg("source"),
      py::arg("nan_string") = nullptr,
@@ -67,6 +71,7 @@ make_fromjsonfile(py::module& m, const std::string& name) {
       }
       std::shared_ptr<ak::Content> out(nullptr);
       try {
+        py::gil_scoped_release release;
         out = FromJsonFile(file,
                            ak::ArrayBuilderOptions(initial, resize),
                            buffersize,
@@ -89,6 +94,99 @@ make_fromjsonfile(py::module& m, const std::string& name) {
      py::arg("buffersize") = 65536);
 }
 
+////////// fromjson with a Form
+
+py::tuple
+schema_output_to_python(const ak::JsonSchemaOutput& output) {
+  py::dict buffers;
+  for (auto pair : std::get<2>(output)) {
+    buffers[py::str(pair.first)] = box(pair.second);
+  }
+  return py::make_tuple(py::int_(std::get<0>(output)),
+                        py::bool_(std::get<1>(output)),
+                        buffers);
+}
+
+void
+make_fromjsonschema(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const std::string& source,
+           const ak::FormPtr& form,
+           const char* nan_string,
+           const char* infinity_string,
+           const char* minus_infinity_string,
+           int64_t initial,
+           double resize) -> py::tuple {
+    ak::JsonSchemaOutput out;
+    {
+      py::gil_scoped_release release;
+      out = ak::FromJsonStringSchema(source.c_str(),
+                                     form,
+                                     ak::ArrayBuilderOptions(initial, resize),
+                                     nan_string,
+                                     infinity_string,
+                                     minus_infinity_string);
+    }
+    return schema_output_to_python(out);
+  }, py::arg("source"),
+     py::arg("form"),
+     py::arg("nan_string") = nullptr,
+     py::arg("infinity_string") = nullptr,
+     py::arg("minus_infinity_string") = nullptr,
+     py::arg("initial") = 1024,
+     py::arg("resize") = 1.5);
+}
+
+void
+make_fromjsonfileschema(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const std::string& source,
+           const ak::FormPtr& form,
+           const char* nan_string,
+           const char* infinity_string,
+           const char* minus_infinity_string,
+           int64_t initial,
+           double resize,
+           int64_t buffersize) -> py::tuple {
+#ifdef _MSC_VER
+      FILE* file;
+      if (fopen_s(&file, source.c_str(), "rb") != 0) {
+#else
+      FILE* file = fopen(source.c_str(), "rb");
+      if (file == nullptr) {
+#endif
+        throw std::invalid_argument(
+          std::string("file \"") + source
+          + std::string("\" could not be opened for reading")
+          + FILENAME(__LINE__));
+      }
+      ak::JsonSchemaOutput out;
+      try {
+        py::gil_scoped_release release;
+        out = ak::FromJsonFileSchema(file,
+                                     form,
+                                     ak::ArrayBuilderOptions(initial, resize),
+                                     buffersize,
+                                     nan_string,
+                                     infinity_string,
+                                     minus_infinity_string);
+      }
+      catch (...) {
+        fclose(file);
+        throw;
+      }
+      fclose(file);
+      return schema_output_to_python(out);
+  }, py::arg("source"),
+     py::arg("form"),
+     py::arg("nan_string") = nullptr,
+     py::arg("infinity_string") = nullptr,
+     py::arg("minus_infinity_string") = nullptr,
+     py::arg("initial") = 1024,
+     py::arg("resize") = 1.5,
+     py::arg("buffersize") = 65536);
+}
+
 ////////// Uproot connector
 
 void
@@ -1,5 +1,7 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+#include "awkward/kernel-parallel.h"
+
 #include "awkward/python/kernel_utils.h"
 
 namespace ak = awkward;
@@ -11,3 +13,17 @@ make_lib_enum(const py::handle& m, const std::string& name) {
     .value("cuda", ak::kernel::lib::cuda)
     .export_values());
 }
+
+void
+make_set_num_threads(py::module& m, const std::string& name) {
+  m.def(name.c_str(), [](int64_t num_threads) -> void {
+    awkward_set_num_threads(num_threads);
+  }, py::arg("num_threads"));
+}
+
+void
+make_get_num_threads(py::module& m, const std::string& name) {
+  m.def(name.c_str(), []() -> int64_t {
+    return awkward_get_num_threads();
+  });
+}
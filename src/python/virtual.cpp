@@ -22,23 +22,38 @@ PyArrayGenerator::PyArrayGenerator(const ak::FormPtr& form,
     , args_(args)
     , kwargs_(kwargs) { }
 
+// PyArrayGenerators and PyArrayCaches may be used (and dropped) by libawkward
+// in threads that have released the GIL, so every method that touches a
+// Python object acquires it first.
+
+PyArrayGenerator::~PyArrayGenerator() {
+  py::gil_scoped_acquire acquire;
+  const_cast<py::object&>(callable_).release().dec_ref();
+  const_cast<py::tuple&>(args_).release().dec_ref();
+  const_cast<py::dict&>(kwargs_).release().dec_ref();
+}
+
 const py::object
 PyArrayGenerator::callable() const {
+  py::gil_scoped_acquire acquire;
   return callable_;
 }
 
 const py::tuple
 PyArrayGenerator::args() const {
+  py::gil_scoped_acquire acquire;
   return args_;
 }
 
 const py::dict
 PyArrayGenerator::kwargs() const {
+  py::gil_scoped_acquire acquire;
   return kwargs_;
 }
 
 const ak::ContentPtr
 PyArrayGenerator::generate() const {
+  py::gil_scoped_acquire acquire;
   py::object out = callable_(*args_, **kwargs_);
   py::object layout = py::module::import("awkward").attr("to_layout")(
                                         out, py::cast(false), py::cast(false));
@@ -47,9 +62,11 @@ PyArrayGenerator::generate() const {
 
 void
 PyArrayGenerator::caches(std::vector<ak::ArrayCachePtr>& out) const {
+  py::gil_scoped_acquire acquire;
   for (auto arg : args_) {
     try {
-      std::shared_ptr<PyArrayCache> ptr = arg.cast<std::shared_ptr<PyArrayCache>>();
+      ak::ArrayCachePtr ptr = unbox_cache(py::reinterpret_borrow<py::object>(arg),
+                                          "argument");
       if (ptr != nullptr) {
         bool found = false;
         for (auto oldcache : out) {
@@ -63,7 +80,7 @@ PyArrayGenerator::caches(std::vector<ak::ArrayCachePtr>& out) const {
         }
       }
     }
-    catch (py::cast_error err) { }
+    catch (std::invalid_argument err) { }
   }
 }
 
@@ -71,6 +88,7 @@ const std::string
 PyArrayGenerator::tostring_part(const std::string& indent,
                                 const std::string& pre,
                                 const std::string& post) const {
+  py::gil_scoped_acquire acquire;
   std::stringstream out;
   out << indent << pre << "<ArrayGenerator f=\"";
   out << callable_.attr("__repr__")().cast<std::string>() << "\"";
@@ -109,6 +127,7 @@ PyArrayGenerator::tostring_part(const std::string& indent,
 
 const std::shared_ptr<ak::ArrayGenerator>
 PyArrayGenerator::shallow_copy() const {
+  py::gil_scoped_acquire acquire;
   return std::make_shared<PyArrayGenerator>(form_,
                                             length_,
                                             callable_,
@@ -118,6 +137,7 @@ PyArrayGenerator::shallow_copy() const {
 
 const std::shared_ptr<ak::ArrayGenerator>
 PyArrayGenerator::with_form(const std::shared_ptr<ak::Form>& form) const {
+  py::gil_scoped_acquire acquire;
   return std::make_shared<PyArrayGenerator>(form,
                                             length_,
                                             callable_,
@@ -127,6 +147,7 @@ PyArrayGenerator::with_form(const std::shared_ptr<ak::Form>& form) const {
 
 const std::shared_ptr<ak::ArrayGenerator>
 PyArrayGenerator::with_length(int64_t length) const {
+  py::gil_scoped_acquire acquire;
   return std::make_shared<PyArrayGenerator>(form_,
                                             length,
                                             callable_,
@@ -164,6 +185,7 @@ PyArrayGenerator::with_kwargs(const py::dict& kwargs) const {
 
 bool
 PyArrayGenerator::referentially_equal(const ak::ArrayGeneratorPtr& other) const {
+  py::gil_scoped_acquire acquire;
   if (length_ != other.get()->length()) {
     return false;
   }
@@ -263,7 +285,7 @@ make_PyArrayGenerator(const py::handle& m, const std::string& name) {
         self.caches(out);
         py::list pyout;
         for (auto item : out) {
-          pyout.append(item);
+          pyout.append(box_cache(item));
         }
         return pyout;
       })
@@ -367,7 +389,7 @@ make_SliceGenerator(const py::handle& m, const std::string& name) {
         self.caches(out);
         py::list pyout;
         for (auto item : out) {
-          pyout.append(item);
+          pyout.append(box_cache(item));
         }
         return pyout;
       })
@@ -398,8 +420,14 @@ PyArrayCache::PyArrayCache(const py::object& mutablemapping)
                           ? mutablemapping
                           : py::weakref((const py::handle&) mutablemapping)) {}
 
+PyArrayCache::~PyArrayCache() {
+  py::gil_scoped_acquire acquire;
+  const_cast<py::object&>(mutablemapping_).release().dec_ref();
+}
+
 bool
 PyArrayCache::is_broken() const {
+  py::gil_scoped_acquire acquire;
   if (mutablemapping_.is(py::none())) {
     return false;
   }
@@ -412,6 +440,7 @@ PyArrayCache::is_broken() const {
 
 const py::object
 PyArrayCache::mutablemapping() const {
+  py::gil_scoped_acquire acquire;
   if (mutablemapping_.is(py::none())) {
     return mutablemapping_;
   }
@@ -426,6 +455,7 @@ PyArrayCache::mutablemapping() const {
 
 ak::ContentPtr
 PyArrayCache::get(const std::string& key) const {
+  py::gil_scoped_acquire acquire;
   py::str pykey(PyUnicode_DecodeUTF8(key.data(),
                                      key.length(),
                                      "surrogateescape"));
@@ -441,6 +471,7 @@ PyArrayCache::get(const std::string& key) const {
 
 void
 PyArrayCache::set(const std::string& key, const ak::ContentPtr& value) {
+  py::gil_scoped_acquire acquire;
   py::str pykey(PyUnicode_DecodeUTF8(key.data(),
                                      key.length(),
                                      "surrogateescape"));
@@ -454,6 +485,7 @@ const std::string
 PyArrayCache::tostring_part(const std::string& indent,
                             const std::string& pre,
                             const std::string& post) const {
+  py::gil_scoped_acquire acquire;
   if (is_broken()) {
     std::stringstream out;
     out << indent << pre << "<ArrayCache is_broken=\"true\"/>" << post;
@@ -506,3 +538,104 @@ make_PyArrayCache(const py::handle& m, const std::string& name) {
 
   );
 }
+
+////////// LRUArrayCache
+
+py::class_<ak::LRUArrayCache, std::shared_ptr<ak::LRUArrayCache>>
+make_LRUArrayCache(const py::handle& m, const std::string& name) {
+  return (py::class_<ak::LRUArrayCache,
+                     std::shared_ptr<ak::LRUArrayCache>>(m, name.c_str())
+      .def(py::init<int64_t, int64_t>(),
+           py::arg("maxbytes"), py::arg("num_shards") = 16)
+      .def_property_readonly("is_broken", &ak::LRUArrayCache::is_broken)
+      .def_property_readonly("maxbytes", &ak::LRUArrayCache::maxbytes)
+      .def_property_readonly("num_shards", &ak::LRUArrayCache::num_shards)
+      .def_property_readonly("nbytes", &ak::LRUArrayCache::nbytes)
+      .def_property_readonly("hits", &ak::LRUArrayCache::hits)
+      .def_property_readonly("misses", &ak::LRUArrayCache::misses)
+      .def_property_readonly("evictions", &ak::LRUArrayCache::evictions)
+      .def("keys", &ak::LRUArrayCache::keys)
+      .def("clear", &ak::LRUArrayCache::clear,
+           py::call_guard<py::gil_scoped_release>())
+      .def("__repr__", [](const ak::LRUArrayCache& self) -> std::string {
+        return self.tostring_part("", "", "");
+      })
+      // the GIL is released while waiting for a shard's lock, so that
+      // threads holding one can proceed
+      .def("__getitem__", [](const ak::LRUArrayCache& self,
+                             const std::string& key) -> py::object {
+        ak::ContentPtr out(nullptr);
+        {
+          py::gil_scoped_release release;
+          out = self.get(key);
+        }
+        if (out.get() == nullptr) {
+          throw py::key_error(key);
+        }
+        return box(out);
+      })
+      .def("__setitem__", [](ak::LRUArrayCache& self,
+                             const std::string& key,
+                             const py::object& value) -> void {
+        ak::ContentPtr content = unbox_content(value);
+        py::gil_scoped_release release;
+        self.set(key, content);
+      })
+      .def("__delitem__", [](ak::LRUArrayCache& self,
+                             const std::string& key) -> void {
+        bool removed;
+        {
+          py::gil_scoped_release release;
+          removed = self.del(key);
+        }
+        if (!removed) {
+          throw py::key_error(key);
+        }
+      })
+      .def("__contains__", &ak::LRUArrayCache::contains,
+           py::call_guard<py::gil_scoped_release>())
+      .def("__iter__", [](const ak::LRUArrayCache& self) -> py::object {
+        return py::iter(py::cast(self.keys()));
+      })
+      .def("__len__", &ak::LRUArrayCache::length)
+  );
+}
+
+py::object
+box_cache(const ak::ArrayCachePtr& cache) {
+  if (cache.get() == nullptr) {
+    return py::none();
+  }
+  else if (std::shared_ptr<PyArrayCache> ptr =
+             std::dynamic_pointer_cast<PyArrayCache>(cache)) {
+    return py::cast(ptr);
+  }
+  else if (std::shared_ptr<ak::LRUArrayCache> ptr =
+             std::dynamic_pointer_cast<ak::LRUArrayCache>(cache)) {
+    return py::cast(ptr);
+  }
+  else {
+    throw std::runtime_error(
+      std::string("VirtualArray's cache is not a PyArrayCache or an LRUArrayCache")
+      + FILENAME(__LINE__));
+  }
+}
+
+ak::ArrayCachePtr
+unbox_cache(const py::object& cache, const std::string& where) {
+  if (cache.is(py::none())) {
+    return ak::ArrayCachePtr(nullptr);
+  }
+  try {
+    return cache.cast<std::shared_ptr<PyArrayCache>>();
+  }
+  catch (py::cast_error err) { }
+  try {
+    return cache.cast<std::shared_ptr<ak::LRUArrayCache>>();
+  }
+  catch (py::cast_error err) { }
+  throw std::invalid_argument(
+    where + std::string(" must be an ArrayCache, an LRUArrayCache, or None")
+    + FILENAME(__LINE__));
+}
+
@@ -0,0 +1,51 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures a + b of small arrays with increasingly large behavior registries,
+# like those of analysis frameworks that define many record types. Run it on
+# two builds of Awkward Array to compare them:
+#
+#     python studies/behavior-lookup.py
+
+import timeit
+
+import numpy as np
+import awkward as ak
+
+NUMBER = 100
+REPEAT = 5
+
+
+class Point(ak.Record):
+    pass
+
+
+def add(left, right):
+    return ak.zip({"x": left.x + right.x, "y": left.y + right.y}, with_name="point")
+
+
+for size in [0, 100, 1000, 10000]:
+    behavior = {"point": Point, (np.add, "point", "point"): add}
+    for i in range(size):
+        name = "other{0}".format(i)
+        behavior[name] = Point
+        behavior[np.add, name, name] = add
+        behavior[np.multiply, name, np.number] = add
+        behavior["__typestr__", name] = name
+
+    points = ak.Array(
+        [[{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}], [], [{"x": 3, "y": 3.3}]],
+        with_name="point",
+        behavior=behavior,
+    )
+    numbers = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]], behavior=behavior)
+
+    for name, operation in [
+        ("points", lambda: points + points),
+        ("numbers", lambda: numbers + numbers),
+    ]:
+        best = min(timeit.repeat(operation, number=NUMBER, repeat=REPEAT))
+        print(
+            "{0:6d} behaviors {1:8s} {2:8.3f} ms".format(
+                len(behavior), name, 1e3 * best / NUMBER
+            )
+        )
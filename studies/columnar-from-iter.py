@@ -0,0 +1,46 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Compares ak.from_iter on homogeneous Python data, which is converted one
+# field or level of nesting at a time, with ak.layout.ArrayBuilder:
+#
+#     python studies/columnar-from-iter.py
+
+import time
+
+import numpy as np
+import awkward as ak
+
+
+def builder(data):
+    out = ak.layout.ArrayBuilder()
+    for x in data:
+        out.fromiter(x)
+    return out.snapshot()
+
+
+num_items = 1000000
+records = [
+    {"x": float(x), "y": float(y), "n": int(n)}
+    for x, y, n in zip(
+        np.random.normal(0, 1, num_items),
+        np.random.normal(0, 1, num_items),
+        np.random.poisson(3, num_items),
+    )
+]
+lists = [[1.1] * n for n in np.random.poisson(5, num_items)]
+
+for name, data in [("records", records), ("lists of floats", lists)]:
+    start = time.time()
+    columnar = ak.from_iter(data, highlevel=False)
+    columnar_time = time.time() - start
+
+    start = time.time()
+    expected = builder(data)
+    builder_time = time.time() - start
+
+    assert columnar.form == expected.form
+    print(
+        "{0:16s} ArrayBuilder {1:.2f} s, columnar {2:.2f} s ({3:.1f}x)".format(
+            name, builder_time, columnar_time, builder_time / columnar_time
+        )
+    )
@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Compares ak.to_list, which converts each node of a layout as a whole, with
+# the element-by-element recursion that it replaced:
+#
+#     python studies/columnar-to-list.py
+
+import numbers
+import time
+
+import numpy as np
+import awkward as ak
+
+
+def recursive_to_list(array):
+    # the old implementation, without the branches for non-Awkward types
+    if array is None or isinstance(array, (bool, str, bytes, numbers.Number)):
+        return array
+    elif isinstance(array, ak.behaviors.string.ByteBehavior):
+        return array.__bytes__()
+    elif isinstance(array, ak.behaviors.string.CharBehavior):
+        return array.__str__()
+    elif ak.parameters(array).get("__array__") == "byte":
+        return ak.behaviors.string.CharBehavior(array).__bytes__()
+    elif ak.parameters(array).get("__array__") == "char":
+        return ak.behaviors.string.CharBehavior(array).__str__()
+    elif isinstance(array, ak.highlevel.Array):
+        return [recursive_to_list(x) for x in array]
+    elif isinstance(array, ak.highlevel.Record):
+        return recursive_to_list(array.layout)
+    elif isinstance(array, ak.layout.Record) and array.istuple:
+        return tuple(recursive_to_list(x) for x in array.fields())
+    elif isinstance(array, ak.layout.Record):
+        return {n: recursive_to_list(x) for n, x in array.fielditems()}
+    elif isinstance(array, ak.layout.NumpyArray):
+        return np.asarray(array).tolist()
+    else:
+        return [recursive_to_list(x) for x in array]
+
+
+num_events = 100000
+counts = np.random.poisson(3, num_events)
+total = counts.sum()
+muons = ak.zip(
+    {
+        "pt": ak.unflatten(np.random.exponential(20, total), counts),
+        "eta": ak.unflatten(np.random.normal(0, 1, total), counts),
+        "charge": ak.unflatten(np.random.choice([-1, 1], total), counts),
+    }
+)
+array = ak.zip(
+    {
+        "run": np.arange(num_events),
+        "muons": muons,
+        "tag": ak.Array(["event{0}".format(i % 100) for i in range(num_events)]),
+        "met": ak.mask(np.random.normal(50, 10, num_events), counts > 1),
+    },
+    depth_limit=1,
+)
+
+start = time.time()
+columnar = ak.to_list(array)
+columnar_time = time.time() - start
+
+start = time.time()
+recursive = recursive_to_list(array)
+recursive_time = time.time() - start
+
+assert columnar == recursive
+print(
+    "{0} events: recursive {1:.2f} s, columnar {2:.3f} s ({3:.0f}x)".format(
+        num_events, recursive_time, columnar_time, recursive_time / columnar_time
+    )
+)
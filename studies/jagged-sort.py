@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures ak.sort and ak.argsort of lists of numbers for several
+# distributions of list lengths: short lists, like the particles in an event,
+# are sorted by a sorting network, long lists of numbers by a radix sort, and
+# everything in between by a comparison sort. Run it on two builds of Awkward
+# Array to compare them:
+#
+#     python studies/jagged-sort.py
+#
+# NumPy's sort of a flat array with the same number of items is measured as a
+# baseline.
+
+import timeit
+
+import numpy as np
+import awkward as ak
+
+NUMBER = 3
+REPEAT = 3
+TOTAL = 2000000
+
+distributions = [
+    ("poisson(3)", lambda: np.random.poisson(3, TOTAL // 3)),
+    ("poisson(30)", lambda: np.random.poisson(30, TOTAL // 30)),
+    ("poisson(1000)", lambda: np.random.poisson(1000, TOTAL // 1000)),
+    ("one list", lambda: np.array([TOTAL])),
+]
+
+dtypes = [np.int32, np.int64, np.float32, np.float64]
+
+
+def measure(function):
+    best = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+    return 1e3 * best / NUMBER
+
+
+print(
+    "{0:15s} {1:8s} {2:>10s} {3:>10s} {4:>10s} {5:>10s}".format(
+        "lengths", "dtype", "sort", "unstable", "argsort", "numpy"
+    )
+)
+for name, make_counts in distributions:
+    counts = make_counts()
+    offsets = np.zeros(len(counts) + 1, np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    for dtype in dtypes:
+        content = np.random.normal(0, 1000, offsets[-1]).astype(dtype)
+        array = ak.Array(
+            ak.layout.ListOffsetArray64(
+                ak.layout.Index64(offsets), ak.layout.NumpyArray(content)
+            )
+        )
+        print(
+            "{0:15s} {1:8s} {2:8.2f}ms {3:8.2f}ms {4:8.2f}ms {5:8.2f}ms".format(
+                name,
+                np.dtype(dtype).name,
+                measure(lambda: ak.sort(array)),
+                measure(lambda: ak.sort(array, stable=False)),
+                measure(lambda: ak.argsort(array)),
+                measure(lambda: np.sort(content, kind="stable")),
+            )
+        )
@@ -0,0 +1,49 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures the per-call overhead of dispatching kernels on small arrays, for
+# which the cost of a call is dominated by dispatch rather than computation.
+# Run it on two builds of Awkward Array to compare them (e.g. before and after
+# caching library handles and kernel symbols in src/libawkward/kernel-dispatch.cpp):
+#
+#     python studies/kernel-dispatch-overhead.py
+#
+# Non-CPU kernels are only measured if awkward-cuda-kernels is installed and a
+# GPU is available; CPU kernels are called directly, without dispatch, and are
+# measured as a baseline.
+
+import sys
+import timeit
+
+import awkward as ak
+
+NUMBER = 10000
+REPEAT = 5
+
+array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+
+kernels = ["cpu"]
+try:
+    import awkward_cuda_kernels  # noqa: F401
+
+    kernels.append("cuda")
+    array_cuda = ak.to_kernels(array, "cuda")
+    array_cuda.layout.content[0]
+except Exception as err:
+    sys.stderr.write("not measuring cuda: {0}\n".format(str(err)))
+
+operations = [
+    ("getitem_at", lambda a: a.layout.content[0]),
+    ("num", lambda a: ak.num(a, axis=1, highlevel=False)),
+    ("flatten", lambda a: ak.flatten(a, highlevel=False)),
+]
+
+for name, operation in operations:
+    for kernel in kernels:
+        a = array if kernel == "cpu" else array_cuda
+        operation(a)
+        best = min(timeit.repeat(lambda: operation(a), number=NUMBER, repeat=REPEAT))
+        print(
+            "{0:12s} {1:5s} {2:8.2f} us per call".format(
+                name, kernel, 1e6 * best / NUMBER
+            )
+        )
@@ -0,0 +1,42 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures np.sqrt(px ** 2 + py ** 2) of jagged arrays computed one ufunc at a
+# time and deferred with ak.lazy_expr, which broadcasts the arrays once and
+# evaluates the expression on their flattened contents (with numexpr, if it
+# is installed):
+#
+#     python studies/lazy-expressions.py
+#
+# NumPy on the flattened contents is measured as a baseline.
+
+import timeit
+
+import numpy as np
+import awkward as ak
+
+NUMBER = 10
+REPEAT = 5
+
+counts = np.random.poisson(10, 1000000)
+px = ak.unflatten(np.random.normal(0, 10, counts.sum()), counts)
+py = ak.unflatten(np.random.normal(0, 10, counts.sum()), counts)
+flat_px = np.asarray(ak.flatten(px))
+flat_py = np.asarray(ak.flatten(py))
+
+
+def eager():
+    return np.sqrt(px ** 2 + py ** 2)
+
+
+def lazy():
+    lazy_px, lazy_py = ak.lazy_expr(px, py)
+    return np.sqrt(lazy_px ** 2 + lazy_py ** 2).evaluate()
+
+
+def flat():
+    return np.sqrt(flat_px ** 2 + flat_py ** 2)
+
+
+for name, function in [("eager", eager), ("lazy_expr", lazy), ("numpy", flat)]:
+    best = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+    print("{0:10s} {1:8.2f} ms".format(name, 1e3 * best / NUMBER))
@@ -0,0 +1,50 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures the time it takes to pass an ak.Array to a JIT-compiled function
+# that does almost nothing, for the same array many times and for a fresh
+# chunk of an array each time, with small and large behaviors:
+#
+#     python studies/numba-call-overhead.py
+
+import timeit
+
+import numba
+import numpy as np
+import awkward as ak
+
+NUMBER = 1000
+REPEAT = 5
+
+
+@numba.njit
+def first_length(array):
+    return len(array[0])
+
+
+counts = np.random.poisson(3, 100000)
+array = ak.Array(
+    [
+        {"px": px, "py": px}
+        for px in ak.unflatten(np.random.normal(0, 1, counts.sum()), counts).tolist()[
+            :10000
+        ]
+    ]
+)
+
+big_behavior = {}
+for i in range(10000):
+    big_behavior["other{0}".format(i)] = ak.Record
+
+for behavior_name, behavior in [("no behavior", None), ("big behavior", big_behavior)]:
+    same = ak.Array(array[:10], behavior=behavior)
+    chunks = [ak.Array(array[i : i + 10], behavior=behavior) for i in range(NUMBER)]
+    first_length(same)
+
+    def fresh():
+        for chunk in chunks:
+            first_length(ak.Array(chunk.layout, behavior=behavior))
+
+    best = min(timeit.repeat(lambda: first_length(same), number=NUMBER, repeat=REPEAT))
+    print("{0:12s} same array   {1:8.2f} us".format(behavior_name, 1e6 * best / NUMBER))
+    best = min(timeit.repeat(fresh, number=1, repeat=REPEAT))
+    print("{0:12s} fresh arrays {1:8.2f} us".format(behavior_name, 1e6 * best / NUMBER))
@@ -0,0 +1,44 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures the kernels that process independent lists concurrently (see
+# include/awkward/kernel-parallel.h) with increasing numbers of threads:
+#
+#     python studies/parallel-sublist-kernels.py [max_threads]
+
+import multiprocessing
+import sys
+import timeit
+
+import numpy as np
+import awkward as ak
+
+NUMBER = 3
+REPEAT = 3
+
+if len(sys.argv) > 1:
+    max_threads = int(sys.argv[1])
+else:
+    max_threads = multiprocessing.cpu_count()
+
+counts = np.random.poisson(10, 2000000)
+array = ak.unflatten(np.random.normal(0, 1, counts.sum()), counts)
+
+operations = [
+    ("sort", lambda: ak.sort(array, axis=-1)),
+    ("argsort", lambda: ak.argsort(array, axis=-1)),
+    ("combinations", lambda: ak.argcombinations(array, 2)),
+]
+
+num_threads = [1]
+while num_threads[-1] * 2 <= max_threads:
+    num_threads.append(num_threads[-1] * 2)
+if num_threads[-1] != max_threads:
+    num_threads.append(max_threads)
+
+original = ak.get_num_threads()
+for name, operation in operations:
+    for n in num_threads:
+        ak.set_num_threads(n)
+        best = min(timeit.repeat(operation, number=NUMBER, repeat=REPEAT))
+        print("{0:12s} {1:3d} threads {2:8.2f} ms".format(name, n, 1e3 * best / NUMBER))
+ak.set_num_threads(original)
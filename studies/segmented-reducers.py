@@ -0,0 +1,85 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures reductions along the innermost axis of a large list of numbers,
+# which are computed directly from the ListOffsetArray's offsets instead of
+# through a materialized "parents" index. Run it on two builds of Awkward
+# Array to compare them (e.g. before and after the reduce_*_offsets kernels):
+#
+#     python studies/segmented-reducers.py
+#
+# Within one build, the same reductions of a list array whose content is
+# strided (not contiguous) go through the parents path instead; that path
+# first makes the content contiguous, so the time of that copy is also shown.
+# NumPy's ufunc.reduceat over the same offsets is measured as a baseline.
+
+import timeit
+
+import numpy as np
+import awkward as ak
+
+NUMBER = 10
+REPEAT = 5
+
+counts = np.random.poisson(5, 1000000)
+offsets = np.empty(len(counts) + 1, np.int64)
+offsets[0] = 0
+np.cumsum(counts, out=offsets[1:])
+content = np.random.normal(0, 1, offsets[-1])
+
+array = ak.Array(
+    ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets), ak.layout.NumpyArray(content)
+    )
+)
+
+doubled = np.empty(2 * len(content))
+doubled[::2] = content
+strided = doubled[::2]
+parents_array = ak.Array(
+    ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets), ak.layout.NumpyArray(strided)
+    )
+)
+
+# reduceat does not handle empty segments, so it only sees the nonempty ones
+nonempty = offsets[:-1][counts != 0]
+
+operations = [
+    ("count", ak.count, None),
+    ("sum", ak.sum, np.add),
+    ("prod", ak.prod, np.multiply),
+    ("min", ak.min, np.minimum),
+    ("max", ak.max, np.maximum),
+]
+
+best = min(
+    timeit.repeat(lambda: np.ascontiguousarray(strided), number=NUMBER, repeat=REPEAT)
+)
+print("copy   strided {0:8.2f} ms".format(1e3 * best / NUMBER))
+
+for name, reducer, ufunc in operations:
+    best = min(
+        timeit.repeat(
+            lambda: reducer(array, axis=-1),
+            number=NUMBER,
+            repeat=REPEAT,
+        )
+    )
+    print("{0:6s} offsets {1:8.2f} ms".format(name, 1e3 * best / NUMBER))
+    best = min(
+        timeit.repeat(
+            lambda: reducer(parents_array, axis=-1),
+            number=NUMBER,
+            repeat=REPEAT,
+        )
+    )
+    print("{0:6s} parents {1:8.2f} ms".format(name, 1e3 * best / NUMBER))
+    if ufunc is not None:
+        best = min(
+            timeit.repeat(
+                lambda: ufunc.reduceat(content, nonempty),
+                number=NUMBER,
+                repeat=REPEAT,
+            )
+        )
+        print("{0:6s} numpy   {1:8.2f} ms".format(name, 1e3 * best / NUMBER))
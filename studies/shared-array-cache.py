@@ -0,0 +1,81 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures threads that traverse lazy arrays whose arrays are all in a cache,
+# comparing a Python dict (every lookup holds the GIL) with a shared
+# ak.layout.LRUArrayCache (lookups do not use the GIL):
+#
+#     python studies/shared-array-cache.py [max_threads]
+
+import multiprocessing
+import sys
+import threading
+import time
+
+import numpy as np
+import awkward as ak
+
+NUM_ARRAYS = 200
+REPEAT = 3
+
+if len(sys.argv) > 1:
+    max_threads = int(sys.argv[1])
+else:
+    max_threads = multiprocessing.cpu_count()
+
+contents = [
+    ak.layout.NumpyArray(np.random.normal(0, 1, 100000)) for i in range(NUM_ARRAYS)
+]
+
+
+def make_lazy(cache):
+    return [
+        ak.layout.VirtualArray(
+            ak.layout.ArrayGenerator(
+                lambda i=i: contents[i], form=contents[i].form, length=len(contents[i])
+            ),
+            cache=cache,
+            cache_key="array{0}".format(i),
+        )
+        for i in range(NUM_ARRAYS)
+    ]
+
+
+def traverse(lazy):
+    for virtual in lazy:
+        virtual[50000:50010]
+
+
+def run(lazy, num_threads):
+    threads = [
+        threading.Thread(target=traverse, args=(lazy,)) for i in range(num_threads)
+    ]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.time() - start
+
+
+num_threads = [1]
+while num_threads[-1] * 2 <= max_threads:
+    num_threads.append(num_threads[-1] * 2)
+if num_threads[-1] != max_threads:
+    num_threads.append(max_threads)
+
+# ak.layout.ArrayCache only has a weak reference to its MutableMapping
+mapping = ak._util.MappingProxy({})
+
+for name, cache in [
+    ("dict", ak.layout.ArrayCache(mapping)),
+    ("LRUArrayCache", ak.layout.LRUArrayCache(2 ** 32)),
+]:
+    lazy = make_lazy(cache)
+    traverse(lazy)
+    for n in num_threads:
+        best = min(run(lazy, n) for i in range(REPEAT))
+        print(
+            "{0:14s} {1:3d} threads {2:8.2f} ms ({3:.2f} us per lookup)".format(
+                name, n, 1e3 * best, 1e6 * best / (n * NUM_ARRAYS)
+            )
+        )
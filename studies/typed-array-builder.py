@@ -0,0 +1,79 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Measures building lists of particles (records of two numbers) in a
+# Numba-compiled loop with ak.ArrayBuilder, which calls into C++ and checks
+# the type of its data for every append, and ak.TypedArrayBuilder, whose
+# appends are writes into preallocated buffers:
+#
+#     python studies/typed-array-builder.py
+
+import timeit
+
+import numba
+import numpy as np
+import awkward as ak
+
+NUMBER = 3
+REPEAT = 3
+
+counts = np.random.poisson(5, 1000000)
+offsets = np.zeros(len(counts) + 1, np.int64)
+np.cumsum(counts, out=offsets[1:])
+px = np.random.normal(0, 10, offsets[-1])
+charge = np.random.randint(-1, 2, offsets[-1])
+
+
+@numba.njit
+def fill_dynamic(builder, offsets, px, charge):
+    for i in range(len(offsets) - 1):
+        builder.begin_list()
+        for j in range(offsets[i], offsets[i + 1]):
+            builder.begin_record()
+            builder.field("px").real(px[j])
+            builder.field("charge").integer(charge[j])
+            builder.end_record()
+        builder.end_list()
+
+
+@numba.njit
+def fill_typed(root, offsets, px, charge):
+    particles = root.content
+    for i in range(len(offsets) - 1):
+        root.begin_list()
+        for j in range(offsets[i], offsets[i + 1]):
+            particles.begin_record()
+            particles.px.real(px[j])
+            particles.charge.integer(charge[j])
+            particles.end_record()
+        root.end_list()
+
+
+form = ak.forms.Form.fromjson(
+    """{
+    "class": "ListOffsetArray64",
+    "offsets": "i64",
+    "content": {
+        "class": "RecordArray",
+        "contents": {"px": "float64", "charge": "int64"}
+    }
+}"""
+)
+
+
+def dynamic():
+    builder = ak.ArrayBuilder()
+    fill_dynamic(builder, offsets, px, charge)
+    return builder.snapshot()
+
+
+def typed():
+    builder = ak.TypedArrayBuilder(form)
+    fill_typed(builder.root, offsets, px, charge)
+    return builder.snapshot()
+
+
+assert dynamic().tolist()[:100] == typed().tolist()[:100]
+
+for name, function in [("ArrayBuilder", dynamic), ("TypedArrayBuilder", typed)]:
+    best = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+    print("{0:18s} {1:8.2f} ms".format(name, 1e3 * best / NUMBER))
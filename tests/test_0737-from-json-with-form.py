@@ -0,0 +1,146 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_records():
+    form = ak.forms.Form.fromjson(
+        """{
+    "class": "RecordArray",
+    "contents": {
+        "x": "int64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"},
+        "z": {
+            "class": "ListOffsetArray64",
+            "offsets": "i64",
+            "content": {
+                "class": "NumpyArray",
+                "primitive": "uint8",
+                "parameters": {"__array__": "char"}
+            },
+            "parameters": {"__array__": "string"}
+        }
+    }
+}"""
+    )
+    source = """{"x": 1, "y": [1.1, 2, 3.3], "z": "one"}
+                {"y": [], "z": "two", "x": 2}
+                {"x": 3, "y": [4.4], "z": ""}"""
+    array = ak.from_json(source, form=form)
+    assert array.tolist() == [
+        {"x": 1, "y": [1.1, 2, 3.3], "z": "one"},
+        {"x": 2, "y": [], "z": "two"},
+        {"x": 3, "y": [4.4], "z": ""},
+    ]
+    assert str(ak.type(array)) == '3 * {"x": int64, "y": var * float64, "z": string}'
+
+
+def test_numbers():
+    assert ak.from_json("[1, 2, 3]", form='"int32"').tolist() == [1, 2, 3]
+    assert ak.type(ak.from_json("[1, 2, 3]", form='"int32"')) == ak.type(
+        ak.Array(np.array([1, 2, 3], np.int32))
+    )
+    assert ak.from_json("1 2 3", form='"float64"').tolist() == [1.0, 2.0, 3.0]
+    assert ak.from_json("[true, false]", form='"bool"').tolist() == [True, False]
+    assert (
+        ak.from_json(
+            '[1, "nan", "-inf"]',
+            form='"float64"',
+            nan_string="nan",
+            minus_infinity_string="-inf",
+        ).tolist()[2]
+        == -np.inf
+    )
+
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 2.2, 3]", form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 300]", form='"int8"')
+    with pytest.raises(ValueError):
+        ak.from_json("[true, 1]", form='"bool"')
+
+
+def test_options():
+    form = {
+        "class": "RecordArray",
+        "contents": {
+            "x": {
+                "class": "ByteMaskedArray",
+                "mask": "i8",
+                "valid_when": True,
+                "content": "int64",
+            },
+            "y": {
+                "class": "IndexedOptionArray64",
+                "index": "i64",
+                "content": {
+                    "class": "ListOffsetArray64",
+                    "offsets": "i64",
+                    "content": "int64",
+                },
+            },
+        },
+    }
+    array = ak.from_json('[{"x": 1, "y": [1]}, {"x": null}, {"y": null}]', form=form)
+    assert array.tolist() == [
+        {"x": 1, "y": [1]},
+        {"x": None, "y": None},
+        {"x": None, "y": None},
+    ]
+
+    with pytest.raises(ValueError):
+        ak.from_json("[1, null]", form='"int64"')
+
+
+def test_nonconforming_records():
+    form = {"class": "RecordArray", "contents": {"x": "int64", "y": "float64"}}
+    assert ak.from_json('{"x": 1, "y": 1.1}', form=form).tolist() == {"x": 1, "y": 1.1}
+
+    with pytest.raises(ValueError):
+        ak.from_json('{"x": 1}', form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('{"x": 1, "y": 1.1, "z": 2}', form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('{"x": 1, "y": 1.1, "x": 2}', form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('[{"x": 1, "y": 1.1}, 3]', form=form)
+
+
+def test_regular():
+    form = {"class": "RegularArray", "size": 2, "content": "float64"}
+    array = ak.from_json("[[1, 2], [3, 4], [5, 6]]", form=form)
+    assert isinstance(array.layout, ak.layout.RegularArray)
+    assert array.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2], [3]]", form=form)
+
+    form = {"class": "NumpyArray", "inner_shape": [2], "primitive": "float64"}
+    assert ak.from_json("[[1, 2], [3, 4]]", form=form).tolist() == [[1, 2], [3, 4]]
+
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "records.json")
+    with open(filename, "w") as file:
+        file.write('{"x": [1, 2]}\n{"x": []}\n{"x": [3]}\n')
+
+    form = {
+        "class": "RecordArray",
+        "contents": {
+            "x": {
+                "class": "ListArray64",
+                "starts": "i64",
+                "stops": "i64",
+                "content": "int64",
+            }
+        },
+    }
+    array = ak.from_json(filename, form=form, buffersize=8)
+    assert array.tolist() == [{"x": [1, 2]}, {"x": []}, {"x": [3]}]
+    assert ak.from_json(filename).tolist() == array.tolist()
@@ -0,0 +1,91 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import io
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def write_lines(tmp_path, n):
+    filename = os.path.join(str(tmp_path), "records.jsonl")
+    with open(filename, "w") as file:
+        for i in range(n):
+            file.write('{"x": %d, "y": [%s]}\n' % (i, ", ".join(["1.1"] * (i % 4))))
+        file.write("\n")
+    return filename
+
+
+form = {
+    "class": "RecordArray",
+    "contents": {
+        "x": "int64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"},
+    },
+}
+
+expectation = [{"x": i, "y": [1.1] * (i % 4)} for i in range(10)]
+
+
+def test_iter(tmp_path):
+    filename = write_lines(tmp_path, 10)
+
+    batches = list(ak.iter_json_lines(filename, batch_size=4, buffersize=16))
+    assert [len(x) for x in batches] == [4, 4, 2]
+    assert sum([x.tolist() for x in batches], []) == expectation
+
+    batches = list(ak.iter_json_lines(filename, batch_size=3, form=form))
+    assert [len(x) for x in batches] == [3, 3, 3, 1]
+    assert sum([x.tolist() for x in batches], []) == expectation
+    assert str(ak.type(batches[-1])) == '1 * {"x": int64, "y": var * float64}'
+
+    batches = list(ak.iter_json_lines(filename, batch_bytes=60))
+    assert all(len(x) < 10 for x in batches)
+    assert sum([x.tolist() for x in batches], []) == expectation
+
+    with open(filename) as file:
+        batches = list(ak.iter_json_lines(file, batch_size=100))
+    assert len(batches) == 1 and batches[0].tolist() == expectation
+
+    batches = list(ak.iter_json_lines(io.BytesIO(b"1\n\n2\n3"), batch_size=2))
+    assert [x.tolist() for x in batches] == [[1, 2], [3]]
+
+
+def test_partitioned(tmp_path):
+    filename = write_lines(tmp_path, 10)
+
+    array = ak.from_json_lines(filename, batch_size=4)
+    assert isinstance(array.layout, ak.partition.IrregularlyPartitionedArray)
+    assert array.layout.stops == [4, 8, 10]
+    assert array.tolist() == expectation
+
+    array = ak.from_json_lines(filename, batch_size=100)
+    assert isinstance(array.layout, ak.layout.RecordArray)
+    assert array.tolist() == expectation
+
+
+def test_lazy(tmp_path):
+    filename = write_lines(tmp_path, 10)
+
+    cache = {}
+    array = ak.from_json_lines(
+        filename, batch_size=4, lazy=True, lazy_cache=cache, form=form
+    )
+    assert array.layout.stops == [4, 8, 10]
+    assert str(ak.type(array)) == '10 * {"x": int64, "y": var * float64}'
+    assert len(cache) == 0
+
+    assert array[5].tolist() == expectation[5]
+    assert len(cache) == 1
+    assert array.tolist() == expectation
+    assert len(cache) == 3
+
+    array = ak.from_json_lines(filename, batch_size=3, lazy=True, lazy_cache=None)
+    assert array.tolist() == expectation
+
+    with pytest.raises(TypeError):
+        with open(filename) as file:
+            ak.from_json_lines(file, lazy=True)
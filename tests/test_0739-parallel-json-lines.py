@@ -0,0 +1,41 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test(tmp_path):
+    filename = os.path.join(str(tmp_path), "records.jsonl")
+    with open(filename, "w") as file:
+        for i in range(1000):
+            file.write('{"x": %d, "y": [%s]}\n' % (i, ", ".join(["2.2"] * (i % 5))))
+
+    expectation = [{"x": i, "y": [2.2] * (i % 5)} for i in range(1000)]
+
+    batches = list(ak.iter_json_lines(filename, batch_size=37, threads=4))
+    assert [len(x) for x in batches] == [37] * 27 + [1]
+    assert sum([x.tolist() for x in batches], []) == expectation
+
+    array = ak.from_json_lines(filename, batch_size=100, threads=8)
+    assert array.layout.stops == list(range(100, 1001, 100))
+    assert array.tolist() == expectation
+
+    form = {
+        "class": "RecordArray",
+        "contents": {
+            "x": "int64",
+            "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"},
+        },
+    }
+    array = ak.from_json_lines(filename, batch_size=100, threads=8, form=form)
+    assert array.tolist() == expectation
+
+    with open(filename, "a") as file:
+        file.write('{"x": 1000, "y": [1, 2\n')
+    with pytest.raises(ValueError):
+        ak.from_json_lines(filename, batch_size=100, threads=8)
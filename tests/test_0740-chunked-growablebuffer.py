@@ -0,0 +1,59 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_numbers():
+    builder = ak.ArrayBuilder(initial=1, resize=1.5)
+    for i in range(1000):
+        builder.integer(i)
+    assert builder.snapshot().tolist() == list(range(1000))
+
+    builder.real(1000.5)
+    assert builder.snapshot().tolist() == list(range(1000)) + [1000.5]
+
+    builder = ak.ArrayBuilder(initial=3, resize=2)
+    for i in range(100):
+        builder.boolean(i % 3 == 0)
+    assert builder.snapshot().tolist() == [i % 3 == 0 for i in range(100)]
+
+    builder = ak.ArrayBuilder(initial=3, resize=1.1)
+    for i in range(100):
+        builder.complex(i + 1j)
+    assert builder.snapshot().tolist() == [i + 1j for i in range(100)]
+
+
+def test_snapshots():
+    builder = ak.ArrayBuilder(initial=2, resize=1.5)
+    snapshots = []
+    for i in range(200):
+        builder.begin_list()
+        for j in range(i % 4):
+            builder.real(j * 1.1)
+        builder.end_list()
+        if i % 17 == 0:
+            snapshots.append((i + 1, builder.snapshot()))
+
+    for length, snapshot in snapshots:
+        assert snapshot.tolist() == [
+            [j * 1.1 for j in range(i % 4)] for i in range(length)
+        ]
+    assert builder.snapshot().tolist() == [
+        [j * 1.1 for j in range(i % 4)] for i in range(200)
+    ]
+
+
+def test_nested():
+    data = [
+        {"x": i, "y": None if i % 5 == 0 else str(i) * (i % 3), "z": [i] * (i % 2)}
+        for i in range(500)
+    ] + [1, "two", [3.3]]
+    builder = ak.ArrayBuilder(initial=1, resize=1.2)
+    for x in data:
+        builder.append(x)
+    assert builder.snapshot().tolist() == data
+    assert ak.from_iter(data, initial=1).tolist() == data
@@ -0,0 +1,32 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test():
+    builder = ak.ArrayBuilder()
+    assert builder.snapshot_batch().tolist() == []
+
+    batches = []
+    for i in range(10):
+        builder.append({"x": i, "y": [i] * (i % 3)})
+        if i % 4 == 3:
+            batches.append(builder.snapshot_batch())
+    assert len(builder.snapshot()) == 10
+    batches.append(builder.snapshot_batch())
+    assert builder.snapshot_batch().tolist() == []
+
+    assert [len(x) for x in batches] == [4, 4, 2]
+    array = ak.partitioned(batches)
+    assert array.layout.stops == [4, 8, 10]
+    assert array.tolist() == [{"x": i, "y": [i] * (i % 3)} for i in range(10)]
+
+    builder.begin_list()
+    builder.integer(1)
+    assert builder.snapshot_batch().tolist() == []
+    builder.end_list()
+    assert builder.snapshot_batch().tolist() == [[1]]
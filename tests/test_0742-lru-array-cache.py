@@ -0,0 +1,122 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_eviction():
+    cache = ak.layout.LRUArrayCache(2000)
+    one = ak.layout.NumpyArray(np.arange(100, dtype=np.int64))  # 800 bytes
+    two = ak.layout.NumpyArray(np.arange(100, dtype=np.float64))
+    three = ak.layout.NumpyArray(np.arange(100, dtype=np.uint64))
+
+    cache["one"] = one
+    cache["two"] = two
+    assert cache.nbytes == 1600
+    assert len(cache) == 2
+    assert "one" in cache and "three" not in cache
+
+    assert ak.to_list(cache["one"]) == list(range(100))
+    cache["three"] = three
+    assert cache.keys() == ["three", "one"]
+    assert cache.nbytes == 1600
+    assert cache.evictions == 1
+    with pytest.raises(KeyError):
+        cache["two"]
+    assert cache.hits == 1 and cache.misses == 1
+
+    cache["big"] = ak.layout.NumpyArray(np.zeros(1000))
+    assert "big" not in cache and len(cache) == 2
+
+    del cache["one"]
+    assert cache.keys() == ["three"]
+    assert cache.nbytes == 800
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0 and cache.hits == 0
+
+
+def test_virtual():
+    counter = [0]
+
+    def generate(i):
+        counter[0] += 1
+        return ak.Array(np.full(100, i, np.float64))
+
+    cache = ak.layout.LRUArrayCache(2000)
+    arrays = [
+        ak.virtual(generate, (i,), length=100, form='"float64"', cache=cache)
+        for i in range(3)
+    ]
+    lazy = ak.virtual(generate, (0,), cache="lru:1MB")
+    assert lazy.layout.cache.maxbytes == 1000000
+
+    assert arrays[0][0] == 0 and arrays[1][0] == 1
+    assert counter[0] == 2
+    assert arrays[0][1] == 0
+    assert counter[0] == 2
+    assert arrays[2][0] == 2
+    assert counter[0] == 3
+    assert cache.evictions == 1
+    assert arrays[1][0] == 1
+    assert counter[0] == 4
+
+    assert isinstance(arrays[0].layout.cache, ak.layout.LRUArrayCache)
+
+
+def test_threads():
+    cache = ak.layout.LRUArrayCache(8000)
+    arrays = [ak.layout.NumpyArray(np.full(100, i)) for i in range(20)]
+
+    def work(j):
+        for k in range(200):
+            i = (j * 7 + k) % 20
+            cache[str(i)] = arrays[i]
+            try:
+                assert ak.to_list(cache[str(i)])[0] == i
+            except KeyError:
+                pass
+
+    threads = [threading.Thread(target=work, args=(j,)) for j in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.nbytes <= 8000
+    assert cache.nbytes == 800 * len(cache)
+
+
+def test_from_buffers():
+    array = ak.Array([{"x": [1, 2, 3], "y": 1.1}, {"x": [], "y": 2.2}])
+    form, length, container = ak.to_buffers(array)
+    lazy = ak.from_buffers(form, length, container, lazy=True, lazy_cache="lru:1KiB")
+    assert lazy.tolist() == array.tolist()
+    (cache,) = lazy.layout.caches
+    assert cache.maxbytes == 1024
+    assert len(cache) != 0 and cache.nbytes <= 1024
+
+    with pytest.raises(ValueError):
+        ak.from_buffers(form, length, container, lazy=True, lazy_cache="lru:lots")
+
+
+def test_from_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    array = ak.Array(
+        [
+            [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}],
+            [],
+            [{"x": 3, "y": [3.3, 4.4]}],
+        ]
+    )
+    ak.to_parquet(array, filename)
+    lazy = ak.from_parquet(filename, lazy=True, lazy_cache="lru:1MB")
+    assert lazy.tolist() == array.tolist()
+    (cache,) = lazy.caches
+    assert isinstance(cache, ak.layout.LRUArrayCache)
+    assert len(cache) != 0
@@ -0,0 +1,107 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def lazy_partitions(arrays):
+    calls = []
+
+    def generate(i):
+        calls.append(i)
+        return arrays[i].layout
+
+    partitions = []
+    for i, array in enumerate(arrays):
+        generator = ak.layout.ArrayGenerator(
+            generate, (i,), form=array.layout.form, length=len(array)
+        )
+        partitions.append(ak.layout.VirtualArray(generator, None))
+    return ak.partition.IrregularlyPartitionedArray(partitions), calls
+
+
+def test_axis_none():
+    arrays = [
+        ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]]),
+        ak.Array([[6.6], [7.7, 8.8, 9.9]]),
+        ak.Array([[10.0, -1.0]]),
+    ]
+    whole = ak.concatenate(arrays)
+    layout, calls = lazy_partitions(arrays)
+    lazy = ak.Array(layout)
+
+    for reducer in (ak.count, ak.count_nonzero, ak.sum, ak.prod, ak.any, ak.all):
+        assert reducer(lazy) == pytest.approx(reducer(whole))
+    assert ak.min(lazy) == -1.0
+    assert ak.max(lazy) == 10.0
+
+    # one materialization per partition and reducer, never the whole array
+    assert len(calls) == 8 * 3
+    assert sorted(set(calls)) == [0, 1, 2]
+
+
+def test_min_max_empty_partitions():
+    array = ak.partitioned([ak.Array([[], []]).layout, ak.Array([[3, 1, 2]]).layout])
+    assert ak.min(array) == 1
+    assert ak.max(array) == 3
+
+    array = ak.partitioned([ak.Array([[], []]).layout, ak.Array([[]]).layout])
+    assert ak.min(array) is None
+    assert ak.max(array) is None
+
+
+def test_outermost_axis():
+    whole = ak.Array([1, 2, 3, 0, 5, 6, 7])
+    array = ak.repartition(whole, 3)
+    assert isinstance(array.layout, ak.partition.PartitionedArray)
+
+    for reducer in (ak.count, ak.count_nonzero, ak.sum, ak.prod, ak.any, ak.all):
+        assert reducer(array, axis=0) == reducer(whole, axis=0)
+    assert ak.min(array, axis=0) == 0
+    assert ak.max(array, axis=0) == 7
+    assert ak.min(array, axis=0, initial=-1) == -1
+
+    missing = ak.partitioned(
+        [ak.Array([None, None]).layout, ak.Array([None, 4, None, 2]).layout]
+    )
+    assert ak.min(missing, axis=0) == 2
+    assert ak.max(missing, axis=0) == 4
+    assert ak.sum(missing, axis=0) == 6
+    assert ak.sum(missing[:2], axis=0) == 0
+    assert ak.min(missing[:2], axis=0) is None
+
+    # keepdims and nested lists still concatenate the partitions
+    assert ak.sum(array, axis=0, keepdims=True).tolist() == [24]
+    nested = ak.repartition(ak.Array([[1, 2], [3], [4, 5, 6]]), 2)
+    assert ak.sum(nested, axis=0).tolist() == [8, 7, 6]
+
+
+def test_statistics():
+    x = ak.Array([[1.0, 2.0, 3.0], [], [4.0, 5.0], [6.0], [7.0, 8.0, 9.0, 10.0]])
+    w = ak.Array([[1.0, 0.5, 2.0], [], [1.5, 1.0], [3.0], [0.5, 1.0, 2.0, 1.0]])
+    px = ak.repartition(x, 2)
+    pw = ak.repartition(w, 3)
+
+    assert ak.mean(px) == pytest.approx(ak.mean(x))
+    assert ak.mean(px, weight=w) == pytest.approx(ak.mean(x, weight=w))
+    assert ak.mean(x, weight=pw) == pytest.approx(ak.mean(x, weight=w))
+
+    for ddof in (0, 1):
+        assert ak.var(px, ddof=ddof) == pytest.approx(ak.var(x, ddof=ddof))
+        assert ak.var(px, weight=pw, ddof=ddof) == pytest.approx(
+            ak.var(x, weight=w, ddof=ddof)
+        )
+        assert ak.std(px, weight=pw, ddof=ddof) == pytest.approx(
+            ak.std(x, weight=w, ddof=ddof)
+        )
+
+    for n in (0, 1, 2, 3):
+        assert ak.moment(px, n) == pytest.approx(ak.moment(x, n))
+        assert ak.moment(px, n, weight=pw) == pytest.approx(ak.moment(x, n, weight=w))
+
+    empty = ak.repartition(ak.Array([[], []]), 1)
+    assert np.isnan(ak.mean(empty))
+    assert np.isnan(ak.var(empty))
@@ -0,0 +1,101 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import operator
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+futures = pytest.importorskip("concurrent.futures")
+
+
+def make_partitioned(lazy=False):
+    data = [
+        [{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}],
+        [{"x": 3, "y": [3.3]}],
+        [{"x": 4, "y": [4.4, 5.5, 6.6]}, {"x": 5, "y": [7.7]}, {"x": 6, "y": []}],
+    ]
+    partitions = [ak.Array(x).layout for x in data]
+    if lazy:
+        partitions = [
+            ak.layout.VirtualArray(
+                ak.layout.ArrayGenerator(lambda x=x: x, form=x.form, length=len(x)),
+                None,
+            )
+            for x in partitions
+        ]
+    return ak.Array(ak.partition.IrregularlyPartitionedArray(partitions))
+
+
+def check(array):
+    out = ak.partition.apply(operator.methodcaller("num", 1), array.layout["y"])
+    assert ak.Array(out).tolist() == [2, 0, 1, 3, 1, 0]
+    assert ak.num(array.y).tolist() == [2, 0, 1, 3, 1, 0]
+    assert ak.num(array.x, axis=0) == 6
+    assert ak.flatten(array.y).tolist() == [1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7]
+    assert ak.pad_none(array.y, 1).tolist() == [
+        [1.1, 2.2],
+        [None],
+        [3.3],
+        [4.4, 5.5, 6.6],
+        [7.7],
+        [None],
+    ]
+    assert ak.sum(array.y, axis=1).tolist() == pytest.approx(
+        [3.3, 0, 3.3, 16.5, 7.7, 0]
+    )
+    assert ak.max(array.x, axis=0) == 6
+    assert array[["x"]].tolist() == [{"x": i} for i in range(1, 7)]
+    assert array[array.x % 2 == 0, "x"].tolist() == [2, 4, 6]
+    assert array["y", ..., :1].tolist() == [[1.1], [], [3.3], [4.4], [7.7], []]
+
+
+def test_serial():
+    check(make_partitioned())
+    check(make_partitioned(lazy=True))
+
+
+def test_threads():
+    with futures.ThreadPoolExecutor(3) as executor:
+        for lazy in (False, True):
+            array = make_partitioned(lazy=lazy)
+            out = ak.partition.apply(
+                operator.methodcaller("num", 1), array.layout["y"], executor=executor
+            )
+            assert ak.Array(out).tolist() == [2, 0, 1, 3, 1, 0]
+
+        try:
+            ak.partition.executor = executor
+            check(make_partitioned())
+            check(make_partitioned(lazy=True))
+        finally:
+            ak.partition.executor = None
+
+
+def test_map_partitions():
+    partitions = make_partitioned().layout.partitions
+    assert ak.partition.map_partitions(len, partitions) == [2, 1, 3]
+    with futures.ThreadPoolExecutor(2) as executor:
+        assert ak.partition.map_partitions(len, partitions, executor=executor) == [
+            2,
+            1,
+            3,
+        ]
+
+
+def test_processes():
+    array = make_partitioned(lazy=True)
+    with futures.ProcessPoolExecutor(2) as executor:
+        out = ak.partition.apply(
+            operator.methodcaller("num", 1), array.layout["y"], executor=executor
+        )
+        assert ak.Array(out).tolist() == [2, 0, 1, 3, 1, 0]
+
+        out = ak.partition.map_partitions(
+            operator.methodcaller("sum", 0, False, False),
+            array.layout["x"].partitions,
+            executor=executor,
+        )
+        assert out == [3, 3, 15]
@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="pickle protocol 5 requires Python 3.8"
+)
+def test_out_of_band():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    buffers = []
+    data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    assert pickle.loads(data, buffers=buffers).tolist() == [[1, 2, 3], [], [4, 5]]
+
+    record = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": [2.2, 3.3]}])[1]
+    buffers = []
+    data = pickle.dumps(record, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+    assert pickle.loads(data, buffers=buffers).tolist() == {"x": 2, "y": [2.2, 3.3]}
+
+
+def sum_from_shared_memory(form, length, container):
+    return ak.sum(ak.from_buffers(form, length, container))
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="shared_memory requires Python 3.8"
+)
+def test_shared_memory():
+    original = ak.Array(
+        ak.layout.ListOffsetArray64(
+            ak.layout.Index64(np.array([0, 3, 3, 10000])),
+            ak.layout.NumpyArray(np.arange(10000, dtype=np.float64)),
+        )
+    )
+    form, length, container = ak.to_shared_memory(original[[0, 1, None, 2]])
+    try:
+        assert isinstance(container, ak._util.SharedMemoryContainer)
+        assert len(container) == 3
+
+        # pickled as names, not contents
+        data = pickle.dumps(container)
+        assert len(data) < 1000
+
+        other = pickle.loads(data)
+        array = ak.from_buffers(form, length, other)
+        assert array[0].tolist() == [0, 1, 2]
+        assert array[1].tolist() == []
+        assert array[2] is None
+        assert array[3, -1] == 9999
+
+        # the unpickled container maps the same memory
+        key = [key for key in container if key.endswith("-data")][0]
+        container[key][:8] = np.frombuffer(np.float64(9.9).tobytes(), np.uint8)
+        assert ak.from_buffers(form, length, other)[0, 0] == 9.9
+        del array
+        other.close()
+
+    finally:
+        container.unlink()
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="shared_memory requires Python 3.8"
+)
+def test_process_pool():
+    futures = pytest.importorskip("concurrent.futures")
+    original = ak.Array([[1, 2, 3], [], [4, 5]])
+    form, length, container = ak.to_shared_memory(ak.repartition(original, 2))
+    try:
+        with futures.ProcessPoolExecutor(1) as executor:
+            future = executor.submit(sum_from_shared_memory, form, length, container)
+            assert future.result() == 15
+    finally:
+        container.unlink()
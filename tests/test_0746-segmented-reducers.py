@@ -0,0 +1,104 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def listoffsetarray(data, dtype):
+    offsets = np.array([2, 5, 5, 6, 9, 9], np.int64)
+    content = np.array(data, dtype)
+    return ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets), ak.layout.NumpyArray(content)
+    )
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+    ],
+)
+def test_dtypes(dtype):
+    data = [100, 100, 1, 2, 3, 4, 5, 1, 6, 100]
+    layout = listoffsetarray(data, dtype)
+    assert ak.sum(layout, axis=-1).tolist() == [6, 0, 4, 12, 0]
+    assert ak.prod(layout, axis=-1).tolist() == [6, 1, 4, 30, 1]
+    assert ak.count(layout, axis=-1).tolist() == [3, 0, 1, 3, 0]
+    assert ak.min(layout, axis=-1).tolist() == [1, None, 4, 1, None]
+    assert ak.max(layout, axis=-1).tolist() == [3, None, 4, 6, None]
+
+    assert (
+        ak.to_numpy(ak.sum(layout, axis=-1)).dtype
+        == np.sum(np.array(data, dtype)).dtype
+    )
+    assert (
+        ak.to_numpy(ak.prod(layout, axis=-1)).dtype
+        == ak.to_numpy(ak.sum(layout, axis=-1)).dtype
+    )
+    assert ak.to_numpy(ak.min(layout, axis=-1, mask_identity=False)).dtype == dtype
+    assert ak.to_numpy(ak.max(layout, axis=-1, mask_identity=False)).dtype == dtype
+
+
+def test_initial_and_keepdims():
+    layout = listoffsetarray([0, 0, 1.5, -2.5, 3.5, 4.5, 5.5, 1.5, 6.5, 0], np.float64)
+    assert ak.min(layout, axis=-1, initial=0).tolist() == [-2.5, None, 0, 0, None]
+    assert ak.max(layout, axis=-1, initial=5).tolist() == [5, None, 5, 6.5, None]
+    assert ak.sum(layout, axis=-1, keepdims=True).tolist() == [
+        [2.5],
+        [0],
+        [4.5],
+        [13.5],
+        [0],
+    ]
+    assert ak.min(layout, axis=-1, keepdims=True).tolist() == [
+        [-2.5],
+        [None],
+        [4.5],
+        [1.5],
+        [None],
+    ]
+    assert ak.min(layout, axis=-1, mask_identity=False).tolist() == [
+        -2.5,
+        np.inf,
+        4.5,
+        1.5,
+        np.inf,
+    ]
+
+
+def test_nested_and_sliced():
+    array = ak.Array([[[1, 2, 3], [], [4]], [], [[5, 6], [7, 8, 9, 10]], [[11]]])
+    assert ak.sum(array, axis=-1).tolist() == [[6, 0, 4], [], [11, 34], [11]]
+    assert ak.sum(array[1:], axis=-1).tolist() == [[], [11, 34], [11]]
+    assert ak.max(array[:, ::-1], axis=-1).tolist() == [
+        [4, None, 3],
+        [],
+        [10, 6],
+        [11],
+    ]
+    assert ak.prod(array[2:, :, 1:], axis=-1).tolist() == [[6, 720], [1]]
+
+
+def test_fallbacks():
+    array = ak.Array([[True, False], [], [True, True]])
+    assert ak.sum(array, axis=-1).tolist() == [1, 0, 2]
+    assert ak.min(array, axis=-1).tolist() == [False, None, True]
+
+    array = ak.Array([[1 + 1j, 2], [], [3j]])
+    assert ak.sum(array, axis=-1).tolist() == [3 + 1j, 0, 3j]
+
+    array = ak.Array([[3, 1, 2], [], [5, 4]])
+    assert ak.argmin(array, axis=-1).tolist() == [1, None, 1]
+    assert ak.any(array, axis=-1).tolist() == [True, False, True]
@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def jagged(counts, dtype, seed):
+    random = np.random.RandomState(seed)
+    offsets = np.zeros(len(counts) + 1, np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    if issubclass(dtype, np.floating):
+        content = random.normal(0, 100, offsets[-1]).astype(dtype)
+    elif dtype is np.bool_:
+        content = random.randint(0, 2, offsets[-1]).astype(dtype)
+    else:
+        info = np.iinfo(dtype)
+        content = random.randint(
+            max(info.min, -(2 ** 40)), min(info.max, 2 ** 40), offsets[-1]
+        ).astype(dtype)
+    layout = ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets), ak.layout.NumpyArray(content)
+    )
+    return ak.Array(layout), offsets, content
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+    ],
+)
+@pytest.mark.parametrize("stable", [True, False])
+def test_sort(dtype, stable):
+    # short lists use the sorting network, long ones the radix sort, and
+    # the ones in between a comparison sort
+    counts = [0, 1, 2, 3, 15, 16, 17, 100, 255, 256, 1000]
+    array, offsets, content = jagged(counts, dtype, 12345)
+    for ascending in (True, False):
+        result = ak.sort(array, ascending=ascending, stable=stable)
+        for i, count in enumerate(counts):
+            expected = np.sort(content[offsets[i] : offsets[i + 1]])
+            if not ascending:
+                expected = expected[::-1]
+            assert ak.to_numpy(result[i]).tolist() == expected.tolist()
+
+        index = ak.argsort(array, ascending=ascending, stable=stable)
+        assert ak.to_list(array[index]) == ak.to_list(result)
+
+
+def test_float_order():
+    array = ak.Array([[3.5, -0.5, np.inf, -np.inf, 0.0, -1e300, 1e-300] * 40])
+    assert ak.to_list(ak.sort(array)) == [
+        sorted([3.5, -0.5, np.inf, -np.inf, 0.0, -1e300, 1e-300] * 40)
+    ]
+    assert ak.to_list(ak.sort(array, ascending=False)) == [
+        sorted([3.5, -0.5, np.inf, -np.inf, 0.0, -1e300, 1e-300] * 40, reverse=True)
+    ]
+
+
+def test_stable_argsort():
+    array = ak.Array([[2, 1, 2, 1, 2, 1], [], [0] * 20 + [-1] * 20])
+    assert ak.to_list(ak.argsort(array, stable=True)) == [
+        [1, 3, 5, 0, 2, 4],
+        [],
+        list(range(20, 40)) + list(range(20)),
+    ]
+    assert ak.to_list(ak.argsort(array, ascending=False, stable=True)) == [
+        [0, 2, 4, 1, 3, 5],
+        [],
+        list(range(40)),
+    ]
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_nan_and_signed_zero(dtype):
+    # as in NumPy, whether a sublist is short or long, NaNs (of either sign)
+    # are last and -0.0 == 0.0; descending order also puts NaNs last
+    uint = np.uint32 if dtype is np.float32 else np.uint64
+    values = np.array([np.nan, -np.nan, -0.0, 0.0, 1.5, -1.5, np.inf, -np.inf], dtype)
+    random = np.random.RandomState(12345)
+    for count in (20, 300):
+        content = values[random.randint(0, len(values), count)]
+        array = ak.Array(
+            ak.layout.ListOffsetArray64(
+                ak.layout.Index64(np.array([0, count], np.int64)),
+                ak.layout.NumpyArray(content),
+            )
+        )
+        for ascending in (True, False):
+            expected = np.argsort(content if ascending else -content, kind="stable")
+            index = ak.argsort(array, ascending=ascending, stable=True)
+            assert ak.to_list(index) == [expected.tolist()]
+
+            result = np.asarray(ak.sort(array, ascending=ascending, stable=True)[0])
+            assert result.view(uint).tolist() == content[expected].view(uint).tolist()
+
+    array = ak.Array([[0.0, -0.0, 0.0]])
+    assert ak.to_list(ak.argsort(array, stable=True)) == [[0, 1, 2]]
@@ -0,0 +1,69 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.fixture
+def threads():
+    original = ak.get_num_threads()
+    ak.set_num_threads(4)
+    yield
+    ak.set_num_threads(original)
+
+
+def jagged(seed):
+    random = np.random.RandomState(seed)
+    counts = random.poisson(5, 50000)
+    counts[100] = 100000
+    return counts, ak.unflatten(random.normal(0, 1, counts.sum()), counts)
+
+
+def same(one, two):
+    assert ak.to_list(ak.num(one)) == ak.to_list(ak.num(two))
+    if isinstance(ak.type(one).type.type, ak.types.RecordType):
+        for x, y in zip(ak.unzip(one), ak.unzip(two)):
+            same(x, y)
+    else:
+        assert np.array_equal(
+            ak.to_numpy(ak.flatten(one)), ak.to_numpy(ak.flatten(two))
+        )
+
+
+def test_num_threads():
+    original = ak.get_num_threads()
+    try:
+        ak.set_num_threads(3)
+        assert ak.get_num_threads() == 3
+        ak.set_num_threads(0)
+        assert ak.get_num_threads() >= 1
+    finally:
+        ak.set_num_threads(original)
+    assert ak.get_num_threads() == original
+
+
+def test_sort(threads):
+    counts, array = jagged(12345)
+    sorted_array = ak.sort(array, axis=-1)
+    index = ak.argsort(array, axis=-1, ascending=False)
+    ak.set_num_threads(1)
+    same(sorted_array, ak.sort(array, axis=-1))
+    same(index, ak.argsort(array, axis=-1, ascending=False))
+
+    flat = ak.to_numpy(ak.flatten(sorted_array))
+    starts = np.cumsum(counts) - counts
+    assert np.all(np.diff(flat[starts[100] : starts[100] + counts[100]]) >= 0)
+    same(array[index], ak.sort(array, axis=-1, ascending=False))
+
+
+def test_combinations(threads):
+    counts = np.random.RandomState(54321).poisson(5, 50000)
+    array = ak.unflatten(np.arange(counts.sum()), counts)
+    pairs = ak.argcombinations(array, 2)
+    triples = ak.combinations(array, 3, replacement=True)
+    ak.set_num_threads(1)
+    same(pairs, ak.argcombinations(array, 2))
+    same(triples, ak.combinations(array, 3, replacement=True))
@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+class Point(ak.Record):
+    pass
+
+
+def test_overload_added_later():
+    behavior = {}
+    array = ak.Array(
+        [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}],
+        with_name="point",
+        behavior=behavior,
+    )
+    with pytest.raises(ValueError):
+        array + array
+
+    behavior[np.add, "point", "point"] = lambda a, b: ak.zip(
+        {"x": a.x + b.x, "y": a.y + b.y}, with_name="point"
+    )
+    assert (array + array).tolist() == [{"x": 2, "y": 2.2}, {"x": 4, "y": 4.4}]
+
+    # replacing an overload takes effect without adding keys
+    behavior[np.add, "point", "point"] = lambda a, b: a.x + b.x
+    assert (array + array).tolist() == [2, 4]
+
+    del behavior[np.add, "point", "point"]
+    with pytest.raises(ValueError):
+        array + array
+
+
+def test_overload_order_and_subclasses():
+    behavior = {
+        (np.add, "point", np.integer): lambda a, b: a.x + b,
+        (np.add, "point", np.int64): lambda a, b: a.x - b,
+    }
+    for i in range(1000):
+        behavior[np.multiply, "other{0}".format(i), "other{0}".format(i)] = None
+    array = ak.Array([{"x": 10}, {"x": 20}], with_name="point", behavior=behavior)
+    # the first matching key wins, including matches through subclasses
+    assert (array + np.array([1, 2])).tolist() == [11, 22]
+
+
+def test_overrides_take_precedence_over_defaults():
+    ak.behavior[np.add, "point749", "point749"] = lambda a, b: a.x
+    try:
+        array = ak.Array([{"x": 1}, {"x": 2}], with_name="point749")
+        assert (array + array).tolist() == [1, 2]
+
+        behavior = {(np.add, "point749", "point749"): lambda a, b: a.x * 100}
+        array = ak.Array([{"x": 1}, {"x": 2}], with_name="point749", behavior=behavior)
+        assert (array + array).tolist() == [100, 200]
+    finally:
+        del ak.behavior[np.add, "point749", "point749"]
+
+
+def test_custom_broadcast():
+    behavior = {}
+    array = ak.with_parameter([[1, 2, 3], [], [4, 5]], "__array__", "thing")
+    assert ak._util.custom_broadcast(array.layout, behavior) is None
+
+    def broadcast(layout):
+        return layout
+
+    behavior["__broadcast__", "thing"] = broadcast
+    assert ak._util.custom_broadcast(array.layout, behavior) is broadcast
+
+
+def test_chained_behavior_is_reused_until_keys_change():
+    behavior = {"one": 1}
+    first = ak._util.chained_behavior(behavior)
+    assert ak._util.chained_behavior(behavior) is first
+    behavior["two"] = 2
+    second = ak._util.chained_behavior(behavior)
+    assert second is not first
+    assert second["two"] == 2
+    assert ak._util.chained_behavior(None)["two"] is None
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason="a swapped key is only noticed where dicts are reversible",
+)
+def test_overload_swapped_for_another_key():
+    behavior = {"placeholder": None}
+    array = ak.Array(
+        [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}],
+        with_name="point",
+        behavior=behavior,
+    )
+    with pytest.raises(ValueError):
+        array + array
+
+    # same number of keys, but different keys
+    del behavior["placeholder"]
+    behavior[np.add, "point", "point"] = lambda a, b: a.x + b.x
+    assert (array + array).tolist() == [2, 4]
@@ -0,0 +1,103 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_same_as_eager():
+    px = ak.Array([[1.0, 2.0, 3.0], [], [4.0, 5.0]])
+    py = ak.Array([[0.5, 1.5, 2.5], [], [3.5, 4.5]])
+    lazy_px, lazy_py = ak.lazy_expr(px, py)
+    expression = np.sqrt(lazy_px ** 2 + lazy_py ** 2)
+    assert repr(expression) == "<LazyExpression sqrt(add(power(x0, 2), power(x1, 2)))>"
+
+    result = expression.evaluate()
+    assert isinstance(result, ak.Array)
+    assert result.tolist() == np.sqrt(px ** 2 + py ** 2).tolist()
+    assert isinstance(expression.evaluate(highlevel=False), ak.layout.Content)
+
+    # the arrays themselves are not overwritten by temporaries
+    assert px.tolist() == [[1.0, 2.0, 3.0], [], [4.0, 5.0]]
+    assert py.tolist() == [[0.5, 1.5, 2.5], [], [3.5, 4.5]]
+
+
+def test_broadcasting_and_dtypes():
+    ints = ak.Array([[1, 2, 3], [], [4, 5]])
+    lazy = ak.lazy_expr(ints)
+    assert (lazy * np.array([1, 2, 3]) + 1).evaluate().tolist() == [
+        [2, 3, 4],
+        [],
+        [13, 16],
+    ]
+    # integer temporaries are not reused for floating-point results
+    result = ((lazy + 1) / 2).evaluate()
+    assert result.tolist() == [[1.0, 1.5, 2.0], [], [2.5, 3.0]]
+    assert str(ak.type(result)) == "3 * var * float64"
+    assert (lazy > 2).evaluate().tolist() == [[False, False, True], [], [True, True]]
+
+    regular = ak.Array(np.arange(12.0).reshape(3, 4))
+    result = (ak.lazy_expr(regular) * 2 + regular).evaluate()
+    assert isinstance(result.layout, ak.layout.NumpyArray)
+    assert result.tolist() == (np.arange(12.0).reshape(3, 4) * 3).tolist()
+
+
+def test_shared_subexpressions():
+    array = ak.Array([[1.0, 2.0], [3.0]])
+    lazy = ak.lazy_expr(array)
+    square = lazy * lazy
+    assert (square + square * 2).evaluate().tolist() == [[3.0, 12.0], [27.0]]
+    assert ak.lazy_expr(array).evaluate().tolist() == array.tolist()
+
+
+def test_scalar_temporaries():
+    # a 0-d temporary is never the output of a step on arrays
+    values = [np.array(2.0), np.arange(3.0), None, None]
+    steps = [(2, np.multiply, (0, 0)), (3, np.add, (2, 1))]
+    result = ak._lazyexpr.fused_numpy(np, values, steps)
+    assert result.tolist() == [4.0, 5.0, 6.0]
+
+
+def test_custom_behaviors():
+    behavior = {}
+    behavior[np.add, "point", "point"] = lambda a, b: ak.zip(
+        {"x": a.x + b.x}, with_name="point"
+    )
+    points = ak.Array([[{"x": 1}, {"x": 2}], []], with_name="point", behavior=behavior)
+    lazy = ak.lazy_expr(points)
+    assert (lazy + lazy).evaluate().tolist() == [[{"x": 2}, {"x": 4}], []]
+
+    strings = ak.Array(["one", "two", "one"])
+    assert (ak.lazy_expr(strings) == "one").evaluate().tolist() == [True, False, True]
+
+
+def test_non_deferred_ufuncs():
+    array = ak.Array([[1.0, 2.0], [3.0]])
+    lazy = ak.lazy_expr(array)
+    out = np.add(lazy, 1, where=True)
+    assert isinstance(out, ak.Array)
+    assert out.tolist() == [[2.0, 3.0], [4.0]]
+    assert (array + lazy).evaluate().tolist() == [[2.0, 4.0], [6.0]]
+
+
+def test_numexpr():
+    pytest.importorskip("numexpr")
+    px = ak.Array([[1.0, 2.0, 3.0], [], [4.0, 5.0]])
+    py = ak.Array([[0.5, 1.5, 2.5], [], [3.5, 4.5]])
+    lazy_px, lazy_py = ak.lazy_expr(px, py)
+    result = np.sqrt(lazy_px ** 2 + lazy_py ** 2).evaluate()
+    expected = np.sqrt(px ** 2 + py ** 2)
+    assert ak.all(abs(result - expected) < 1e-12)
+
+
+def test_numexpr_special_constants():
+    pytest.importorskip("numexpr")
+    px = ak.Array([[1.0, -2.0], [], [3.0]])
+    lazy = ak.lazy_expr(px)
+    assert (lazy + np.inf).evaluate().tolist() == [[np.inf, np.inf], [], [np.inf]]
+    assert (lazy * -np.inf).evaluate().tolist() == [[-np.inf, np.inf], [], [-np.inf]]
+    result = (lazy + np.nan).evaluate()
+    assert ak.to_list(ak.num(result)) == [2, 0, 1]
+    assert np.isnan(ak.flatten(result)).tolist() == [True, True, True]
@@ -0,0 +1,72 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+
+@numba.njit
+def total(array):
+    out = 0.0
+    for x in array:
+        for y in x:
+            out += y
+    return out
+
+
+def test_array_is_typed_once():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    assert total(array) == pytest.approx(16.5)
+    view = array._numbaview
+    numba_type = array.numba_type
+    assert total(array) == pytest.approx(16.5)
+    assert array._numbaview is view
+    assert array.numba_type is numba_type
+
+
+def test_layout_assignment():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    assert total(array) == pytest.approx(16.5)
+    view = array._numbaview
+
+    array.layout = ak.Array([[1.0], [2.0, 3.0]]).layout
+    assert array._numbaview is None
+    assert total(array) == pytest.approx(6.0)
+    assert array._numbaview is not view
+
+    array = ak.Array([{"x": [1.0, 2.0]}, {"x": [3.0]}])
+    assert total(array.x) == pytest.approx(6.0)
+    array["y"] = [[10.0], [20.0]]
+    assert array._numbaview is None
+    assert total(array.y) == pytest.approx(30.0)
+
+
+def test_behavior_assignment():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    before = array.numba_type
+    array.behavior = {"something": "else"}
+    after = array.numba_type
+    assert after.behavior is array.behavior
+    assert after != before
+
+    array.behavior["more"] = "keys"
+    assert array.numba_type.name != after.name
+
+    # the repr is not recomputed when a value is replaced in place
+    replaced = array.numba_type
+    array.behavior["more"] = "values"
+    assert array.numba_type is replaced
+    array.behavior = dict(array.behavior)
+    assert array.numba_type.name != replaced.name
+
+
+def test_record():
+    record = ak.Record({"x": 1, "y": [1.1, 2.2]})
+    numba_type = record.numba_type
+    assert record.numba_type is numba_type
+    record.behavior = {"something": "else"}
+    assert record.numba_type is not numba_type
@@ -0,0 +1,147 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+form = """{
+    "class": "ListOffsetArray64",
+    "offsets": "i64",
+    "content": {
+        "class": "RecordArray",
+        "contents": {
+            "x": "float64",
+            "y": {"class": "ListArray32", "starts": "i32", "stops": "i32", "content": "int64"}
+        }
+    }
+}"""
+
+events = [[(1.1, [1]), (2.2, [])], [], [(3.3, [3, 4, 5])]]
+
+
+def fill(root, events):
+    for event in events:
+        root.begin_list()
+        for x, y in event:
+            root.content.begin_record()
+            root.content.x.real(x)
+            for yi in y:
+                root.content.y.content.integer(yi)
+            root.content.y.end_list()
+            root.content.end_record()
+        root.end_list()
+
+
+def test_lists_of_records():
+    builder = ak.TypedArrayBuilder(form, initial=1)
+    assert len(builder) == 0
+    assert builder.snapshot().tolist() == []
+
+    fill(builder.root, events)
+    first = builder.snapshot()
+    assert len(builder) == 3
+    assert first.tolist() == [
+        [{"x": 1.1, "y": [1]}, {"x": 2.2, "y": []}],
+        [],
+        [{"x": 3.3, "y": [3, 4, 5]}],
+    ]
+    assert str(ak.type(first)) == '3 * var * {"x": float64, "y": var * int64}'
+    assert isinstance(first.layout.content.field("y"), ak.layout.ListOffsetArray64)
+
+    # buffers grow (from one item) without changing earlier snapshots
+    fill(builder.root, events * 10)
+    assert len(builder) == 33
+    assert builder.snapshot().tolist()[3:6] == first.tolist()
+    assert builder.snapshot().tolist()[-3:] == first.tolist()
+    assert first.tolist()[-1] == [{"x": 3.3, "y": [3, 4, 5]}]
+
+
+def test_options_tuples_and_dtypes():
+    builder = ak.TypedArrayBuilder(ak.Array([None, 1.5]).layout.form)
+    builder.root.null()
+    builder.root.valid()
+    builder.root.content.real(2.5)
+    builder.root.valid()
+    builder.root.content.integer(3)
+    assert builder.snapshot().tolist() == [None, 2.5, 3.0]
+
+    builder = ak.TypedArrayBuilder(ak.Array([(1, True)]).layout.form)
+    for i in range(3):
+        builder.root.begin_record()
+        builder.root.slot0.integer(i)
+        builder.root.slot1.boolean(i % 2 == 0)
+        builder.root.end_record()
+    assert builder.snapshot().tolist() == [(0, True), (1, False), (2, True)]
+
+    builder = ak.TypedArrayBuilder(ak.forms.Form.fromjson('"uint8"'), initial=2)
+    for i in range(5):
+        builder.root.append(i)
+    result = builder.snapshot(highlevel=False)
+    assert np.asarray(result).dtype == np.uint8
+    assert np.asarray(result).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_parameters_and_behavior():
+    class Point(ak.Record):
+        def norm(self):
+            return self.x
+
+    builder = ak.TypedArrayBuilder(
+        {
+            "class": "RecordArray",
+            "contents": {"x": "float64"},
+            "parameters": {"__record__": "Point"},
+        },
+        behavior={"Point": Point},
+    )
+    builder.root.begin_record()
+    builder.root.x.real(1.5)
+    builder.root.end_record()
+    assert builder.snapshot()[0].norm() == 1.5
+
+    strings = ak.TypedArrayBuilder(ak.Array(["one", "two"]).layout.form)
+    for word in ["hello", "there"]:
+        strings.root.begin_list()
+        for char in word.encode():
+            strings.root.content.append(char)
+        strings.root.end_list()
+    assert strings.snapshot().tolist() == ["hello", "there"]
+
+
+def test_unsupported():
+    with pytest.raises(TypeError):
+        ak.TypedArrayBuilder(ak.Array([[1, 2], [3, 4]]).layout.toRegularArray().form)
+    with pytest.raises(TypeError):
+        ak.TypedArrayBuilder(ak.Array([1, [2]]).layout.form)
+    with pytest.raises(ValueError):
+        ak.TypedArrayBuilder(ak.Array([{"length": 1}]).layout.form)
+    with pytest.raises(ValueError):
+        ak.TypedArrayBuilder('"float64"', resize=1)
+
+
+def test_numba():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def fill_from(root, events):
+        for event in events:
+            root.begin_list()
+            for particle in event:
+                root.content.begin_record()
+                root.content.x.real(particle.x)
+                for yi in particle.y:
+                    root.content.y.content.integer(yi)
+                root.content.y.end_list()
+                root.content.end_record()
+            root.end_list()
+
+    expected = [
+        [{"x": 1.1, "y": [1]}, {"x": 2.2, "y": []}],
+        [],
+        [{"x": 3.3, "y": [3, 4, 5]}],
+    ]
+    builder = ak.TypedArrayBuilder(form, initial=1)
+    fill_from(builder.root, ak.Array(expected * 100))
+    assert builder.snapshot().tolist() == expected * 100
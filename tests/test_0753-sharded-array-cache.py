@@ -0,0 +1,100 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_shards():
+    assert ak.layout.LRUArrayCache(2000).num_shards == 16
+    assert ak.layout.LRUArrayCache(2000, num_shards=0).num_shards == 1
+
+    cache = ak.layout.LRUArrayCache(2000, num_shards=4)
+    assert cache.num_shards == 4
+    assert 'num_shards="4"' in repr(cache)
+
+    cache["one"] = ak.layout.NumpyArray(np.arange(100, dtype=np.int64))
+    cache["two"] = ak.layout.NumpyArray(np.arange(100, dtype=np.float64))
+    assert ak.to_list(cache["one"]) == list(range(100))
+    cache["three"] = ak.layout.NumpyArray(np.arange(100, dtype=np.uint64))
+    assert cache.keys() == ["three", "one"]
+    assert "two" not in cache
+    assert cache.evictions == 1
+
+
+def test_budget_across_shards():
+    cache = ak.layout.LRUArrayCache(8000, num_shards=8)
+    arrays = [ak.layout.NumpyArray(np.full(100, i)) for i in range(64)]
+    for i, array in enumerate(arrays):
+        cache[str(i)] = array
+        if i >= 3:
+            cache["3"]
+
+    assert cache.nbytes == 8000 and len(cache) == 10
+    assert cache.keys() == ["3"] + [str(i) for i in range(63, 54, -1)]
+    assert cache.evictions == 54
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0 and cache.keys() == []
+
+
+def test_shared_by_threads():
+    counter = [0]
+    lock = threading.Lock()
+
+    def generate(i):
+        with lock:
+            counter[0] += 1
+        return ak.Array(np.full(100, i, np.float64))
+
+    cache = ak.layout.LRUArrayCache(1000000)
+    arrays = [
+        ak.virtual(generate, (i,), length=100, form='"float64"', cache=cache)
+        for i in range(50)
+    ]
+    for array in arrays:
+        assert array[0] == array[99]
+
+    errors = []
+
+    def work(j):
+        try:
+            for k in range(20):
+                i = (j * 7 + k) % 50
+                assert ak.sum(arrays[i]) == 100 * i
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=work, args=(j,)) for j in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert counter[0] == 50
+    assert len(cache) == 50
+    assert cache.misses == 50 and cache.hits >= 4 * 20
+
+
+def test_hits_are_not_set_again():
+    class Recorder(dict):
+        def __init__(self):
+            self.sets = 0
+
+        def __setitem__(self, key, value):
+            self.sets += 1
+            dict.__setitem__(self, key, value)
+
+    recorder = Recorder()
+    array = ak.virtual(
+        lambda: ak.Array([1, 2, 3]), length=3, form='"int64"', cache=recorder
+    )
+    assert array.tolist() == [1, 2, 3]
+    assert array.tolist() == [1, 2, 3]
+    assert ak.to_list(array.layout.array) == [1, 2, 3]
+    assert recorder.sets == 1
@@ -0,0 +1,64 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def row_group_sizes(filename):
+    metadata = pyarrow_parquet.ParquetFile(filename).metadata
+    return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+
+def test_partitions(tmp_path):
+    array = ak.repartition(
+        ak.Array([{"x": i, "y": [i] * (i % 3)} for i in range(10)]), 4
+    )
+    ak.to_parquet(array, tmp_path / "default.parquet")
+    assert row_group_sizes(tmp_path / "default.parquet") == [4, 4, 2]
+    assert ak.from_parquet(tmp_path / "default.parquet").tolist() == array.tolist()
+
+
+def test_rows(tmp_path):
+    array = ak.repartition(
+        ak.Array([{"x": i, "y": [i] * (i % 3)} for i in range(10)]), 4
+    )
+    ak.to_parquet(array, tmp_path / "rows.parquet", row_group_size=3)
+    assert row_group_sizes(tmp_path / "rows.parquet") == [3, 3, 3, 1]
+    assert ak.from_parquet(tmp_path / "rows.parquet").tolist() == array.tolist()
+
+    ak.to_parquet(array, tmp_path / "one.parquet", row_group_size=100)
+    assert row_group_sizes(tmp_path / "one.parquet") == [10]
+
+    with pytest.raises(ValueError):
+        ak.to_parquet(array, tmp_path / "zero.parquet", row_group_size=0)
+
+
+def test_bytes(tmp_path):
+    array = ak.Array(np.arange(1000, dtype=np.float64))
+    ak.to_parquet(array, tmp_path / "bytes.parquet", row_group_size="800B")
+    assert row_group_sizes(tmp_path / "bytes.parquet") == [100] * 10
+    assert ak.from_parquet(tmp_path / "bytes.parquet").tolist() == array.tolist()
+
+    with pytest.raises(ValueError):
+        ak.to_parquet(array, tmp_path / "bad.parquet", row_group_size="lots")
+
+
+def test_errors_in_conversion(tmp_path):
+    def generate():
+        raise ZeroDivisionError
+
+    array = ak.partitioned(
+        [
+            ak.Array([1, 2, 3]),
+            ak.virtual(generate, length=3, form='"int64"'),
+        ]
+    )
+    with pytest.raises(ZeroDivisionError):
+        ak.to_parquet(array, tmp_path / "error.parquet")
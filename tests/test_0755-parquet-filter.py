@@ -0,0 +1,107 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pyarrow = pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+
+
+def sorted_array():
+    # row groups of 10 with pt in [0, 10), [10, 20), ..., [90, 100)
+    return ak.Array(
+        [
+            {"pt": float(i), "n": None if i < 10 else i, "jets": [{"eta": i}] * (i % 3)}
+            for i in range(100)
+        ]
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_filter(tmp_path, lazy):
+    array = sorted_array()
+    filename = os.path.join(str(tmp_path), "sorted.parquet")
+    ak.to_parquet(array, filename, row_group_size=10)
+
+    out = ak.from_parquet(filename, filter=("pt", ">=", 75), lazy=lazy)
+    assert out.pt.tolist() == list(range(70, 100))
+    assert out.tolist() == array[70:].tolist()
+
+    out = ak.from_parquet(
+        filename, filter=[("pt", ">", 15), ("pt", "<", 25)], lazy=lazy
+    )
+    assert out.pt.tolist() == list(range(10, 30))
+
+    out = ak.from_parquet(
+        filename, filter=[[("pt", "<", 5)], [("pt", "in", [55, 95])]], lazy=lazy
+    )
+    assert out.pt.tolist() == list(range(10)) + list(range(50, 60)) + list(
+        range(90, 100)
+    )
+
+    out = ak.from_parquet(filename, filter=("jets.eta", "==", 42), lazy=lazy)
+    assert out.pt.tolist() == list(range(40, 50))
+
+    out = ak.from_parquet(filename, filter=("n", "==", None), lazy=lazy)
+    assert out.pt.tolist() == list(range(10))
+
+    out = ak.from_parquet(filename, filter=("pt", ">", 1000), lazy=lazy)
+    assert len(out) == 0
+
+    out = ak.from_parquet(
+        filename, row_groups=[3, 1], filter=("pt", "<", 20), lazy=lazy
+    )
+    assert out.pt.tolist() == list(range(10, 20))
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_row_groups_order(tmp_path, lazy):
+    array = sorted_array()
+    filename = os.path.join(str(tmp_path), "sorted.parquet")
+    ak.to_parquet(array, filename, row_group_size=50)
+
+    out = ak.from_parquet(filename, row_groups=[1, 0], lazy=lazy)
+    assert out.pt.tolist() == list(range(50, 100)) + list(range(50))
+    out = ak.from_parquet(filename, row_groups=[0, 0], lazy=lazy)
+    assert out.pt.tolist() == list(range(50)) * 2
+
+
+def test_errors(tmp_path):
+    filename = os.path.join(str(tmp_path), "sorted.parquet")
+    ak.to_parquet(sorted_array(), filename, row_group_size=10)
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("nope", ">", 1))
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("pt", "~", 1))
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("pt", "<", None))
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, row_groups=[10])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_partitions(tmp_path, lazy):
+    for year in (2019, 2020, 2021):
+        os.mkdir(os.path.join(str(tmp_path), "year={0}".format(year)))
+        ak.to_parquet(
+            ak.Array([{"x": year * 10 + i} for i in range(3)]),
+            os.path.join(str(tmp_path), "year={0}".format(year), "part.parquet"),
+        )
+
+    out = ak.from_parquet(str(tmp_path), filter=("year", ">=", 2020), lazy=lazy)
+    assert out.tolist() == [
+        {"year": str(year), "x": year * 10 + i}
+        for year in (2020, 2021)
+        for i in range(3)
+    ]
+
+    ak.to_parquet.dataset(str(tmp_path))
+    out = ak.from_parquet(str(tmp_path), filter=("year", "==", "2019"), lazy=lazy)
+    assert out.tolist() == [{"year": "2019", "x": 20190 + i} for i in range(3)]
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def elementwise(array):
+    return [ak.to_list(x) for x in array]
+
+
+def test_nested():
+    array = ak.Array(
+        [
+            [{"x": 1.1, "y": [1], "z": "one"}, {"x": 2.2, "y": [], "z": None}],
+            [],
+            None,
+            [{"x": None, "y": [3, None], "z": "thréé"}],
+        ]
+    )
+    assert ak.to_list(array) == elementwise(array)
+    assert ak.to_list(array[1:]) == elementwise(array[1:])
+    assert ak.to_list(array[[3, 0, 3]]) == elementwise(array[[3, 0, 3]])
+    assert ak.to_list(array.x) == [[1.1, 2.2], [], None, [None]]
+    assert ak.to_list(array.z) == [["one", None], [], None, ["thréé"]]
+
+
+def test_types():
+    assert ak.to_list(ak.Array([(1, [2.2]), (3, [])])) == [(1, [2.2]), (3, [])]
+    assert ak.to_list(ak.Array([b"one", b"", b"three"])) == [b"one", b"", b"three"]
+    assert ak.to_list(ak.Array(["one", "", "three"])) == ["one", "", "three"]
+    assert ak.to_list(ak.Array([1, "two", [3]])) == [1, "two", [3]]
+    assert ak.to_list(ak.Array(np.arange(6).reshape(2, 3))) == [[0, 1, 2], [3, 4, 5]]
+    regular = ak.from_numpy(np.arange(6).reshape(3, 2, 1), regulararray=True)
+    assert ak.to_list(regular) == [[[0], [1]], [[2], [3]], [[4], [5]]]
+    empty = ak.layout.RegularArray(ak.layout.NumpyArray(np.arange(0)), 0, 3)
+    assert ak.to_list(empty) == [[], [], []]
+    assert ak.to_list(ak.layout.EmptyArray()) == []
+    assert ak.to_list(ak.Array([{}, {}]).layout) == [{}, {}]
+
+    bitmasked = ak.layout.BitMaskedArray(
+        ak.layout.IndexU8(np.array([5], np.uint8)),
+        ak.layout.NumpyArray(np.arange(3)),
+        valid_when=True,
+        length=3,
+        lsb_order=True,
+    )
+    assert ak.to_list(bitmasked) == [0, None, 2]
+    unmasked = ak.layout.UnmaskedArray(ak.layout.NumpyArray(np.arange(3)))
+    assert ak.to_list(unmasked) == [0, 1, 2]
+
+    record = ak.layout.RecordArray([ak.layout.NumpyArray(np.arange(10))], ["x"], 3)
+    assert ak.to_list(record) == [{"x": 0}, {"x": 1}, {"x": 2}]
+
+
+def test_no_shared_items():
+    content = ak.Array([[1, 2], [3]]).layout
+    listarray = ak.layout.ListArray64(
+        ak.layout.Index64(np.array([0, 0])),
+        ak.layout.Index64(np.array([2, 2])),
+        ak.layout.RegularArray(ak.layout.NumpyArray(np.arange(4)), 2),
+    )
+    out = ak.to_list(listarray)
+    assert out == [[[0, 1], [2, 3]], [[0, 1], [2, 3]]]
+    assert out[0][0] is not out[1][0]
+
+    indexed = ak.layout.IndexedArray64(ak.layout.Index64(np.array([1, 1, 0])), content)
+    out = ak.to_list(indexed)
+    assert out == [[3], [3], [1, 2]]
+    out[0].append(4)
+    assert out[1] == [3]
+
+
+def test_lazy_and_partitioned():
+    array = ak.virtual(lambda: ak.Array([[1, 2], [3]]), length=2, form=None)
+    assert ak.to_list(array) == [[1, 2], [3]]
+    partitioned = ak.partitioned([ak.Array([1, 2]), ak.Array([3])])
+    assert ak.to_list(partitioned) == [1, 2, 3]
+    assert partitioned.tolist() == [1, 2, 3]
+
+    builder = ak.ArrayBuilder()
+    builder.append([1, 2])
+    assert ak.to_list(builder) == [[1, 2]]
+    assert ak.to_list(builder._layout) == [[1, 2]]
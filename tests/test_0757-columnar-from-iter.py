@@ -0,0 +1,78 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def builder(data):
+    out = ak.layout.ArrayBuilder()
+    for x in data:
+        out.fromiter(x)
+    return out.snapshot()
+
+
+def check(data, columnar=True):
+    layout = ak.from_iter(data, highlevel=False)
+    expected = builder(data)
+    assert layout.form == expected.form
+    assert ak.to_list(layout) == ak.to_list(expected)
+    assert (
+        ak.operations.convert._from_iter_columnar(data, None, 1024, 1.5) is not None
+    ) == columnar
+
+
+def test_homogeneous():
+    check([[1.1 * i] * (i % 4) for i in range(100)])
+    check([{"x": i, "y": 1.1 * i, "z": i % 2 == 0} for i in range(100)])
+    check([{"x": [i] * (i % 3), "s": str(i), "b": b"x" * i} for i in range(100)])
+    check([(i, [{"a": "é" * (i % 3)}]) for i in range(100)])
+    check([None if i % 10 == 5 else {"x": i} for i in range(100)])
+    check([np.float32(i) for i in range(100)])
+
+
+def test_mismatches():
+    check([1] * 100 + [1.5], columnar=False)
+    check([1.5] * 100 + [1], columnar=True)
+    check([1] * 100 + [True], columnar=False)
+    check([[1]] * 100 + [None], columnar=False)
+    check([{"x": 1}] * 100 + [{"x": 1, "y": 2}], columnar=False)
+    check([{"x": 1}] * 100 + [{"y": 2}], columnar=False)
+    check([[]] * 100 + [[1]], columnar=False)
+    check([[1, 2]] * 100 + [(1, 2)], columnar=False)
+    check(["one"] * 100 + [b"one"], columnar=False)
+
+
+def test_form():
+    form = ak.forms.Form.fromjson(
+        """{"class": "RecordArray", "contents": {
+            "x": {"class": "RegularArray", "size": 2, "content": "int32"},
+            "y": {"class": "ListOffsetArray32", "offsets": "i32", "content": "float32"},
+            "z": {"class": "IndexedOptionArray64", "index": "i64",
+                  "content": {"class": "ListArray64", "starts": "i64",
+                              "stops": "i64", "content": "bool"}}}}"""
+    )
+    data = [
+        {"x": [i, -i], "y": [0.5] * i, "z": None if i == 1 else [True]}
+        for i in range(3)
+    ]
+    layout = ak.from_iter(data, form=form, highlevel=False)
+    assert layout.form == form
+    assert ak.to_list(layout) == data
+
+    assert ak.from_iter(iter(data), form=form.tojson()).layout.form == form
+
+    # values that do not fit the form are converted by an ArrayBuilder
+    data[0]["x"] = [1, 2, 3]
+    layout = ak.from_iter(data, form=form, highlevel=False)
+    assert layout.form != form
+    assert ak.to_list(layout) == data
+
+    data[0]["x"] = [2 ** 40, 0]
+    assert ak.from_iter(data, form=form, highlevel=False).form != form
+
+    record = ak.from_iter({"x": [1, 2], "y": [], "z": None}, form=form)
+    assert isinstance(record, ak.Record)
+    assert record.tolist() == {"x": [1, 2], "y": [], "z": None}
@@ -0,0 +1,129 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+class Counter(object):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+
+
+def test_cache_self():
+    generate = Counter()
+    array = ak.virtual(generate, length=3, cache="self")
+    assert isinstance(array.layout.cache, ak.layout.LRUArrayCache)
+    assert array.tolist() == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+    assert array[2].tolist() == [4.4, 5.5]
+    assert array[1:].tolist() == [[], [4.4, 5.5]]
+    assert generate.calls == 1
+
+    other = ak.virtual(generate, length=3, cache="self")
+    assert other.layout.cache is not array.layout.cache
+    assert other.tolist() == array.tolist()
+    assert generate.calls == 2
+
+
+def test_uncached_regenerates():
+    generate = Counter()
+    array = ak.virtual(generate, length=3, cache=None)
+    array.tolist()
+    array.tolist()
+    assert generate.calls == 2
+
+
+@pytest.mark.parametrize("cache", [None, "new", "self", "lru:1MB"])
+def test_concurrent_generation(cache):
+    generate = Counter(delay=0.2)
+    array = ak.virtual(generate, length=3, cache=cache)
+
+    results = []
+
+    def materialize():
+        results.append(ak.to_list(array.layout.array))
+
+    threads = [threading.Thread(target=materialize) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [[[1.1, 2.2, 3.3], [], [4.4, 5.5]]] * 4
+    assert generate.calls == 1
+
+
+def test_concurrent_errors():
+    calls = []
+
+    def generate():
+        calls.append(None)
+        time.sleep(0.1)
+        raise ZeroDivisionError
+
+    layout = ak.virtual(generate, length=3, cache="self", highlevel=False)
+    errors = []
+
+    def materialize():
+        try:
+            layout.array
+        except ZeroDivisionError:
+            errors.append(None)
+
+    threads = [threading.Thread(target=materialize) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert 1 <= len(calls) <= 3
+
+
+def test_reentrant_generator():
+    def generate():
+        return ak.Array([1, 2, 3])
+
+    inner = ak.virtual(generate, length=3, cache=None, highlevel=False)
+    outer = ak.virtual(
+        lambda: ak.Array(inner.array) * 10, length=3, cache=None, highlevel=False
+    )
+    assert ak.to_list(outer.array) == [10, 20, 30]
+
+
+def test_uncached_with_same_key():
+    def generate(value):
+        time.sleep(0.2)
+        return ak.Array([value] * 3)
+
+    arrays = [
+        ak.virtual(
+            generate, (value,), length=3, form="int64", cache=None, cache_key="col"
+        )
+        for value in (1, 2)
+    ]
+    results = {}
+
+    def materialize(i):
+        results[i] = ak.to_list(arrays[i])
+
+    threads = [threading.Thread(target=materialize, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {0: [1, 1, 1], 1: [2, 2, 2]}
@@ -0,0 +1,113 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+class Generator(object):
+    def __init__(self):
+        self.threads = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, name, i):
+        with self.lock:
+            self.threads[name, i] = threading.current_thread()
+        return ak.Array(np.arange(10) + 100 * i)
+
+
+def lazy_partitions(generate, cache):
+    return ak.partitioned(
+        [
+            ak.zip(
+                {
+                    name: ak.virtual(
+                        generate, (name, i), length=10, form='"int64"', cache=cache
+                    )
+                    for name in ("x", "y")
+                },
+                depth_limit=1,
+            )
+            for i in range(5)
+        ]
+    )
+
+
+@pytest.mark.parametrize("cache", [None, "new", "lru:1MB"])
+def test_prefetch(cache):
+    generate = Generator()
+    array = lazy_partitions(generate, cache)
+
+    out = []
+    for i, partition in enumerate(ak.iter_partitions(array, prefetch=2)):
+        # this partition has been read and the next ones are being read
+        assert set(generate.threads) >= set([("x", i), ("y", i)])
+        out.append(ak.to_list(partition.x + partition.y))
+    assert out == [ak.to_list(2 * (np.arange(10) + 100 * i)) for i in range(5)]
+
+    main = threading.current_thread()
+    assert len(generate.threads) == 10
+    assert all(thread is not main for thread in generate.threads.values())
+
+
+def test_columns():
+    generate = Generator()
+    array = lazy_partitions(generate, None)
+    partitions = list(ak.iter_partitions(array, columns=["x"], highlevel=False))
+    assert len(partitions) == 5
+    assert set(generate.threads) == set(("x", i) for i in range(5))
+
+    main = threading.current_thread()
+    assert ak.to_list(ak.Array(partitions[3]).x) == list(range(300, 310))
+    assert generate.threads["x", 3] is not main
+    assert ak.to_list(ak.Array(partitions[3]).y) == list(range(300, 310))
+    assert generate.threads["y", 3] is main
+
+
+def test_nested_columns():
+    generate = Generator()
+    inner = lazy_partitions(generate, None)
+    array = ak.zip({"inner": inner, "z": ak.repartition(np.arange(50), 10)})
+    for partition in ak.iter_partitions(array, columns="inner.y", prefetch=1):
+        pass
+    assert set(generate.threads) == set(("y", i) for i in range(5))
+
+
+def test_prefetch_zero_and_unpartitioned():
+    generate = Generator()
+    array = lazy_partitions(generate, None)
+    assert len(list(ak.iter_partitions(array, prefetch=0))) == 5
+    assert generate.threads == {}
+
+    assert [ak.to_list(x) for x in ak.iter_partitions(ak.Array([1, 2, 3]))] == [
+        [1, 2, 3]
+    ]
+    with pytest.raises(ValueError):
+        list(ak.iter_partitions(array, prefetch=-1))
+
+
+def test_max_bytes():
+    generate = Generator()
+    array = lazy_partitions(generate, None)
+    iterator = ak.iter_partitions(array, prefetch=4, max_bytes="1B")
+    next(iterator)
+    # only one partition is read ahead when it alone exceeds the budget
+    assert set(key[1] for key in generate.threads) == set([0, 1])
+    assert len(list(iterator)) == 4
+
+
+def test_errors():
+    def generate():
+        raise ZeroDivisionError
+
+    array = ak.partitioned(
+        [ak.Array([1, 2, 3]), ak.virtual(generate, length=3, form='"int64"')]
+    )
+    first, second = ak.iter_partitions(array)
+    assert ak.to_list(first) == [1, 2, 3]
+    with pytest.raises(ZeroDivisionError):
+        ak.to_list(second)
@@ -0,0 +1,95 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+class Container(dict):
+    def __init__(self, *args):
+        super(Container, self).__init__(*args)
+        self.accessed = set()
+
+    def __getitem__(self, key):
+        self.accessed.add(key)
+        return super(Container, self).__getitem__(key)
+
+
+def lazy_array():
+    array = ak.Array(
+        [
+            {"x": [1, 2], "y": {"a": 1.5, "b": [None, "hi"]}, "z": 3},
+            {"x": [], "y": {"a": 2.5, "b": []}, "z": 4},
+            {"x": [3], "y": {"a": 3.5, "b": ["there"]}, "z": 5},
+        ]
+    )
+    form, length, container = ak.to_buffers(ak.repartition(array, 2))
+    container = Container(container)
+    return ak.from_buffers(form, length, container, lazy=True), container, form
+
+
+def analysis(array):
+    return ak.sum(array.x) + ak.num(array.y.b, axis=1)
+
+
+def test_track():
+    lazy, container, form = lazy_array()
+    tracked, report = ak.track_access(lazy)
+    assert ak.to_list(analysis(tracked)) == [8, 6, 7]
+    assert report.columns == ["x", "y"]
+    assert report.paths == [(), ("x",), ("y",), ("y", "b")]
+
+    # y.a and z are never read
+    for key in (form.content("y").content("a").form_key, form.content("z").form_key):
+        assert not any("-{0}-".format(key) in x for x in container.accessed)
+
+
+def test_dry_run():
+    lazy, container, form = lazy_array()
+    tracked, report = ak.track_access(lazy, dry_run=True)
+    analysis(tracked)
+    assert container.accessed == set()
+    assert report.columns == ["x", "y"]
+    assert report.paths == [(), ("x",), ("y",), ("y", "b")]
+
+    real, real_report = ak.track_access(lazy)
+    analysis(real)
+    assert real_report.form_keys == report.form_keys
+
+
+def test_virtual_fields():
+    def generate(name):
+        generated.append(name)
+        return ak.Array([[1.1, 2.2], [], [3.3]])
+
+    generated = []
+    form = ak.forms.Form.fromjson(
+        '{"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"}'
+    )
+    array = ak.zip(
+        {
+            name: ak.virtual(generate, (name,), length=3, form=form)
+            for name in ("pt", "eta", "phi")
+        },
+        depth_limit=1,
+    )
+    tracked, report = ak.track_access(array, dry_run=True)
+    assert ak.to_list(ak.num(tracked.pt * tracked.eta)) == [0, 0, 0]
+    assert generated == []
+    assert report.columns == ["pt", "eta"]
+
+    tracked, report = ak.track_access(array, highlevel=False)
+    assert isinstance(tracked, ak.layout.RecordArray)
+    ak.to_list(tracked["phi"])
+    ak.to_list(tracked["phi"])
+    assert generated == ["phi"]
+    assert report.columns == ["phi"]
+
+
+def test_dry_run_needs_forms():
+    array = ak.virtual(lambda: ak.Array([1, 2, 3]), length=3)
+    tracked, report = ak.track_access(array, dry_run=True)
+    with pytest.raises(ValueError):
+        ak.to_list(tracked)